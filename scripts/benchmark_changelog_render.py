@@ -0,0 +1,115 @@
+# ruff: noqa: T201, allow print statements in non-prod scripts
+"""
+Compare how long the default changelog template takes to render in the sandboxed
+and the plain template environments, for a synthetic history.
+
+Usage: python scripts/benchmark_changelog_render.py [--commits N] [--releases N]
+"""
+
+from __future__ import annotations
+
+import hashlib
+from argparse import ArgumentParser
+from datetime import datetime, timezone
+from pathlib import Path
+from timeit import repeat
+
+from git import Actor
+
+from semantic_release.changelog.context import make_changelog_context
+from semantic_release.changelog.release_history import Release, ReleaseHistory
+from semantic_release.changelog.template import environment
+from semantic_release.commit_parser import ParsedCommit
+from semantic_release.enums import LevelBump
+from semantic_release.gitlog import CommitRecord
+from semantic_release.hvcs import Github
+from semantic_release.version.version import Version
+
+PROJ_DIR = Path(__file__).resolve().parent.parent
+CHANGELOG_TEMPLATE = (
+    PROJ_DIR / "semantic_release" / "data" / "templates" / "CHANGELOG.md.j2"
+)
+
+COMMIT_TYPES = (("feature", LevelBump.MINOR), ("fix", LevelBump.PATCH))
+
+
+def synthetic_history(num_commits: int, num_releases: int) -> ReleaseHistory:
+    author = Actor("Benchmark", "benchmark@example.com")
+    commits_per_release = max(num_commits // num_releases, 1)
+    released: dict[Version, Release] = {}
+
+    for release_num in range(num_releases, 0, -1):
+        version = Version.parse(f"{release_num}.0.0")
+        elements: dict[str, list[ParsedCommit]] = {}
+        for commit_num in range(commits_per_release):
+            type_, bump = COMMIT_TYPES[commit_num % len(COMMIT_TYPES)]
+            message = f"{type_}: change number {commit_num} of {version}"
+            commit = CommitRecord(
+                repo=None,  # type: ignore[arg-type]
+                hexsha=hashlib.sha1(message.encode("utf-8")).hexdigest(),  # noqa: S324
+                parent_shas=(),
+                author=author,
+                authored_date=0,
+                author_tz_offset=0,
+                committer=author,
+                committed_date=0,
+                committer_tz_offset=0,
+                message=message,
+            )
+            elements.setdefault(type_, []).append(
+                ParsedCommit(
+                    bump=bump,
+                    type=type_,
+                    scope="",
+                    descriptions=[message],
+                    breaking_descriptions=[],
+                    commit=commit,  # type: ignore[arg-type]
+                )
+            )
+        released[version] = Release(
+            tagger=author,
+            committer=author,
+            tagged_date=datetime(2024, 1, 1, tzinfo=timezone.utc),
+            elements=elements,  # type: ignore[typeddict-item]
+            version=version,
+        )
+
+    return ReleaseHistory(unreleased={}, released=released)
+
+
+def main() -> None:
+    parser = ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--commits", type=int, default=20_000)
+    parser.add_argument("--releases", type=int, default=200)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    history = synthetic_history(args.commits, args.releases)
+    template_source = CHANGELOG_TEMPLATE.read_text(encoding="utf-8")
+    print(f"Rendering {args.commits} commits in {args.releases} releases")
+
+    results: dict[bool, float] = {}
+    rendered: dict[bool, str] = {}
+    for sandboxed in (True, False):
+        env = environment(template_dir=PROJ_DIR, sandboxed=sandboxed)
+        make_changelog_context(
+            hvcs_client=Github("https://github.com/example/repo.git"),
+            release_history=history,
+        ).bind_to_environment(env)
+        template = env.from_string(template_source)
+        rendered[sandboxed] = template.render()
+
+        results[sandboxed] = min(repeat(template.render, number=1, repeat=args.repeat))
+        print(
+            f"{'sandboxed' if sandboxed else 'plain':>10}: "
+            f"{results[sandboxed] * 1000:8.1f} ms"
+        )
+
+    if rendered[True] != rendered[False]:
+        raise RuntimeError("the environments rendered different changelogs")
+
+    print(f"{'speedup':>10}: {results[True] / results[False]:8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
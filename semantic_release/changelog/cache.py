@@ -0,0 +1,188 @@
+"""
+Persistent cache of the rendered sections of the default changelog.
+
+The section of a release only depends upon the release itself, the template, the
+settings of the template environment and the context filters, so sections are
+stored in one file per template, environment & filters combination and looked up
+by a hash of the release. Only the releases which have changed since the last run
+(usually just the newest one) need to be rendered again.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import inspect
+import json
+import logging
+from dataclasses import replace
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from semantic_release.changelog.release_history import ReleaseHistory
+from semantic_release.changelog.template import environment_fingerprint
+from semantic_release.helpers import JsonCacheFile, cache_key
+
+if TYPE_CHECKING:
+    from typing import Callable
+
+    from jinja2 import Environment, Template
+
+    from semantic_release.changelog.context import ChangelogContext
+    from semantic_release.changelog.release_history import Release
+    from semantic_release.commit_parser.token import ParseResult
+
+log = logging.getLogger(__name__)
+
+# Bump this whenever the structure of the stored sections changes
+CACHE_FORMAT_VERSION = 2
+
+
+def _sha256(data: Any) -> str:
+    return hashlib.sha256(
+        json.dumps(data, sort_keys=True, default=str).encode("utf-8")
+    ).hexdigest()
+
+
+def _filter_fingerprint(filter_: Callable[..., Any]) -> list[str]:
+    # The filters are usually methods of the hvcs client, whose results depend
+    # upon the domain it's configured with
+    filter_ = inspect.unwrap(filter_)
+    owner = getattr(filter_, "__self__", None)
+    return [
+        filter_.__name__,
+        f"{getattr(filter_, '__module__', '')}.{getattr(filter_, '__qualname__', '')}",
+        str(getattr(owner, "hvcs_domain", "")),
+    ]
+
+
+def _result_fingerprint(result: ParseResult) -> dict[str, Any]:
+    fields = result._asdict() if hasattr(result, "_asdict") else {}
+    return {
+        **{name: value for name, value in fields.items() if name != "commit"},
+        "hexsha": result.hexsha,
+        "message": result.message,
+    }
+
+
+def release_fingerprint(release: Release) -> str:
+    """Hash everything about `release` which its changelog section can depend on"""
+    return _sha256(
+        {
+            "version": str(release["version"]),
+            "tagged_date": release["tagged_date"].isoformat(),
+            "tagger": [release["tagger"].name, release["tagger"].email],
+            "committer": [release["committer"].name, release["committer"].email],
+            "elements": {
+                type_: [_result_fingerprint(result) for result in results]
+                for type_, results in release["elements"].items()
+            },
+        }
+    )
+
+
+class ReleaseSectionCache:
+    """
+    Renders a changelog template one release at a time, reusing the sections
+    stored in ``cache_dir`` for releases which haven't changed.
+
+    This is only valid for templates which render a heading that doesn't depend on
+    the history, followed by a section for the unreleased changes and then a
+    section for each release, in order, such as the default changelog template.
+
+    New sections are held in memory until :py:meth:`save` is called.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Path | str,
+        template_source: str,
+        environment: Environment,
+        context: ChangelogContext,
+    ) -> None:
+        self.cache_dir = Path(cache_dir)
+        self.context = context
+        self.cache_key = cache_key(
+            CACHE_FORMAT_VERSION,
+            template_source,
+            environment_fingerprint(environment),
+            context.hvcs_type,
+            context.repo_owner,
+            context.repo_name,
+            sorted(_filter_fingerprint(f) for f in context.filters),
+        )
+        self._cache = JsonCacheFile(
+            self.cache_dir, self.cache_file, CACHE_FORMAT_VERSION, "changelog cache"
+        )
+
+    @property
+    def cache_file(self) -> Path:
+        return self.cache_dir / "changelog" / f"{self.cache_key}.json"
+
+    @property
+    def sections(self) -> dict[str, str]:
+        return self._cache.entries
+
+    def _render_with(
+        self, template: Template, environment: Environment, history: ReleaseHistory
+    ) -> str:
+        environment.globals["context"] = replace(self.context, history=history)
+        try:
+            return template.render()
+        finally:
+            environment.globals["context"] = self.context
+
+    def _render_section(
+        self,
+        template: Template,
+        environment: Environment,
+        heading: str,
+        history: ReleaseHistory,
+    ) -> str | None:
+        text = self._render_with(template, environment, history)
+        return text[len(heading) :] if text.startswith(heading) else None
+
+    def render(self, template: Template, environment: Environment) -> list[str] | None:
+        """
+        Render `template` with the history of the context as a list of sections,
+        which are to be concatenated. None is returned if the template doesn't
+        start with a heading which is the same for every section.
+        """
+        history = self.context.history
+        heading = self._render_with(template, environment, ReleaseHistory({}, {}))
+        parts = [heading]
+
+        if history.unreleased:
+            # Not cached, as the unreleased changes are different on every run
+            text = self._render_section(
+                template, environment, heading, ReleaseHistory(history.unreleased, {})
+            )
+            if text is None:
+                return None
+            parts.append(text)
+
+        rendered = 0
+        for version, release in history.released.items():
+            key = release_fingerprint(release)
+            if (text := self.sections.get(key)) is None:
+                text = self._render_section(
+                    template,
+                    environment,
+                    heading,
+                    ReleaseHistory({}, {version: release}),
+                )
+                if text is None:
+                    return None
+                self._cache.add(key, text)
+                rendered += 1
+            parts.append(text)
+
+        log.debug(
+            "rendered %s changelog sections, %s were cached",
+            rendered,
+            len(history.released) - rendered,
+        )
+        return parts
+
+    def save(self) -> None:
+        """Persist any sections which were not previously in the cache"""
+        self._cache.save()
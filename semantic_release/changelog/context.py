@@ -1,15 +1,24 @@
 from __future__ import annotations
 
+import re
+from collections import defaultdict
 from dataclasses import dataclass
+from functools import cached_property, update_wrapper
 from typing import TYPE_CHECKING, Any, Callable
 
+from semantic_release.commit_parser.token import ParsedCommit
+from semantic_release.enums import LevelBump
+
 if TYPE_CHECKING:
     from jinja2 import Environment
 
     from semantic_release.changelog.release_history import Release, ReleaseHistory
+    from semantic_release.commit_parser.token import ParseResult
     from semantic_release.hvcs._base import HvcsBase
     from semantic_release.version.version import Version
 
+_HEX_RE = re.compile(r"[0-9a-fA-F]+")
+
 
 @dataclass
 class ReleaseNotesContext:
@@ -34,6 +43,68 @@ class ReleaseNotesContext:
         return env
 
 
+class ReleaseIndex:
+    """
+    Precomputed views of the commits of a release, or of the unreleased changes,
+    so that templates can look commits up rather than sorting & filtering them.
+    """
+
+    def __init__(self, elements: dict[str, list[ParseResult]]) -> None:
+        # Sorted in the same order as the `dictsort` filter would
+        self.by_type: dict[str, list[ParseResult]] = dict(
+            sorted(elements.items(), key=lambda type_commits: type_commits[0].lower())
+        )
+        self.commit_count = sum(map(len, elements.values()))
+
+        by_scope: defaultdict[str, list[ParsedCommit]] = defaultdict(list)
+        self.breaking: list[ParsedCommit] = []
+        for commits in self.by_type.values():
+            for commit in commits:
+                if not isinstance(commit, ParsedCommit):
+                    continue
+                by_scope[commit.scope or ""].append(commit)
+                if commit.bump >= LevelBump.MAJOR:
+                    self.breaking.append(commit)
+
+        self.by_scope: dict[str, list[ParsedCommit]] = dict(sorted(by_scope.items()))
+
+
+class HistoryIndex:
+    """A :py:class:`ReleaseIndex` of the unreleased changes and of each release"""
+
+    def __init__(self, history: ReleaseHistory) -> None:
+        self.unreleased = ReleaseIndex(history.unreleased)
+        self.released = {
+            version: ReleaseIndex(release["elements"])
+            for version, release in history.released.items()
+        }
+
+
+def _with_url_prefix(url_filter: Callable[..., Any]) -> Callable[..., Any]:
+    """
+    Speed up a filter such as ``commit_hash_url``, which appends a commit hash to a
+    fixed url, by building that url once and concatenating each hash onto it.
+
+    The filter is returned as it is if it doesn't build its urls in this way.
+    """
+    first, second = "0" * 40, "f" * 40
+    try:
+        first_url, second_url = url_filter(first), url_filter(second)
+    except Exception:  # noqa: BLE001
+        return url_filter
+
+    prefix = first_url[: -len(first)]
+    if not first_url.endswith(first) or second_url != prefix + second:
+        return url_filter
+
+    def prefixed_url_filter(commit_hash: str) -> str:
+        if _HEX_RE.fullmatch(commit_hash):
+            return prefix + commit_hash
+        return url_filter(commit_hash)
+
+    return update_wrapper(prefixed_url_filter, url_filter)
+
+
 @dataclass
 class ChangelogContext:
     repo_name: str
@@ -42,6 +113,10 @@ class ChangelogContext:
     history: ReleaseHistory
     filters: tuple[Callable[..., Any], ...] = ()
 
+    @cached_property
+    def index(self) -> HistoryIndex:
+        return HistoryIndex(self.history)
+
     def bind_to_environment(self, env: Environment) -> Environment:
         env.globals["context"] = self
         for f in self.filters:
@@ -57,5 +132,8 @@ def make_changelog_context(
         repo_owner=hvcs_client.owner,
         history=release_history,
         hvcs_type=hvcs_client.__class__.__name__.lower(),
-        filters=(*hvcs_client.get_changelog_context_filters(),),
+        filters=tuple(
+            _with_url_prefix(f) if f.__name__ == "commit_hash_url" else f
+            for f in hvcs_client.get_changelog_context_filters()
+        ),
     )
@@ -1,18 +1,20 @@
 from __future__ import annotations
 
 import logging
+import re
 from collections import defaultdict
 from datetime import datetime, timedelta, timezone
-from typing import TYPE_CHECKING, TypedDict
+from typing import TYPE_CHECKING, Callable, Iterable, TypedDict
 
 from git.objects.tag import TagObject
 
 from semantic_release.commit_parser import ParseError
-from semantic_release.version.algorithm import tags_and_versions
+from semantic_release.gitlog import TagRecord
+from semantic_release.version.algorithm import HistorySnapshot
 
 if TYPE_CHECKING:
     from re import Pattern
-    from typing import Iterable, Iterator
+    from typing import Iterator
 
     from git.repo.base import Repo
     from git.util import Actor
@@ -27,6 +29,42 @@ if TYPE_CHECKING:
 
 log = logging.getLogger(__name__)
 
+# Patterns can't be combined if they contain backreferences or conditionals, which
+# refer to groups by position or name, or inline global flags, which would apply
+# to all of them
+_UNCOMBINABLE_RE = re.compile(r"\\[1-9]|\(\?P=|\(\?\(\d|\(\?[aiLmsux]+\)")
+
+
+def _compile_exclusion_patterns(
+    patterns: Iterable[Pattern[str]],
+) -> Callable[[str], bool]:
+    """
+    Create a function which tells whether a commit message matches any of
+    `patterns`. Where possible, the patterns are combined into a single regex
+    so that each message is only searched once.
+    """
+    patterns = tuple(patterns)
+    if not patterns:
+        return lambda _: False
+
+    flags = patterns[0].flags
+    if (
+        all(pat.flags == flags for pat in patterns)
+        and not flags & re.VERBOSE
+        and not any(_UNCOMBINABLE_RE.search(pat.pattern) for pat in patterns)
+    ):
+        try:
+            combined = re.compile(
+                str.join("|", (f"(?:{pat.pattern})" for pat in patterns)),
+                flags=flags,
+            )
+        except re.error as err:
+            log.debug("can't combine the exclusion patterns: %s", err)
+        else:
+            return lambda message: combined.match(message) is not None
+
+    return lambda message: any(pat.match(message) for pat in patterns)
+
 
 class ReleaseHistory:
     @classmethod
@@ -36,16 +74,22 @@ class ReleaseHistory:
         translator: VersionTranslator,
         commit_parser: CommitParser[ParseResult, ParserOptions],
         exclude_commit_patterns: Iterable[Pattern[str]] = (),
+        snapshot: HistorySnapshot | None = None,
+        since: str | None = None,
     ) -> ReleaseHistory:
-        all_git_tags_and_versions = tags_and_versions(repo.tags, translator)
+        """
+        Build the release history of the current branch. If `since` is given, only
+        the commits after that revision (e.g. the tag of a release which is already
+        in the changelog) are included.
+        """
+        snapshot = snapshot or HistorySnapshot(repo, translator, commit_parser)
         unreleased: dict[str, list[ParseResult]] = defaultdict(list)
         released: dict[Version, Release] = {}
 
         # Performance optimization: create a mapping of tag sha to version
         # so we can quickly look up the version for a given commit based on sha
         tag_sha_2_version_lookup = {
-            tag.commit.hexsha: (tag, version)
-            for tag, version in all_git_tags_and_versions
+            sha: (tag, version) for sha, tag, version in snapshot.tagged_commits
         }
 
         # Strategy:
@@ -61,16 +105,23 @@ class ReleaseHistory:
         is_commit_released = False
         the_version: Version | None = None
 
-        for commit in repo.iter_commits("HEAD", topo_order=True):
+        # Excluded commits are never parsed. The others are parsed up front, so that
+        # they can be parsed in parallel
+        is_excluded = _compile_exclusion_patterns(exclude_commit_patterns)
+        commits = [
             # mypy will be happy if we make this an explicit string
-            commit_message = str(commit.message)
-
-            parse_result = commit_parser.parse(commit)
-            commit_type = (
-                "unknown" if isinstance(parse_result, ParseError) else parse_result.type
+            (commit, is_excluded(str(commit.message)))
+            for commit in snapshot.iter_commits(
+                f"{since}..HEAD" if since else "HEAD", topo_order=True
             )
-            log.debug("commit has type %s", commit_type)
+        ]
+        parse_results = iter(
+            snapshot.parse_many(
+                [commit for commit, excluded in commits if not excluded]
+            )
+        )
 
+        for commit, excluded in commits:
             log.debug("checking if commit %s matches any tags", commit.hexsha)
             t_v = tag_sha_2_version_lookup.get(commit.hexsha, None)
 
@@ -84,9 +135,14 @@ class ReleaseHistory:
                 log.debug("found commit %s for tag %s", commit.hexsha, tag.name)
                 is_commit_released = True
 
-                # tag.object is a Commit if the tag is lightweight, otherwise
-                # it is a TagObject with additional metadata about the tag
-                if isinstance(tag.object, TagObject):
+                # The tag index has already read the metadata of most tags.
+                # Otherwise, tag.object is a Commit if the tag is lightweight,
+                # or a TagObject with additional metadata about the tag
+                if isinstance(tag, TagRecord):
+                    tagger = tag.tagger
+                    committer = tag.committer
+                    tagged_date = tag.tagged_date
+                elif isinstance(tag.object, TagObject):
                     tagger = tag.object.tagger
                     committer = tag.object.tagger.committer()
                     _tz = timezone(timedelta(seconds=-1 * tag.object.tagger_tz_offset))
@@ -110,14 +166,20 @@ class ReleaseHistory:
 
                 released.setdefault(the_version, release)
 
-            if any(pat.match(commit_message) for pat in exclude_commit_patterns):
+            if excluded:
                 log.debug(
                     "Skipping excluded commit %s (%s)",
                     commit.hexsha,
-                    commit_message.replace("\n", " ")[:20],
+                    str(commit.message).replace("\n", " ")[:20],
                 )
                 continue
 
+            parse_result = next(parse_results)
+            commit_type = (
+                "unknown" if isinstance(parse_result, ParseError) else parse_result.type
+            )
+            log.debug("commit has type %s", commit_type)
+
             if not is_commit_released:
                 log.debug("adding commit %s to unreleased commits", commit.hexsha)
                 unreleased[commit_type].append(parse_result)
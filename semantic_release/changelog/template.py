@@ -1,24 +1,148 @@
 from __future__ import annotations
 
+import hashlib
+import json
 import logging
 import os
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import TYPE_CHECKING, Callable, Iterable
+from typing import TYPE_CHECKING, Any, Callable, Iterable
 
-from jinja2 import FileSystemLoader
+import jinja2
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader
 from jinja2.sandbox import SandboxedEnvironment
 
-from semantic_release.helpers import dynamic_import
+from semantic_release.helpers import (
+    dynamic_import,
+    file_digest,
+    prepare_cache_dir,
+    write_chunks_atomic,
+)
 
 if TYPE_CHECKING:
+    from types import CodeType
     from typing import Literal
 
-    from jinja2 import Environment
+    from jinja2 import Template
+    from jinja2.bccache import Bucket
 
 
 log = logging.getLogger(__name__)
 
+# Code compiled from template strings in this process, keyed by the fingerprint of
+# the environment which compiled it and the hash of the template's source
+_compiled_code: dict[tuple[str, str], CodeType] = {}
+
+
+def _callable_name(value: Any) -> Any:
+    if callable(value):
+        return (
+            f"{getattr(value, '__module__', '')}.{getattr(value, '__qualname__', '')}"
+        )
+    return value
+
+
+def environment_fingerprint(env: Environment) -> str:
+    """
+    Produce a hash of the settings of ``env`` which affect how templates are
+    compiled, so that code compiled by one environment is only reused by
+    environments which would have compiled it identically
+    """
+    env_cls = type(env)
+    settings = {
+        "jinja2": jinja2.__version__,
+        "class": f"{env_cls.__module__}.{env_cls.__qualname__}",
+        "block_start_string": env.block_start_string,
+        "block_end_string": env.block_end_string,
+        "variable_start_string": env.variable_start_string,
+        "variable_end_string": env.variable_end_string,
+        "comment_start_string": env.comment_start_string,
+        "comment_end_string": env.comment_end_string,
+        "line_statement_prefix": env.line_statement_prefix,
+        "line_comment_prefix": env.line_comment_prefix,
+        "trim_blocks": env.trim_blocks,
+        "lstrip_blocks": env.lstrip_blocks,
+        "newline_sequence": env.newline_sequence,
+        "keep_trailing_newline": env.keep_trailing_newline,
+        "extensions": sorted(env.extensions),
+        "autoescape": _callable_name(env.autoescape),
+        "finalize": _callable_name(env.finalize),
+        "optimized": env.optimized,
+        "is_async": env.is_async,
+    }
+    return hashlib.sha256(
+        json.dumps(settings, sort_keys=True, default=str).encode("utf-8")
+    ).hexdigest()[:32]
+
+
+class TemplateBytecodeCache(FileSystemBytecodeCache):
+    """
+    Stores the bytecode of compiled templates in the ``jinja`` subdirectory of
+    ``cache_dir``, which is only created once there is something to store.
+
+    Jinja only checks the source of a template to decide if its cached bytecode
+    is still valid, so the fingerprint of the environment is added to the cache
+    key to avoid reusing code compiled with different settings (for example, with
+    other delimiters).
+    """
+
+    def __init__(self, cache_dir: Path | str) -> None:
+        self.cache_dir = Path(cache_dir)
+        super().__init__(str(self.cache_dir / "jinja"))
+
+    def get_bucket(
+        self,
+        environment: Environment,
+        name: str,
+        filename: str | None,
+        source: str,
+    ) -> Bucket:
+        return super().get_bucket(
+            environment,
+            f"{environment_fingerprint(environment)}:{name}",
+            filename,
+            source,
+        )
+
+    def dump_bytecode(self, bucket: Bucket) -> None:
+        try:
+            prepare_cache_dir(self.cache_dir)
+            Path(self.directory).mkdir(exist_ok=True)
+            super().dump_bytecode(bucket)
+        except OSError as err:
+            # A missing cache entry only means the template is compiled again
+            log.warning("Failed to cache compiled template in %s", self.directory)
+            log.debug("stack trace", exc_info=err)
+
+
+def template_from_string(env: Environment, source: str) -> Template:
+    """
+    Equivalent to ``env.from_string(source)``, but the template is only compiled
+    once per process for each environment fingerprint and source, and its bytecode
+    is stored in the environment's bytecode cache (if it has one) for later runs.
+    """
+    source_hash = hashlib.sha256(source.encode("utf-8")).hexdigest()
+    key = (environment_fingerprint(env), source_hash)
+
+    if (code := _compiled_code.get(key)) is None:
+        bucket = (
+            env.bytecode_cache.get_bucket(env, f"<string>:{source_hash}", None, source)
+            if env.bytecode_cache is not None
+            else None
+        )
+        if bucket is not None and bucket.code is not None:
+            log.debug("using cached bytecode for template %s", source_hash)
+            code = bucket.code
+        else:
+            code = env.compile(source)
+            if bucket is not None and env.bytecode_cache is not None:
+                bucket.code = code
+                env.bytecode_cache.set_bucket(bucket)
+        _compiled_code[key] = code
+
+    return env.template_class.from_code(env, code, env.make_globals(None))
+
 
 # pylint: disable=too-many-arguments,too-many-locals
 def environment(
@@ -37,7 +161,9 @@ def environment(
     keep_trailing_newline: bool = False,
     extensions: Iterable[str] = (),
     autoescape: bool | str = True,
-) -> SandboxedEnvironment:
+    cache_dir: Path | str | None = None,
+    sandboxed: bool = True,
+) -> Environment:
     """
     Create a jinja2.sandbox.SandboxedEnvironment with certain parameter resrictions.
 
@@ -48,6 +174,13 @@ def environment(
     ``module:attr``, in this instance it will be dynamically imported.
     See https://jinja.palletsprojects.com/en/3.1.x/api/#jinja2.Environment for full
     parameter descriptions
+
+    When ``cache_dir`` is given, the bytecode of compiled templates is stored in it
+    so that unchanged templates don't need to be compiled again on the next run.
+
+    Setting ``sandboxed`` to False creates a plain jinja2.Environment instead, which
+    renders faster as attribute access & calls aren't checked, but must only be used
+    with templates which are trusted.
     """
     autoescape_value: bool | Callable[[str | None], bool]
     if isinstance(autoescape, str):
@@ -56,7 +189,8 @@ def environment(
         autoescape_value = autoescape
     log.debug("%s", locals())
 
-    return SandboxedEnvironment(
+    env_cls = SandboxedEnvironment if sandboxed else Environment
+    return env_cls(
         block_start_string=block_start_string,
         block_end_string=block_end_string,
         variable_start_string=variable_start_string,
@@ -72,16 +206,62 @@ def environment(
         extensions=extensions,
         autoescape=autoescape_value,
         loader=FileSystemLoader(template_dir, encoding="utf-8"),
+        bytecode_cache=(
+            TemplateBytecodeCache(cache_dir) if cache_dir is not None else None
+        ),
+    )
+
+
+def _render_template_file(
+    environment: Environment, src_file_path: str, output_file_path: str
+) -> bool:
+    """
+    Render a template to `output_file_path`, leaving the file untouched if it already
+    has the rendered content. Returns whether the file was written.
+    """
+    log.debug("rendering %s to %s", src_file_path, output_file_path)
+    return write_chunks_atomic(
+        output_file_path,
+        environment.get_template(src_file_path).generate(),
+        newline="",
+        skip_unchanged=True,
     )
 
 
+def _copy_file(src_file: str, target_file: str) -> bool:
+    """
+    Copy `src_file` to `target_file` unless it already has the same content.
+    Returns whether the file was written.
+    """
+    log.debug("source file %s is not a template, copying to %s", src_file, target_file)
+    if os.path.exists(target_file) and file_digest(src_file) == file_digest(
+        target_file
+    ):
+        log.debug("%s is unchanged", target_file)
+        return False
+
+    shutil.copyfile(src_file, target_file)
+    return True
+
+
 # pylint: disable=redefined-outer-name
 def recursive_render(
     template_dir: Path,
     environment: Environment,
     _root_dir: str | os.PathLike[str] = ".",
+    max_workers: int | None = 1,
 ) -> list[str]:
-    rendered_paths: list[str] = []
+    """
+    Render the templates in `template_dir` into the directory tree under
+    `_root_dir`, copying any other files as they are. Output files which already
+    have the new content are left untouched. The paths of all of the output files
+    are returned, whether or not they were changed.
+
+    Files are rendered one at a time by default. With a `max_workers` other than 1
+    they are rendered in a pool of up to `max_workers` threads, where None uses as
+    many as :py:class:`concurrent.futures.ThreadPoolExecutor` would.
+    """
+    tasks: list[tuple[Callable[..., bool], tuple[Any, ...], str]] = []
     for root, file in (
         (Path(root), file)
         for root, _, files in os.walk(template_dir)
@@ -106,20 +286,23 @@ def recursive_render(
             # that's the output location relative to the repo root
             src_file_path = str((root / file).relative_to(template_dir))
             output_file_path = str((output_path / output_filename).resolve())
-
-            log.debug("rendering %s to %s", src_file_path, output_file_path)
-            stream = environment.get_template(src_file_path).stream()
-
-            with open(output_file_path, "wb+") as output_file:
-                stream.dump(output_file, encoding="utf-8")
-
-            rendered_paths.append(output_file_path)
+            tasks.append(
+                (
+                    _render_template_file,
+                    (environment, src_file_path, output_file_path),
+                    output_file_path,
+                )
+            )
         else:
             src_file = str((root / file).resolve())
             target_file = str((output_path / file).resolve())
-            log.debug(
-                "source file %s is not a template, copying to %s", src_file, target_file
-            )
-            shutil.copyfile(src_file, target_file)
-            rendered_paths.append(target_file)
-    return rendered_paths
+            tasks.append((_copy_file, (src_file, target_file), target_file))
+
+    if len(tasks) > 1 and max_workers != 1:
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            changed = list(pool.map(lambda task: task[0](*task[1]), tasks))
+    else:
+        changed = [func(*args) for func, args, _ in tasks]
+
+    log.debug("%s of %s rendered files were changed", sum(changed), len(tasks))
+    return [path for _, _, path in tasks]
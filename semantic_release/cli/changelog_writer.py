@@ -8,19 +8,32 @@ from typing import TYPE_CHECKING
 # NOTE: use backport with newer API than stdlib
 from importlib_resources import files
 
+from semantic_release.changelog.cache import ReleaseSectionCache
 from semantic_release.changelog.context import (
+    ChangelogContext,
     ReleaseNotesContext,
     make_changelog_context,
 )
-from semantic_release.changelog.template import environment, recursive_render
+from semantic_release.changelog.release_history import ReleaseHistory
+from semantic_release.changelog.template import (
+    environment,
+    recursive_render,
+    template_from_string,
+)
+from semantic_release.cli.config import ChangelogMode
 from semantic_release.cli.util import noop_report
+from semantic_release.helpers import write_chunks_atomic, write_text_atomic
 
 if TYPE_CHECKING:
+    from typing import Iterable, Iterator
+
+    from git.refs.tag import Tag
     from jinja2 import Environment
 
-    from semantic_release.changelog.release_history import Release, ReleaseHistory
+    from semantic_release.changelog.release_history import Release
     from semantic_release.cli.config import RuntimeContext
     from semantic_release.hvcs._base import HvcsBase
+    from semantic_release.version.version import Version
 
 
 log = getLogger(__name__)
@@ -39,21 +52,67 @@ def get_release_notes_template(template_dir: Path) -> str:
         )
 
 
-def render_default_changelog_file(template_env: Environment) -> str:
+def stream_default_changelog(
+    template_env: Environment, cache_dir: Path | None = None
+) -> Iterable[str]:
+    """
+    Render the default changelog template with the context bound to `template_env`,
+    as chunks of text which are produced as the template is rendered.
+
+    When `cache_dir` is given, the template is rendered one release at a time and
+    the sections of releases which were rendered by a previous run are reused.
+    """
     changelog_text = (
         files("semantic_release")
         .joinpath("data/templates/CHANGELOG.md.j2")
         .read_text(encoding="utf-8")
     )
-    template = template_env.from_string(changelog_text)
-    return template.render().rstrip()
+    template = template_from_string(template_env, changelog_text)
+
+    context = template_env.globals.get("context")
+    if cache_dir is not None and isinstance(context, ChangelogContext):
+        section_cache = ReleaseSectionCache(
+            cache_dir=cache_dir,
+            template_source=changelog_text,
+            environment=template_env,
+            context=context,
+        )
+        if (sections := section_cache.render(template, template_env)) is not None:
+            section_cache.save()
+            return sections
+
+    return template.generate()
+
+
+def render_default_changelog_file(
+    template_env: Environment, cache_dir: Path | None = None
+) -> str:
+    return str.join("", stream_default_changelog(template_env, cache_dir)).rstrip()
+
+
+def _rstripped(chunks: Iterable[str]) -> Iterator[str]:
+    """
+    Yield `chunks` with any trailing whitespace replaced by a single newline,
+    without joining them together
+    """
+    # Whitespace is held back until we know it isn't at the end of the text
+    pending_whitespace = ""
+    for chunk in chunks:
+        text = chunk.rstrip()
+        if not text:
+            pending_whitespace += chunk
+            continue
+        yield pending_whitespace
+        yield text
+        pending_whitespace = chunk[len(text) :]
+    yield "\n"
 
 
 def render_release_notes(
     release_notes_template: str,
     template_env: Environment,
 ) -> str:
-    template = template_env.from_string(release_notes_template)
+    template = template_from_string(template_env, release_notes_template)
     return template.render().rstrip()
 
 
@@ -62,6 +121,7 @@ def apply_user_changelog_template_directory(
     environment: Environment,
     destination_dir: Path,
     noop: bool = False,
+    render_workers: int = 1,
 ) -> list[str]:
     if noop:
         noop_report(
@@ -78,7 +138,11 @@ def apply_user_changelog_template_directory(
         return []
 
     return recursive_render(
-        template_dir, environment=environment, _root_dir=destination_dir
+        template_dir,
+        environment=environment,
+        _root_dir=destination_dir,
+        # 0 uses the default number of threads
+        max_workers=render_workers or None,
     )
 
 
@@ -87,6 +151,7 @@ def write_default_changelog(
     destination_dir: Path,
     environment: Environment,
     noop: bool = False,
+    cache_dir: Path | None = None,
 ) -> str:
     if noop:
         noop_report(
@@ -99,9 +164,148 @@ def write_default_changelog(
             )
         )
     else:
-        changelog_text = render_default_changelog_file(environment)
-        changelog_file.write_text(f"{changelog_text}\n", encoding="utf-8")
+        # Streamed to the file, so that the whole changelog is never held in memory
+        write_chunks_atomic(
+            changelog_file,
+            _rstripped(stream_default_changelog(environment, cache_dir)),
+        )
+
+    return str(changelog_file)
+
+
+def _has_user_templates(template_dir: Path) -> bool:
+    # Directory exists and directory is not empty
+    return (
+        template_dir.exists() and template_dir.is_dir() and bool(listdir(template_dir))
+    )
+
+
+def _release_heading(version: Version) -> str:
+    """The start of the heading of a release's section in the default changelog"""
+    return f"## {version.as_semver_tag()} ("
+
+
+def _strip_unreleased_section(changelog_text: str) -> str:
+    """Remove a leading "Unreleased" section of the default changelog"""
+    changelog_text = changelog_text.lstrip("\n")
+    if not changelog_text.startswith("## Unreleased"):
+        return changelog_text
+    _, sep, rest = changelog_text.partition("\n## ")
+    return f"## {rest}" if sep else ""
+
+
+def last_release_in_changelog(
+    runtime_ctx: RuntimeContext,
+    tags_and_versions: Iterable[tuple[Tag, Version]],
+) -> Tag | None:
+    """
+    Find the tag of the latest of `tags_and_versions` which already has a section
+    in the changelog file, when the changelog will be updated incrementally.
+
+    Only the history since this tag is needed to update the changelog. If the
+    whole changelog will be rendered, return None.
+    """
+    if runtime_ctx.changelog_mode is not ChangelogMode.UPDATE or _has_user_templates(
+        runtime_ctx.template_dir
+    ):
+        return None
+
+    try:
+        changelog_text = runtime_ctx.changelog_file.read_text(encoding="utf-8")
+    except FileNotFoundError:
+        return None
+
+    _, flag, existing_releases = changelog_text.partition(
+        runtime_ctx.changelog_insertion_flag
+    )
+    if not flag:
+        return None
+
+    for tag, version in tags_and_versions:
+        if _release_heading(version) in existing_releases:
+            log.debug("%s is the latest release in the changelog", tag.name)
+            return tag
+    return None
+
+
+def update_default_changelog(
+    changelog_file: Path,
+    destination_dir: Path,
+    release_history: ReleaseHistory,
+    hvcs_client: HvcsBase,
+    environment: Environment,
+    insertion_flag: str,
+    noop: bool = False,
+    cache_dir: Path | None = None,
+) -> str:
+    """
+    Insert the sections of the default changelog for the unreleased changes and any
+    releases which aren't in `changelog_file` yet after the `insertion_flag`,
+    leaving the rest of the file untouched. Any previous "Unreleased" section is
+    replaced.
+
+    If the file doesn't contain the `insertion_flag`, the whole changelog is
+    written, with the `insertion_flag` placed before the first section.
+    """
+    if noop:
+        noop_report(
+            str.join(
+                " ",
+                [
+                    "would have updated your changelog at",
+                    str(changelog_file.relative_to(destination_dir)),
+                ],
+            )
+        )
+        return str(changelog_file)
+
+    try:
+        previous_text = changelog_file.read_text(encoding="utf-8")
+    except FileNotFoundError:
+        previous_text = ""
+
+    before, flag, existing_releases = previous_text.partition(insertion_flag)
+    if not flag:
+        log.info(
+            "%r not found in %s, writing the full changelog",
+            insertion_flag,
+            changelog_file,
+        )
+        before, existing_releases = "", ""
+        new_history = release_history
+    else:
+        existing_releases = _strip_unreleased_section(existing_releases)
+        new_history = ReleaseHistory(
+            unreleased=release_history.unreleased,
+            released={
+                version: release
+                for version, release in release_history.released.items()
+                if _release_heading(version) not in existing_releases
+            },
+        )
+        log.info("adding %s new releases to the changelog", len(new_history.released))
+        make_changelog_context(
+            hvcs_client=hvcs_client,
+            release_history=new_history,
+        ).bind_to_environment(environment)
 
+    # The default template renders a heading, followed by a blank line before
+    # each section
+    heading, _, new_sections = render_default_changelog_file(
+        environment, cache_dir
+    ).partition("\n\n")
+    changelog_text = str.join(
+        "\n\n",
+        filter(
+            None,
+            [
+                before + insertion_flag if flag else f"{heading}\n\n{insertion_flag}",
+                new_sections,
+                existing_releases.strip("\n"),
+            ],
+        ),
+    )
+    write_text_atomic(changelog_file, f"{changelog_text}\n")
     return str(changelog_file)
 
 
@@ -121,26 +325,44 @@ def write_changelog_files(
 
     changelog_context.bind_to_environment(runtime_ctx.template_environment)
 
-    use_user_template_dir = bool(
-        # Directory exists and directory is not empty
-        template_dir.exists() and template_dir.is_dir() and listdir(template_dir)
-    )
-
-    if use_user_template_dir:
+    if _has_user_templates(template_dir):
+        if runtime_ctx.changelog_mode is ChangelogMode.UPDATE:
+            log.warning(
+                "Changelog mode %r is only supported by the default changelog "
+                "template, rendering the templates in %r",
+                ChangelogMode.UPDATE.value,
+                str(template_dir),
+            )
         return apply_user_changelog_template_directory(
             template_dir=template_dir,
             environment=runtime_ctx.template_environment,
             destination_dir=project_dir,
             noop=noop,
+            render_workers=runtime_ctx.changelog_render_workers,
         )
 
     log.info("No contents found in %r, using default changelog template", template_dir)
+    if runtime_ctx.changelog_mode is ChangelogMode.UPDATE:
+        return [
+            update_default_changelog(
+                changelog_file=runtime_ctx.changelog_file,
+                destination_dir=project_dir,
+                release_history=release_history,
+                hvcs_client=hvcs_client,
+                environment=runtime_ctx.template_environment,
+                insertion_flag=runtime_ctx.changelog_insertion_flag,
+                noop=noop,
+                cache_dir=runtime_ctx.cache_dir,
+            )
+        ]
+
     return [
         write_default_changelog(
             changelog_file=runtime_ctx.changelog_file,
             destination_dir=project_dir,
             environment=runtime_ctx.template_environment,
             noop=noop,
+            cache_dir=runtime_ctx.cache_dir,
         )
     ]
 
@@ -150,6 +372,7 @@ def generate_release_notes(
     release: Release,
     template_dir: Path,
     history: ReleaseHistory,
+    cache_dir: Path | None = None,
 ) -> str:
     release_notes_env = ReleaseNotesContext(
         repo_name=hvcs_client.repo_name,
@@ -161,7 +384,7 @@ def generate_release_notes(
     ).bind_to_environment(
         # Use a new, non-configurable environment for release notes -
         # not user-configurable at the moment
-        environment(template_dir=template_dir)
+        environment(template_dir=template_dir, cache_dir=cache_dir)
     )
 
     # TODO: Remove in v10
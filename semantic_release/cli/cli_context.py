@@ -6,7 +6,7 @@ from typing import TYPE_CHECKING
 
 import click
 from click.core import ParameterSource
-from git import InvalidGitRepositoryError
+from git import InvalidGitRepositoryError, Repo
 from pydantic import ValidationError
 
 from semantic_release.cli.config import (
@@ -14,6 +14,7 @@ from semantic_release.cli.config import (
     RuntimeContext,
 )
 from semantic_release.cli.util import load_raw_config_file, rprint
+from semantic_release.commit_parser import CachedCommitParser
 from semantic_release.errors import (
     DetachedHeadGitError,
     InvalidConfiguration,
@@ -39,6 +40,7 @@ class CliContextObj:
         self.global_opts = global_opts
         self._raw_config: RawConfig | None = None
         self._runtime_ctx: RuntimeContext | None = None
+        self._repo: Repo | None = None
 
     @property
     def raw_config(self) -> RawConfig:
@@ -56,6 +58,18 @@ class CliContextObj:
             self._runtime_ctx = self._init_runtime_ctx()
         return self._runtime_ctx
 
+    @property
+    def repo(self) -> Repo:
+        """
+        The git repository of the project, opened on first use and shared by
+        everything run during this invocation. It is closed once the command has
+        finished.
+        """
+        if self._repo is None:
+            self._repo = Repo(str(self.raw_config.repo_dir))
+            self.ctx.call_on_close(self._repo.close)
+        return self._repo
+
     def _init_raw_config(self) -> RawConfig:
         config_path = Path(self.global_opts.config_file)
         conf_file_exists = config_path.exists()
@@ -100,6 +114,7 @@ class CliContextObj:
             runtime = RuntimeContext.from_raw_config(
                 self.raw_config,
                 global_cli_options=self.global_opts,
+                repo=self.repo,
             )
         except NotAReleaseBranch as exc:
             rprint(f"[bold {'red' if self.global_opts.strict else 'orange1'}]{exc!s}")
@@ -121,4 +136,8 @@ class CliContextObj:
         for handler in logging.getLogger().handlers:
             handler.addFilter(runtime.masker)
 
+        # Persist newly parsed commits once the command has finished
+        if isinstance(runtime.commit_parser, CachedCommitParser):
+            self.ctx.call_on_close(runtime.commit_parser.save)
+
         return runtime
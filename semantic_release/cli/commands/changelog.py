@@ -4,15 +4,16 @@ import logging
 from typing import TYPE_CHECKING
 
 import click
-from git import Repo
 
 from semantic_release.changelog import ReleaseHistory
 from semantic_release.cli.changelog_writer import (
     generate_release_notes,
+    last_release_in_changelog,
     write_changelog_files,
 )
 from semantic_release.cli.util import noop_report
 from semantic_release.hvcs.remote_hvcs_base import RemoteHvcsBase
+from semantic_release.version import HistorySnapshot
 
 if TYPE_CHECKING:
     from semantic_release.cli.cli_context import CliContextObj
@@ -67,13 +68,30 @@ def changelog(cli_ctx: CliContextObj, release_tag: str | None) -> None:
     translator = runtime.version_translator
     hvcs_client = runtime.hvcs_client
 
-    with Repo(str(runtime.repo_dir)) as git_repo:
-        release_history = ReleaseHistory.from_git_history(
-            repo=git_repo,
-            translator=translator,
-            commit_parser=runtime.commit_parser,
-            exclude_commit_patterns=runtime.changelog_excluded_commit_patterns,
-        )
+    git_repo = cli_ctx.repo
+    snapshot = HistorySnapshot(
+        repo=git_repo,
+        translator=translator,
+        commit_parser=runtime.commit_parser,
+        backend=runtime.history_backend,
+        parse_workers=runtime.parse_workers,
+    )
+    # When the changelog is updated incrementally, only the history since the
+    # last release in the changelog is needed, unless we're also posting the
+    # release notes of a release
+    last_release_tag = (
+        None
+        if release_tag
+        else last_release_in_changelog(runtime, snapshot.tags_and_versions)
+    )
+    release_history = ReleaseHistory.from_git_history(
+        repo=git_repo,
+        translator=translator,
+        commit_parser=runtime.commit_parser,
+        exclude_commit_patterns=runtime.changelog_excluded_commit_patterns,
+        snapshot=snapshot,
+        since=last_release_tag.name if last_release_tag else None,
+    )
 
     write_changelog_files(
         runtime_ctx=runtime,
@@ -116,6 +134,7 @@ def changelog(cli_ctx: CliContextObj, release_tag: str | None) -> None:
         release,
         runtime.template_dir,
         release_history,
+        cache_dir=runtime.cache_dir,
     )
 
     try:
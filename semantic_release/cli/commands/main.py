@@ -86,6 +86,14 @@ class Cli(click.MultiCommand):
     default=False,
     help="Enable strict mode",
 )
+@click.option(
+    "-j",
+    "--jobs",
+    "parse_workers",
+    default=None,
+    type=click.IntRange(min=0),
+    help="Number of processes used to parse commits (0 for one per CPU)",
+)
 @click.pass_context
 def main(
     ctx: click.Context,
@@ -93,6 +101,7 @@ def main(
     verbosity: int = 0,
     noop: bool = False,
     strict: bool = False,
+    parse_workers: int | None = None,
 ) -> None:
     """
     Python Semantic Release
@@ -129,7 +138,11 @@ def main(
         )
 
     cli_options = GlobalCommandLineOptions(
-        noop=noop, verbosity=verbosity, config_file=config_file, strict=strict
+        noop=noop,
+        verbosity=verbosity,
+        config_file=config_file,
+        strict=strict,
+        parse_workers=parse_workers,
     )
 
     logger.debug("global cli options: %s", cli_options)
@@ -4,13 +4,16 @@ import logging
 from typing import TYPE_CHECKING
 
 import click
-from git import Repo
+from git import GitCommandError
 
 from semantic_release.cli.util import noop_report
+from semantic_release.gitlog import iter_tag_refs
 from semantic_release.hvcs.remote_hvcs_base import RemoteHvcsBase
 from semantic_release.version import tags_and_versions
 
 if TYPE_CHECKING:
+    from git import Repo
+
     from semantic_release.cli.cli_context import CliContextObj
 
 
@@ -41,6 +44,14 @@ def publish_distributions(
         hvcs_client.upload_dists(tag=tag, dist_glob=pattern)  # type: ignore[attr-defined]
 
 
+def tag_exists(repo: Repo, tag: str) -> bool:
+    try:
+        repo.git.rev_parse("--verify", "--quiet", f"refs/tags/{tag}")
+    except GitCommandError:
+        return False
+    return True
+
+
 @click.command(
     short_help="Publish distributions to VCS Releases",
     context_settings={
@@ -62,10 +73,8 @@ def publish(cli_ctx: CliContextObj, tag: str) -> None:
     translator = runtime.version_translator
     dist_glob_patterns = runtime.dist_glob_patterns
 
-    with Repo(str(runtime.repo_dir)) as git_repo:
-        repo_tags = git_repo.tags
-
     if tag == "latest":
+        repo_tags = iter_tag_refs(cli_ctx.repo, translator.tag_ref_pattern)
         try:
             tag = str(tags_and_versions(repo_tags, translator)[0][0])
         except IndexError:
@@ -82,7 +91,8 @@ def publish(cli_ctx: CliContextObj, tag: str) -> None:
             )
             ctx.exit(1)
 
-    if tag not in {tag.name for tag in repo_tags}:
+    # Any tag can be published to, even one which doesn't match the tag format
+    if not tag_exists(cli_ctx.repo, tag):
         click.echo(f"Tag '{tag}' not found in local repository!", err=True)
         ctx.exit(1)
 
@@ -5,18 +5,19 @@ import os
 import subprocess
 import sys
 from collections import defaultdict
+from copy import copy
 from datetime import datetime
 from typing import TYPE_CHECKING
 
 import click
 import shellingham  # type: ignore[import]
 from click_option_group import MutuallyExclusiveOptionGroup, optgroup
-from git import Repo
 from requests import HTTPError
 
 from semantic_release.changelog import ReleaseHistory
 from semantic_release.cli.changelog_writer import (
     generate_release_notes,
+    last_release_in_changelog,
     write_changelog_files,
 )
 from semantic_release.cli.github_actions_output import VersionGitHubActionsOutput
@@ -28,9 +29,11 @@ from semantic_release.errors import (
     GitCommitEmptyIndexError,
     UnexpectedResponse,
 )
+from semantic_release.gitlog import iter_tag_refs
 from semantic_release.gitproject import GitProject
 from semantic_release.hvcs.remote_hvcs_base import RemoteHvcsBase
 from semantic_release.version import (
+    HistorySnapshot,
     Version,
     VersionTranslator,
     next_version,
@@ -41,6 +44,7 @@ if TYPE_CHECKING:  # pragma: no cover
     from pathlib import Path
     from typing import Iterable, Mapping
 
+    from git import Repo
     from git.refs.tag import Tag
 
     from semantic_release.cli.cli_context import CliContextObj
@@ -73,51 +77,43 @@ def is_forced_prerelease(
     )
 
 
-def last_released(repo_dir: Path, tag_format: str) -> tuple[Tag, Version] | None:
-    with Repo(str(repo_dir)) as git_repo:
-        ts_and_vs = tags_and_versions(
-            git_repo.tags, VersionTranslator(tag_format=tag_format)
-        )
+def last_released(repo: Repo, tag_format: str) -> tuple[Tag, Version] | None:
+    translator = VersionTranslator(tag_format=tag_format)
+    ts_and_vs = tags_and_versions(
+        iter_tag_refs(repo, translator.tag_ref_pattern), translator
+    )
 
     return ts_and_vs[0] if ts_and_vs else None
 
 
 def version_from_forced_level(
-    repo_dir: Path, forced_level_bump: LevelBump, translator: VersionTranslator
+    snapshot: HistorySnapshot, forced_level_bump: LevelBump
 ) -> Version:
-    with Repo(str(repo_dir)) as git_repo:
-        ts_and_vs = tags_and_versions(git_repo.tags, translator)
+    translator = snapshot.translator
+    latest = snapshot.version_table.latest()
 
     # If we have no tags, return the default version
-    if not ts_and_vs:
+    if latest is None:
         return Version.parse(DEFAULT_VERSION).bump(forced_level_bump)
 
-    _, latest_version = ts_and_vs[0]
+    _, latest_version = latest
     if forced_level_bump is not LevelBump.PRERELEASE_REVISION:
         return latest_version.bump(forced_level_bump)
 
     # We need to find the latest version with the prerelease token
     # we're looking for, and return that version + an increment to
     # the prerelease revision.
-
-    # NOTE this can probably be cleaned up.
-    # ts_and_vs are in order, so check if we're looking at prereleases
-    # for the same (major, minor, patch) as the latest version.
-    # If we are, we can increment the revision and we're done. If
-    # we don't find a prerelease targeting this version with the same
-    # token as the one we're looking to prerelease, we can use revision 1.
-    for _, version in ts_and_vs:
-        if not (
-            version.major == latest_version.major
-            and version.minor == latest_version.minor
-            and version.patch == latest_version.patch
-        ):
-            break
-        if (
-            version.is_prerelease
-            and version.prerelease_token == translator.prerelease_token
-        ):
-            return version.bump(LevelBump.PRERELEASE_REVISION)
+    # If we don't find a prerelease targeting the same (major, minor, patch)
+    # as the latest version with the token we're looking to prerelease,
+    # we can use revision 1.
+    latest_prerelease = snapshot.version_table.latest_prerelease(
+        latest_version.major,
+        latest_version.minor,
+        latest_version.patch,
+        translator.prerelease_token,
+    )
+    if latest_prerelease is not None:
+        return latest_prerelease[1].bump(LevelBump.PRERELEASE_REVISION)
     return latest_version.to_prerelease(token=translator.prerelease_token, revision=1)
 
 
@@ -431,7 +427,7 @@ def version(  # noqa: C901
     if print_last_released or print_last_released_tag:
         # TODO: get tag format a better way
         if not (
-            last_release := last_released(config.repo_dir, tag_format=config.tag_format)
+            last_release := last_released(cli_ctx.repo, tag_format=config.tag_format)
         ):
             log.warning("No release tags found.")
             return
@@ -480,16 +476,27 @@ def version(  # noqa: C901
         log.info("No vcs release will be created because pushing changes is disabled")
         make_vcs_release &= push_changes
 
+    # The tags & commits of the repository are shared between determining the next
+    # version and building the release history, so they are only read & parsed once
+    git_repo = cli_ctx.repo
+    snapshot = HistorySnapshot(
+        repo=git_repo,
+        translator=translator,
+        commit_parser=parser,
+        backend=runtime.history_backend,
+        parse_workers=runtime.parse_workers,
+    )
+
     if not forced_level_bump:
-        with Repo(str(runtime.repo_dir)) as git_repo:
-            new_version = next_version(
-                repo=git_repo,
-                translator=translator,
-                commit_parser=parser,
-                prerelease=prerelease,
-                major_on_zero=major_on_zero,
-                allow_zero_version=runtime.allow_zero_version,
-            )
+        new_version = next_version(
+            repo=git_repo,
+            translator=translator,
+            commit_parser=parser,
+            prerelease=prerelease,
+            major_on_zero=major_on_zero,
+            allow_zero_version=runtime.allow_zero_version,
+            snapshot=snapshot,
+        )
     else:
         log.warning(
             "Forcing a '%s' release due to '--%s' command-line flag",
@@ -502,9 +509,8 @@ def version(  # noqa: C901
         )
 
         new_version = version_from_forced_level(
-            repo_dir=runtime.repo_dir,
+            snapshot=snapshot,
             forced_level_bump=forced_level_bump,
-            translator=translator,
         )
 
         # We only turn the forced version into a prerelease if the user has specified
@@ -517,6 +523,9 @@ def version(  # noqa: C901
         )
 
     if build_metadata:
+        # The version may be one of the versions held by the snapshot, so we make
+        # a copy rather than modifying it in place
+        new_version = copy(new_version)
         new_version.build_metadata = build_metadata
 
     if as_prerelease:
@@ -544,11 +553,7 @@ def version(  # noqa: C901
     # Print the new version so that command-line output capture will work
     click.echo(version_to_print)
 
-    with Repo(str(runtime.repo_dir)) as git_repo:
-        # TODO: performance improvement - cache the result of tags_and_versions (previously done in next_version())
-        previously_released_versions = {
-            v for _, v in tags_and_versions(git_repo.tags, translator)
-        }
+    previously_released_versions = {v for _, v in snapshot.tags_and_versions}
 
     # If the new version has already been released, we fail and abort if strict;
     # otherwise we exit with 0.
@@ -571,13 +576,21 @@ def version(  # noqa: C901
     if print_only or print_only_tag:
         return
 
-    with Repo(str(runtime.repo_dir)) as git_repo:
-        release_history = ReleaseHistory.from_git_history(
-            repo=git_repo,
-            translator=translator,
-            commit_parser=parser,
-            exclude_commit_patterns=runtime.changelog_excluded_commit_patterns,
-        )
+    # When the changelog is updated incrementally, only the history since the
+    # last release in the changelog is needed
+    last_release_tag = (
+        last_release_in_changelog(runtime, snapshot.tags_and_versions)
+        if update_changelog
+        else None
+    )
+    release_history = ReleaseHistory.from_git_history(
+        repo=git_repo,
+        translator=translator,
+        commit_parser=parser,
+        exclude_commit_patterns=runtime.changelog_excluded_commit_patterns,
+        snapshot=snapshot,
+        since=last_release_tag.name if last_release_tag else None,
+    )
 
     rprint(f"[bold green]The next version is: [white]{new_version!s}[/white]! :rocket:")
 
@@ -643,6 +656,7 @@ def version(  # noqa: C901
         directory=runtime.repo_dir,
         commit_author=runtime.commit_author,
         credential_masker=runtime.masker,
+        repo=git_repo,
     )
 
     # Preparing for committing changes
@@ -658,6 +672,7 @@ def version(  # noqa: C901
                 date=int(commit_date.timestamp()),
                 no_verify=no_verify,
                 noop=opts.noop,
+                paths=all_paths_to_add,
             )
         except GitCommitEmptyIndexError:
             log.info("No local changes to add to any commit, skipping")
@@ -679,24 +694,14 @@ def version(  # noqa: C901
             use_token=not runtime.ignore_token_for_push
         )
 
-        if commit_changes:
-            # TODO: integrate into push branch
-            with Repo(str(runtime.repo_dir)) as git_repo:
-                active_branch = git_repo.active_branch.name
-
-            project.git_push_branch(
-                remote_url=remote_url,
-                branch=active_branch,
-                noop=opts.noop,
-            )
-
-        if create_tag:
-            # push specific tag refspec (that we made) to remote
-            project.git_push_tag(
-                remote_url=remote_url,
-                tag=new_version.as_tag(),
-                noop=opts.noop,
-            )
+        # Push the branch & the tag (that we made) together, so the remote can't
+        # end up with the release commit but not its tag
+        project.git_push(
+            remote_url=remote_url,
+            branch=git_repo.active_branch.name if commit_changes else None,
+            tags=[new_version.as_tag()] if create_tag else [],
+            noop=opts.noop,
+        )
 
     # Update GitHub Actions output value now that release has occurred
     gha_output.released = True
@@ -713,6 +718,7 @@ def version(  # noqa: C901
         release_history.released[new_version],
         runtime.template_dir,
         history=release_history,
+        cache_dir=runtime.cache_dir,
     )
 
     exception: Exception | None = None
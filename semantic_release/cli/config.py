@@ -4,6 +4,7 @@ import logging
 import os
 import re
 from collections.abc import Mapping
+from contextlib import nullcontext
 from dataclasses import dataclass, is_dataclass
 from enum import Enum
 from pathlib import Path
@@ -31,6 +32,7 @@ from semantic_release.cli.const import DEFAULT_CONFIG_FILE
 from semantic_release.cli.masking_filter import MaskingFilter
 from semantic_release.commit_parser import (
     AngularCommitParser,
+    CachedCommitParser,
     CommitParser,
     EmojiCommitParser,
     ParseResult,
@@ -39,6 +41,7 @@ from semantic_release.commit_parser import (
     TagCommitParser,
 )
 from semantic_release.const import COMMIT_MESSAGE, DEFAULT_COMMIT_AUTHOR, SEMVER_REGEX
+from semantic_release.enums import HistoryBackend
 from semantic_release.errors import (
     DetachedHeadGitError,
     InvalidConfiguration,
@@ -59,6 +62,11 @@ log = logging.getLogger(__name__)
 NonEmptyString = Annotated[str, Field(..., min_length=1)]
 
 
+class ChangelogMode(str, Enum):
+    INIT = "init"
+    UPDATE = "update"
+
+
 class HvcsClient(str, Enum):
     BITBUCKET = "bitbucket"
     GITHUB = "github"
@@ -109,12 +117,16 @@ class ChangelogEnvironmentConfig(BaseModel):
     keep_trailing_newline: bool = False
     extensions: Tuple[str, ...] = ()
     autoescape: Union[bool, str] = True
+    sandboxed: bool = True
 
 
 class ChangelogConfig(BaseModel):
     template_dir: str = "templates"
     changelog_file: str = "CHANGELOG.md"
     exclude_commit_patterns: Tuple[str, ...] = ()
+    mode: ChangelogMode = ChangelogMode.INIT
+    insertion_flag: NonEmptyString = "<!-- version list -->"
+    render_workers: Annotated[int, Field(ge=0)] = 1
     environment: ChangelogEnvironmentConfig = ChangelogEnvironmentConfig()
 
 
@@ -218,6 +230,7 @@ class RawConfig(BaseModel):
     branches: Dict[str, BranchConfig] = {"main": BranchConfig()}
     build_command: Optional[str] = None
     build_command_env: List[str] = []
+    cache_dir: Optional[str] = None
     changelog: ChangelogConfig = ChangelogConfig()
     commit_author: MaybeFromEnv = EnvConfigVar(
         env="GIT_COMMIT_AUTHOR", default=DEFAULT_COMMIT_AUTHOR
@@ -226,9 +239,11 @@ class RawConfig(BaseModel):
     commit_parser: NonEmptyString = "angular"
     # It's up to the parser_options() method to validate these
     commit_parser_options: Dict[str, Any] = {}
+    history_backend: HistoryBackend = HistoryBackend.GITPYTHON
     logging_use_named_masks: bool = False
     major_on_zero: bool = True
     allow_zero_version: bool = True
+    parse_workers: Annotated[int, Field(ge=0)] = 1
     repo_dir: Annotated[Path, Field(validate_default=True)] = Path(".")
     remote: RemoteConfig = RemoteConfig()
     no_git_verify: bool = False
@@ -347,6 +362,7 @@ class GlobalCommandLineOptions:
     verbosity: int = 0
     config_file: str = DEFAULT_CONFIG_FILE
     strict: bool = False
+    parse_workers: Optional[int] = None
 
 
 ######
@@ -375,6 +391,8 @@ class RuntimeContext:
 
     repo_dir: Path
     commit_parser: CommitParser[ParseResult, ParserOptions]
+    history_backend: HistoryBackend
+    parse_workers: int
     version_translator: VersionTranslator
     major_on_zero: bool
     allow_zero_version: bool
@@ -387,9 +405,13 @@ class RuntimeContext:
     version_declarations: Tuple[VersionDeclarationABC, ...]
     hvcs_client: hvcs.HvcsBase
     changelog_file: Path
+    changelog_mode: ChangelogMode
+    changelog_insertion_flag: str
+    changelog_render_workers: int
     ignore_token_for_push: bool
     template_environment: Environment
     template_dir: Path
+    cache_dir: Optional[Path]
     build_command: Optional[str]
     build_command_env: dict[str, str]
     dist_glob_patterns: Tuple[str, ...]
@@ -438,14 +460,20 @@ class RuntimeContext:
 
     @classmethod
     def from_raw_config(  # noqa: C901
-        cls, raw: RawConfig, global_cli_options: GlobalCommandLineOptions
+        cls,
+        raw: RawConfig,
+        global_cli_options: GlobalCommandLineOptions,
+        repo: Repo | None = None,
     ) -> RuntimeContext:
         ##
         # credentials masking for logging
         masker = MaskingFilter(_use_named_masks=raw.logging_use_named_masks)
 
-        # Retrieve details from repository
-        with Repo(str(raw.repo_dir)) as git_repo:
+        # Retrieve details from repository, which the caller may have opened already
+        opened_repo: nullcontext[Repo] | Repo = (
+            nullcontext(repo) if repo is not None else Repo(str(raw.repo_dir))
+        )
+        with opened_repo as git_repo:
             try:
                 remote_url = raw.remote.url or git_repo.remote(raw.remote.name).url
                 active_branch = git_repo.active_branch.name
@@ -502,6 +530,16 @@ class RuntimeContext:
                 str.join("\n", [str(err), f"Failed to initialize {raw.commit_parser}"])
             ) from err
 
+        # Local cache directory, used to persist results between runs
+        cache_dir = (
+            Path(raw.cache_dir).expanduser().resolve().absolute()
+            if raw.cache_dir
+            else None
+        )
+
+        if cache_dir is not None:
+            commit_parser = CachedCommitParser(commit_parser, cache_dir=cache_dir)
+
         # We always exclude PSR's own release commits from the Changelog
         # when parsing commits
         _psr_release_commit_re = re.compile(
@@ -596,6 +634,7 @@ class RuntimeContext:
 
         template_environment = environment(
             template_dir=template_dir,
+            cache_dir=cache_dir,
             **raw.changelog.environment.model_dump(),
         )
 
@@ -632,6 +671,12 @@ class RuntimeContext:
         self = cls(
             repo_dir=raw.repo_dir,
             commit_parser=commit_parser,
+            history_backend=raw.history_backend,
+            parse_workers=(
+                raw.parse_workers
+                if global_cli_options.parse_workers is None
+                else global_cli_options.parse_workers
+            ),
             version_translator=version_translator,
             major_on_zero=raw.major_on_zero,
             allow_zero_version=raw.allow_zero_version,
@@ -640,6 +685,9 @@ class RuntimeContext:
             version_declarations=tuple(version_declarations),
             hvcs_client=hvcs_client,
             changelog_file=changelog_file,
+            changelog_mode=raw.changelog.mode,
+            changelog_insertion_flag=raw.changelog.insertion_flag,
+            changelog_render_workers=raw.changelog.render_workers,
             assets=raw.assets,
             commit_author=commit_author,
             commit_message=raw.commit_message,
@@ -648,6 +696,7 @@ class RuntimeContext:
             ignore_token_for_push=raw.remote.ignore_token_for_push,
             template_dir=template_dir,
             template_environment=template_environment,
+            cache_dir=cache_dir,
             dist_glob_patterns=raw.publish.dist_glob_patterns,
             upload_to_vcs_release=raw.publish.upload_to_vcs_release,
             global_cli_options=global_cli_options,
@@ -6,6 +6,7 @@ from semantic_release.commit_parser.angular import (
     AngularCommitParser,
     AngularParserOptions,
 )
+from semantic_release.commit_parser.cache import CachedCommitParser
 from semantic_release.commit_parser.emoji import (
     EmojiCommitParser,
     EmojiParserOptions,
@@ -1,13 +1,16 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING, Any, Generic, TypeVar
+from typing import TYPE_CHECKING, Any, ClassVar, Generic, Sequence, TypeVar
 
-from semantic_release.commit_parser.token import ParseResultType
+from semantic_release.commit_parser.token import ParsedCommit, ParseResultType
+from semantic_release.commit_parser.util import parse_unique_messages
 
 if TYPE_CHECKING:
     from git.objects.commit import Commit
 
+    from semantic_release.enums import LevelBump
+
 
 class ParserOptions(dict):
     """
@@ -69,6 +72,11 @@ class CommitParser(ABC, Generic[_TT, _OPTS]):
     # TODO: Deprecate in lieu of get_default_options()
     parser_options: type[ParserOptions] = ParserOptions
 
+    # Set by parsers whose parse() only depends upon the commit message, so that
+    # parse_many() only parses each distinct message once. It only applies to the
+    # class which defines parse(), not to subclasses which override it.
+    parse_depends_only_on_message: ClassVar[bool] = False
+
     def __init__(self, options: _OPTS | None = None) -> None:
         self.options: _OPTS = (
             options if options is not None else self.get_default_options()
@@ -82,3 +90,22 @@ class CommitParser(ABC, Generic[_TT, _OPTS]):
 
     @abstractmethod
     def parse(self, commit: Commit) -> _TT: ...
+
+    def parse_many(self, commits: Sequence[Commit]) -> list[_TT]:
+        """
+        Parse each of `commits`, returning the results in the same order. Parsers
+        can override this to parse many commits more efficiently than one at a time.
+        """
+        parse_owner = next(cls for cls in type(self).__mro__ if "parse" in vars(cls))
+        if vars(parse_owner).get("parse_depends_only_on_message", False):
+            return parse_unique_messages(self.parse, commits)  # type: ignore[arg-type,return-value]
+        return [self.parse(commit) for commit in commits]
+
+    def parse_bump(self, commit: Commit) -> LevelBump | None:
+        """
+        Determine only the level bump introduced by `commit`, or None if the commit
+        can't be parsed. This must agree with the bump of the result of `parse`;
+        parsers can override it to skip the work of building the full result.
+        """
+        result = self.parse(commit)
+        return result.bump if isinstance(result, ParsedCommit) else None
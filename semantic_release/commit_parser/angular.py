@@ -65,27 +65,31 @@ class AngularCommitParser(CommitParser[ParseResult, AngularParserOptions]):
     # TODO: Deprecate in lieu of get_default_options()
     parser_options = AngularParserOptions
 
+    parse_depends_only_on_message = True
+
     def __init__(self, options: AngularParserOptions | None = None) -> None:
         super().__init__(options)
-        self.re_parser = re.compile(
-            rf"""
+        header_pattern = rf"""
             (?P<type>{"|".join(self.options.allowed_tags)})  # e.g. feat
             (?:\((?P<scope>[^\n]+)\))?  # or feat(parser)
             (?P<break>!)?:\s+  # breaking if feat!:
             (?P<subject>[^\n]+)  # commit subject
+            """
+        self.re_parser = re.compile(
+            rf"""{header_pattern}
             (:?\n\n(?P<text>.+))?  # commit body
             """,
             flags=re.VERBOSE | re.DOTALL,
         )
+        # Only the header, for when the body is not needed
+        self.re_header = re.compile(header_pattern, flags=re.VERBOSE)
 
     @staticmethod
     def get_default_options() -> AngularParserOptions:
         return AngularParserOptions()
 
-    # Maybe this can be cached as an optimisation, similar to how
-    # mypy/pytest use their own caching directories, for very large commit
-    # histories?
-    # The problem is the cache likely won't be present in CI environments
+    # Results can be persisted between runs by wrapping the parser in a
+    # CachedCommitParser, see semantic_release.commit_parser.cache
     def parse(self, commit: Commit) -> ParseResult:
         """
         Attempt to parse the commit message with a regular expression into a
@@ -114,9 +118,48 @@ class AngularCommitParser(CommitParser[ParseResult, AngularParserOptions]):
             if match
         ]
 
-        if parsed_break or breaking_descriptions:
-            level_bump = LevelBump.MAJOR
+        is_breaking = bool(parsed_break or breaking_descriptions)
+        level_bump = self._level_bump(parsed_type, is_breaking, commit)
+        if is_breaking:
             parsed_type = "breaking"
+
+        return ParsedCommit(
+            bump=level_bump,
+            type=LONG_TYPE_NAMES.get(parsed_type, parsed_type),
+            scope=parsed_scope,
+            descriptions=descriptions,
+            breaking_descriptions=breaking_descriptions,
+            commit=commit,
+        )
+
+    def parse_bump(self, commit: Commit) -> LevelBump | None:
+        """
+        Determine the level bump of the commit from its header, only looking at
+        the body for descriptions of breaking changes when it could contain one
+        """
+        message = str(commit.message)
+        parsed = self.re_header.match(message)
+        if not parsed:
+            log.debug("Unable to parse commit message: %s", message)
+            return None
+
+        # The body as captured by re_parser, which needs at least one character
+        # after the blank line which follows the subject
+        body = message[parsed.end() :]
+        parsed_text = body[2:] if body.startswith("\n\n") and len(body) > 2 else ""
+
+        is_breaking = bool(parsed.group("break")) or (
+            # Carriage returns are removed before the body is split into paragraphs
+            ("BREAKING" in parsed_text or "\r" in parsed_text)
+            and any(breaking_re.match(p) for p in parse_paragraphs(parsed_text))
+        )
+        return self._level_bump(parsed.group("type"), is_breaking, commit)
+
+    def _level_bump(
+        self, parsed_type: str, is_breaking: bool, commit: Commit
+    ) -> LevelBump:
+        if is_breaking:
+            level_bump = LevelBump.MAJOR
         elif parsed_type in self.options.minor_tags:
             level_bump = LevelBump.MINOR
         elif parsed_type in self.options.patch_tags:
@@ -129,12 +172,4 @@ class AngularCommitParser(CommitParser[ParseResult, AngularParserOptions]):
                 level_bump,
             )
         log.debug("commit %s introduces a %s level_bump", commit.hexsha, level_bump)
-
-        return ParsedCommit(
-            bump=level_bump,
-            type=LONG_TYPE_NAMES.get(parsed_type, parsed_type),
-            scope=parsed_scope,
-            descriptions=descriptions,
-            breaking_descriptions=breaking_descriptions,
-            commit=commit,
-        )
+        return level_bump
@@ -0,0 +1,174 @@
+"""
+Persistent on-disk cache of commit parse results, similar to how mypy/pytest use
+their own caching directories.
+
+A commit's parse result only depends upon the (immutable) commit itself and the
+configuration of the parser which parsed it, so results are stored in one file per
+parser configuration and looked up by the commit's SHA. Changing the parser,
+its options or the version of python-semantic-release selects a different file, so
+stale results are never returned. The files only ever contain data derived from
+commits, which makes the directory safe to save & restore between CI runs.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+from dataclasses import asdict, is_dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, Sequence
+
+from semantic_release.commit_parser._base import CommitParser, ParserOptions
+from semantic_release.commit_parser.token import ParsedCommit, ParseError, ParseResult
+from semantic_release.enums import LevelBump
+from semantic_release.helpers import JsonCacheFile, cache_key
+
+if TYPE_CHECKING:
+    from typing import Callable
+
+    from git.objects.commit import Commit
+
+log = logging.getLogger(__name__)
+
+# Bump this whenever the structure of the stored records changes
+CACHE_FORMAT_VERSION = 2
+
+_CacheRecord = Dict[str, Any]
+
+
+def _options_fingerprint(options: ParserOptions) -> str:
+    """Produce a stable string representation of a parser's options"""
+    if is_dataclass(options) and not isinstance(options, type):
+        data: Any = asdict(options)
+    else:
+        # ParserOptions is a dict, but subclasses may (also) store their
+        # options as instance attributes
+        data = {**options, **getattr(options, "__dict__", {})}
+    return json.dumps(data, sort_keys=True, default=str)
+
+
+def _to_record(result: ParseResult) -> _CacheRecord | None:
+    # Subclasses of the result types may carry extra information which we can't
+    # restore faithfully, so we only ever cache the built-in result types
+    if type(result) is ParsedCommit:
+        return {
+            "bump": int(result.bump),
+            "type": result.type,
+            "scope": result.scope,
+            "descriptions": result.descriptions,
+            "breaking_descriptions": result.breaking_descriptions,
+        }
+    if type(result) is ParseError:
+        return {"error": result.error}
+    return None
+
+
+def _from_record(record: _CacheRecord, commit: Commit) -> ParseResult:
+    if "error" in record:
+        return ParseError(commit, error=record["error"])
+    return ParsedCommit(
+        bump=LevelBump(record["bump"]),
+        type=record["type"],
+        scope=record["scope"],
+        descriptions=list(record["descriptions"]),
+        breaking_descriptions=list(record["breaking_descriptions"]),
+        commit=commit,
+    )
+
+
+class CachedCommitParser(CommitParser[ParseResult, ParserOptions]):
+    """
+    Wraps another commit parser, storing its results in ``cache_dir`` so that
+    subsequent runs only need to parse the commits they haven't seen before.
+
+    New results are held in memory until :py:meth:`save` is called.
+    """
+
+    def __init__(
+        self,
+        parser: CommitParser[ParseResult, ParserOptions],
+        cache_dir: Path | str,
+    ) -> None:
+        # Deliberately not calling super().__init__(), the options belong to the
+        # wrapped parser
+        self.parser = parser
+        self.options = parser.options
+        self.cache_dir = Path(cache_dir)
+        self._cache = JsonCacheFile(
+            self.cache_dir, self.cache_file, CACHE_FORMAT_VERSION, "commit parser cache"
+        )
+
+    @property
+    def cache_key(self) -> str:
+        # Deferred to avoid a circular import at module load time
+        from semantic_release import __version__
+
+        parser_cls = type(self.parser)
+        return cache_key(
+            CACHE_FORMAT_VERSION,
+            __version__,
+            f"{parser_cls.__module__}.{parser_cls.__qualname__}",
+            _options_fingerprint(self.options),
+        )
+
+    @property
+    def cache_file(self) -> Path:
+        return self.cache_dir / "commit_parser" / f"{self.cache_key}.json"
+
+    @property
+    def records(self) -> dict[str, _CacheRecord]:
+        return self._cache.entries
+
+    def lookup(self, commit: Commit) -> ParseResult | None:
+        """Return the cached result for `commit`, if there is one"""
+        if (record := self.records.get(commit.hexsha)) is None:
+            return None
+        log.debug("using cached parse result for commit %s", commit.hexsha)
+        return _from_record(record, commit)
+
+    def store(self, commit: Commit, result: ParseResult) -> None:
+        """Cache `result`, which the wrapped parser produced for `commit`"""
+        if (record := _to_record(result)) is not None:
+            self._cache.add(commit.hexsha, record)
+
+    def parse(self, commit: Commit) -> ParseResult:
+        if (result := self.lookup(commit)) is not None:
+            return result
+
+        result = self.parser.parse(commit)
+        self.store(commit, result)
+        return result
+
+    def parse_many(self, commits: Sequence[Commit]) -> list[ParseResult]:
+        return self.parse_many_with(commits, self.parser.parse_many)
+
+    def parse_many_with(
+        self,
+        commits: Sequence[Commit],
+        parse_uncached: Callable[[Sequence[Commit]], list[ParseResult]],
+    ) -> list[ParseResult]:
+        """
+        Like :py:meth:`parse_many`, but the commits which aren't in the cache are
+        parsed by calling `parse_uncached` with them, rather than by the wrapped
+        parser's own `parse_many`
+        """
+        cached = {
+            commit.hexsha: result
+            for commit in commits
+            if (result := self.lookup(commit)) is not None
+        }
+        uncached = [commit for commit in commits if commit.hexsha not in cached]
+        for commit, result in zip(uncached, parse_uncached(uncached)):
+            self.store(commit, result)
+            cached[commit.hexsha] = result
+        return [cached[commit.hexsha] for commit in commits]
+
+    def parse_bump(self, commit: Commit) -> LevelBump | None:
+        if (result := self.lookup(commit)) is not None:
+            return result.bump if isinstance(result, ParsedCommit) else None
+        # Not cached, as the full result hasn't been built
+        return self.parser.parse_bump(commit)
+
+    def save(self) -> None:
+        """Persist any results which were not previously in the cache"""
+        self._cache.save()
@@ -60,6 +60,8 @@ class EmojiCommitParser(CommitParser[ParseResult, EmojiParserOptions]):
     # TODO: Deprecate in lieu of get_default_options()
     parser_options = EmojiParserOptions
 
+    parse_depends_only_on_message = True
+
     @staticmethod
     def get_default_options() -> EmojiParserOptions:
         return EmojiParserOptions()
@@ -0,0 +1,137 @@
+"""
+Parse many commits at once, spreading the work over a pool of worker processes.
+
+Parsing a commit is pure computation on its message, so for long histories the
+commits can be parsed independently of each other. Commits are sent to the
+workers as :py:class:`semantic_release.gitlog.CommitRecord` copies which don't
+reference the repository, and each result is given back its original commit once
+it has been returned, so the results are the same as parsing serially.
+
+The parser must be picklable for it to be sent to the workers; if it isn't, or
+anything else goes wrong in the pool, the commits are parsed serially instead.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain
+from typing import TYPE_CHECKING, Sequence
+
+from semantic_release.commit_parser.cache import CachedCommitParser
+from semantic_release.gitlog import CommitRecord
+
+if TYPE_CHECKING:
+    from git.objects.commit import Commit
+
+    from semantic_release.commit_parser._base import CommitParser, ParserOptions
+    from semantic_release.commit_parser.token import ParseResult
+
+log = logging.getLogger(__name__)
+
+# Starting a worker process costs more than parsing a few commits, so each worker
+# should be given at least this many commits to parse
+MIN_COMMITS_PER_WORKER = 250
+
+# Each worker is sent its commits in several chunks, to keep the workers busy
+# when some messages take longer to parse than others
+CHUNKS_PER_WORKER = 4
+
+# The parser used by a worker process, set by `_init_worker`
+_worker_parser: CommitParser[ParseResult, ParserOptions] | None = None
+
+
+def _init_worker(pickled_parser: bytes) -> None:
+    global _worker_parser  # noqa: PLW0603
+    _worker_parser = pickle.loads(pickled_parser)  # noqa: S301
+
+
+def _parse_chunk(commits: list[CommitRecord]) -> list[ParseResult]:
+    if _worker_parser is None:
+        raise RuntimeError("worker process has not been initialized")
+    return _worker_parser.parse_many(commits)  # type: ignore[arg-type]
+
+
+def _with_commit(result: ParseResult, commit: Commit) -> ParseResult:
+    """Replace the copy of the commit in a result from a worker with `commit`"""
+    if "commit" not in getattr(result, "_fields", ()):
+        raise TypeError(
+            f"can't restore the commit of a parse result of type {type(result)}"
+        )
+    return result._replace(commit=commit)
+
+
+def _parse_in_pool(
+    parser: CommitParser[ParseResult, ParserOptions],
+    commits: Sequence[Commit],
+    workers: int,
+) -> list[ParseResult] | None:
+    """
+    Parse `commits` in a pool of `workers` processes, returning None if they
+    can't be parsed this way
+    """
+    try:
+        pickled_parser = pickle.dumps(parser)
+    except Exception as err:  # noqa: BLE001
+        log.info(
+            "%s can't be sent to worker processes; parsing commits serially",
+            type(parser).__qualname__,
+        )
+        log.debug("stack trace", exc_info=err)
+        return None
+
+    records = [CommitRecord.from_commit(commit) for commit in commits]
+    chunk_size = -(-len(records) // (workers * CHUNKS_PER_WORKER))
+    chunks = [
+        records[start : start + chunk_size]
+        for start in range(0, len(records), chunk_size)
+    ]
+
+    log.info("parsing %s commits in %s worker processes", len(records), workers)
+    try:
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_worker,
+            initargs=(pickled_parser,),
+        ) as pool:
+            results = list(chain.from_iterable(pool.map(_parse_chunk, chunks)))
+        return [_with_commit(res, commit) for res, commit in zip(results, commits)]
+    except Exception as err:  # noqa: BLE001
+        log.warning(
+            "Failed to parse commits in worker processes, parsing serially instead"
+        )
+        log.debug("stack trace", exc_info=err)
+        return None
+
+
+def parse_commits(
+    parser: CommitParser[ParseResult, ParserOptions],
+    commits: Sequence[Commit],
+    workers: int = 1,
+) -> list[ParseResult]:
+    """
+    Parse each of `commits` with `parser`, returning the results in the same order.
+
+    Up to `workers` processes are used to parse the commits (0 meaning one per
+    CPU), though fewer are used for short histories where starting the processes
+    would take longer than parsing the commits.
+    """
+    if isinstance(parser, CachedCommitParser):
+        # Only the commits which aren't already in the cache need to be parsed,
+        # and the cache must be updated in this process
+        return parser.parse_many_with(
+            commits, lambda uncached: parse_commits(parser.parser, uncached, workers)
+        )
+
+    workers = min(
+        workers or os.cpu_count() or 1,
+        len(commits) // MIN_COMMITS_PER_WORKER,
+    )
+    if workers > 1 and (
+        (results := _parse_in_pool(parser, commits, workers)) is not None
+    ):
+        return results
+
+    return parser.parse_many(commits)
@@ -123,6 +123,8 @@ class ScipyCommitParser(CommitParser[ParseResult, ScipyParserOptions]):
     # TODO: Deprecate in lieu of get_default_options()
     parser_options = ScipyParserOptions
 
+    parse_depends_only_on_message = True
+
     def __init__(self, options: ScipyParserOptions | None = None) -> None:
         super().__init__(options)
         self.re_parser = re.compile(
@@ -37,6 +37,8 @@ class TagCommitParser(CommitParser[ParseResult, TagParserOptions]):
     # TODO: Deprecate in lieu of get_default_options()
     parser_options = TagParserOptions
 
+    parse_depends_only_on_message = True
+
     @staticmethod
     def get_default_options() -> TagParserOptions:
         return TagParserOptions()
@@ -1,6 +1,14 @@
 from __future__ import annotations
 
 import re
+from typing import TYPE_CHECKING, Callable, Iterable
+
+from semantic_release.commit_parser.token import ParsedCommit
+
+if TYPE_CHECKING:
+    from git.objects.commit import Commit
+
+    from semantic_release.commit_parser.token import ParseResult
 
 breaking_re = re.compile(r"BREAKING[ -]CHANGE:\s?(.*)")
 
@@ -25,3 +33,32 @@ def parse_paragraphs(text: str) -> list[str]:
             ],
         )
     )
+
+
+def parse_unique_messages(
+    parse: Callable[[Commit], ParseResult], commits: Iterable[Commit]
+) -> list[ParseResult]:
+    """
+    Parse each of `commits` with `parse`, which must only depend upon the message
+    of the commit, parsing each distinct message just once. Commits often share a
+    message, e.g. reverts, cherry-picks and commits made by bots.
+
+    The results for commits with the same message are copies of each other, with
+    their own commit and lists of descriptions.
+    """
+    parsed: dict[str, ParseResult] = {}
+    results: list[ParseResult] = []
+    for commit in commits:
+        message = str(commit.message)
+        if (result := parsed.get(message)) is None:
+            result = parsed[message] = parse(commit)
+        elif isinstance(result, ParsedCommit):
+            result = result._replace(
+                commit=commit,
+                descriptions=list(result.descriptions),
+                breaking_descriptions=list(result.breaking_descriptions),
+            )
+        else:
+            result = result._replace(commit=commit)
+        results.append(result)
+    return results
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from enum import IntEnum, unique
+from enum import Enum, IntEnum, unique
 
 
 @unique
@@ -37,3 +37,16 @@ class LevelBump(IntEnum):
         >>> LevelBump.from_string("minor") == LevelBump.MINOR
         """
         return cls[val.upper().replace("-", "_")]
+
+
+@unique
+class HistoryBackend(str, Enum):
+    """
+    The mechanism used to read the commits of a repository's history.
+
+    ``GITPYTHON`` walks the history with GitPython's ``Repo.iter_commits``, while
+    ``GIT_LOG`` reads the commits from the output of a single ``git log`` process.
+    """
+
+    GITPYTHON = "gitpython"
+    GIT_LOG = "git-log"
@@ -0,0 +1,400 @@
+"""
+Read the history of a repository from the output of single git commands.
+
+``Repo.iter_commits`` yields lazy :py:class:`git.objects.commit.Commit` objects, which
+read their data from GitPython's ``cat-file`` helper process, one round-trip for each
+commit. For long histories it is much faster to ask ``git log`` for the commit data we
+need in one go, and parse it from the output stream as it arrives. Likewise,
+``git for-each-ref`` can filter the tags of a repository before they reach Python.
+"""
+
+from __future__ import annotations
+
+import logging
+from datetime import datetime, timedelta, timezone
+from functools import partial
+from typing import TYPE_CHECKING, Any, Iterator
+
+from git.objects.commit import Commit
+from git.objects.util import from_timestamp, utctz_to_altz
+from git.refs.tag import TagReference
+from git.util import Actor, finalize_process, hex_to_bin
+
+if TYPE_CHECKING:
+    from subprocess import Popen
+
+    from git.repo.base import Repo
+
+log = logging.getLogger(__name__)
+
+# Fields are separated by the ASCII unit separator, commits by a NUL byte (-z). The
+# message must be the last field as it is the only one which may contain the separator
+_FIELD_SEP = "\x1f"
+_LOG_FORMAT = str.join(
+    "%x1f",
+    [
+        "%H",  # commit hash
+        "%P",  # parent hashes
+        "%an",  # author name
+        "%ae",  # author email
+        "%ad",  # author date
+        "%cn",  # committer name
+        "%ce",  # committer email
+        "%cd",  # committer date
+        "%B",  # raw message
+    ],
+)
+_REF_FORMAT = str.join(
+    "%1f",
+    [
+        "%(refname)",
+        "%(objecttype)",
+        "%(objectname)",
+        "%(*objecttype)",  # type of the object an annotated tag points to
+        "%(*objectname)",  # sha of the object an annotated tag points to
+        "%(taggername)",
+        "%(taggeremail)",
+        "%(taggerdate:raw)",
+        "%(authorname)",
+        "%(authoremail)",
+        "%(authordate:raw)",
+        "%(committerdate:raw)",
+    ],
+)
+_READ_CHUNK_SIZE = 64 * 1024
+
+
+def _parse_raw_date(raw_date: str) -> tuple[int, int]:
+    """Parse a date in git's raw format (``<timestamp> <+/-hhmm>``)"""
+    timestamp, utctz = raw_date.split(" ")
+    return int(timestamp), utctz_to_altz(utctz)
+
+
+def _to_datetime(timestamp: int, tz_offset: int) -> datetime:
+    """Create an aware datetime from a timestamp & a GitPython style tz offset"""
+    return datetime.fromtimestamp(timestamp, tz=timezone(timedelta(seconds=-tz_offset)))
+
+
+class CommitRecord:
+    """
+    A lightweight, read-only stand-in for :py:class:`git.objects.commit.Commit`,
+    offering the attributes of a commit that are used by the commit parsers and
+    changelog templates.
+
+    Any other attribute of a ``Commit`` (e.g. ``tree`` or ``stats``) is read from
+    the full commit, which is only loaded from the repository when one is needed.
+    """
+
+    __slots__ = (
+        "repo",
+        "hexsha",
+        "parent_shas",
+        "author",
+        "authored_date",
+        "author_tz_offset",
+        "committer",
+        "committed_date",
+        "committer_tz_offset",
+        "message",
+        "_commit",
+    )
+
+    def __init__(
+        self,
+        repo: Repo,
+        hexsha: str,
+        parent_shas: tuple[str, ...],
+        author: Actor,
+        authored_date: int,
+        author_tz_offset: int,
+        committer: Actor,
+        committed_date: int,
+        committer_tz_offset: int,
+        message: str,
+    ) -> None:
+        self.repo = repo
+        self.hexsha = hexsha
+        self.parent_shas = parent_shas
+        self.author = author
+        self.authored_date = authored_date
+        self.author_tz_offset = author_tz_offset
+        self.committer = committer
+        self.committed_date = committed_date
+        self.committer_tz_offset = committer_tz_offset
+        self.message = message
+        self._commit: Commit | None = None
+
+    @classmethod
+    def from_log_record(cls, repo: Repo, record: bytes) -> CommitRecord:
+        """Create a record from a single commit in the output of ``git log``"""
+        (
+            hexsha,
+            parents,
+            author_name,
+            author_email,
+            author_date,
+            committer_name,
+            committer_email,
+            committer_date,
+            message,
+        ) = record.decode("utf-8", errors="replace").split(_FIELD_SEP, 8)
+
+        authored_date, author_tz_offset = _parse_raw_date(author_date)
+        committed_date, committer_tz_offset = _parse_raw_date(committer_date)
+
+        return cls(
+            repo=repo,
+            hexsha=hexsha,
+            parent_shas=tuple(parents.split()),
+            author=Actor(author_name, author_email),
+            authored_date=authored_date,
+            author_tz_offset=author_tz_offset,
+            committer=Actor(committer_name, committer_email),
+            committed_date=committed_date,
+            committer_tz_offset=committer_tz_offset,
+            message=message,
+        )
+
+    @classmethod
+    def from_commit(
+        cls, commit: Commit | CommitRecord, repo: Repo | None = None
+    ) -> CommitRecord:
+        """
+        Copy the data of `commit` into a new record belonging to `repo`. Without a
+        repo the record can be pickled, e.g. to send it to another process.
+        """
+        parent_shas = (
+            commit.parent_shas
+            if isinstance(commit, CommitRecord)
+            else tuple(parent.hexsha for parent in commit.parents)
+        )
+        return cls(
+            repo=repo,  # type: ignore[arg-type]
+            hexsha=commit.hexsha,
+            parent_shas=parent_shas,
+            author=commit.author,
+            authored_date=commit.authored_date,
+            author_tz_offset=int(commit.author_tz_offset),
+            committer=commit.committer,
+            committed_date=commit.committed_date,
+            committer_tz_offset=int(commit.committer_tz_offset),
+            message=(
+                commit.message
+                if isinstance(commit.message, str)
+                else commit.message.decode("utf-8", errors="replace")
+            ),
+        )
+
+    def to_commit(self) -> Commit:
+        """
+        A GitPython ``Commit`` with the data of this record, so that it doesn't need
+        to be read from the repository again. Anything else, such as the tree, is
+        loaded when it is first used, as usual.
+        """
+        return Commit(
+            self.repo,
+            self.binsha,
+            author=self.author,
+            authored_date=self.authored_date,
+            author_tz_offset=self.author_tz_offset,
+            committer=self.committer,
+            committed_date=self.committed_date,
+            committer_tz_offset=self.committer_tz_offset,
+            message=self.message,
+            parents=self.parents,
+        )
+
+    def __getattr__(self, name: str) -> Any:
+        # Only called for attributes the record doesn't have. The slots are
+        # excluded as they may not be set yet, e.g. while unpickling
+        if name.startswith("_") or name in CommitRecord.__slots__ or self.repo is None:
+            raise AttributeError(
+                f"{type(self).__qualname__!r} object has no attribute {name!r}"
+            )
+        if self._commit is None:
+            log.debug("loading commit %s to read its %s", self.hexsha, name)
+            self._commit = Commit(self.repo, self.binsha)
+        return getattr(self._commit, name)
+
+    @property
+    def binsha(self) -> bytes:
+        return hex_to_bin(self.hexsha)
+
+    @property
+    def parents(self) -> tuple[Commit, ...]:
+        return tuple(Commit(self.repo, hex_to_bin(sha)) for sha in self.parent_shas)
+
+    @property
+    def summary(self) -> str:
+        return self.message.split("\n", 1)[0]
+
+    @property
+    def authored_datetime(self) -> datetime:
+        return from_timestamp(self.authored_date, self.author_tz_offset)
+
+    @property
+    def committed_datetime(self) -> datetime:
+        return from_timestamp(self.committed_date, self.committer_tz_offset)
+
+    def __eq__(self, other: object) -> bool:
+        if not hasattr(other, "hexsha"):
+            return NotImplemented
+        return self.hexsha == other.hexsha
+
+    def __hash__(self) -> int:
+        return hash(self.hexsha)
+
+    def __str__(self) -> str:
+        return self.hexsha
+
+    def __repr__(self) -> str:
+        return f'<{type(self).__qualname__} "{self.hexsha}">'
+
+
+def iter_commit_records(
+    repo: Repo, rev: str | None = None, **kwargs: Any
+) -> Iterator[CommitRecord]:
+    """
+    Walk the commits of `rev` (default ``HEAD``) like ``Repo.iter_commits``, reading
+    the data of every commit from the output of a single ``git log`` process.
+
+    Any keyword arguments are passed to ``git log`` as options, e.g.
+    ``topo_order=True`` for ``--topo-order``.
+    """
+    log.debug("streaming commits of %s from git log", rev or "HEAD")
+    proc = repo.git.log(
+        rev or "HEAD",
+        "--",
+        as_process=True,
+        z=True,
+        format=_LOG_FORMAT,
+        date="raw",
+        encoding="UTF-8",
+        no_color=True,
+        no_show_signature=True,
+        **kwargs,
+    )
+
+    try:
+        buffer = b""
+        for chunk in iter(partial(proc.stdout.read, _READ_CHUNK_SIZE), b""):
+            *records, buffer = (buffer + chunk).split(b"\0")
+            for record in records:
+                yield CommitRecord.from_log_record(repo, record)
+
+        if buffer:
+            yield CommitRecord.from_log_record(repo, buffer)
+
+        finalize_process(proc)
+    finally:
+        # The caller may stop reading early, in which case git log is stopped here
+        # rather than whenever the process object happens to be garbage collected
+        if proc.proc is not None:
+            _stop_process(proc.proc)
+
+
+def _stop_process(proc: Popen) -> None:
+    if proc.poll() is None:
+        proc.kill()
+    for stream in (proc.stdout, proc.stderr):
+        if stream is not None:
+            stream.close()
+    proc.wait()
+
+
+class TagRecord(TagReference):
+    """
+    A tag reference for which the sha of the tagged commit and the tag's metadata
+    have already been read from the output of ``git for-each-ref``, so that they
+    don't need to be looked up in the object database for each tag.
+
+    For annotated tags the metadata is that of the tagger, otherwise it is taken
+    from the author of the tagged commit.
+    """
+
+    __slots__ = ("commit_sha", "tagger", "tagged_date", "_committer")
+
+    def __init__(
+        self,
+        repo: Repo,
+        path: str,
+        commit_sha: str,
+        tagger: Actor,
+        tagged_date: datetime,
+        committer: Actor | None = None,
+    ) -> None:
+        super().__init__(repo, path)
+        self.commit_sha = commit_sha
+        self.tagger = tagger
+        self.tagged_date = tagged_date
+        self._committer = committer
+
+    @property  # type: ignore[misc]
+    def commit(self) -> Commit:
+        return Commit(self.repo, hex_to_bin(self.commit_sha))
+
+    @property
+    def committer(self) -> Actor:
+        # Annotated tags historically report the configured committer
+        return self._committer or Actor.committer()
+
+    @classmethod
+    def from_ref_record(cls, repo: Repo, record: str) -> TagReference:
+        """
+        Create a record from a single line in the output of ``git for-each-ref``.
+        Tags which aren't simple lightweight or annotated tags of a commit are
+        returned as a plain `TagReference`, which resolves its target lazily.
+        """
+        (
+            refname,
+            object_type,
+            object_sha,
+            peeled_type,
+            peeled_sha,
+            tagger_name,
+            tagger_email,
+            tagger_date,
+            author_name,
+            author_email,
+            author_date,
+            committer_date,
+        ) = record.split(_FIELD_SEP)
+
+        if object_type == "commit":
+            # Lightweight tags use the author of the commit, but its commit date
+            author = Actor(author_name, author_email.strip("<>"))
+            committed_date, _ = _parse_raw_date(committer_date)
+            _, author_tz_offset = _parse_raw_date(author_date)
+            return cls(
+                repo=repo,
+                path=refname,
+                commit_sha=object_sha,
+                tagger=author,
+                tagged_date=_to_datetime(committed_date, author_tz_offset),
+                committer=author,
+            )
+
+        if object_type == "tag" and peeled_type == "commit" and tagger_date:
+            tagged_date, tagger_tz_offset = _parse_raw_date(tagger_date)
+            return cls(
+                repo=repo,
+                path=refname,
+                commit_sha=peeled_sha,
+                tagger=Actor(tagger_name, tagger_email.strip("<>")),
+                tagged_date=_to_datetime(tagged_date, tagger_tz_offset),
+            )
+
+        log.debug("tag %s doesn't directly tag a commit, reading it lazily", refname)
+        return TagReference(repo, refname)
+
+
+def iter_tag_refs(repo: Repo, pattern: str = "refs/tags/") -> Iterator[TagReference]:
+    """
+    Yield the tags of `repo` whose refs match `pattern`, as understood by
+    ``git for-each-ref``, without enumerating the others. The tagged commit and
+    tag metadata of all of the tags are read by the same command; see `TagRecord`.
+    """
+    log.debug("listing tags matching %s", pattern)
+    records = repo.git.for_each_ref(pattern, format=_REF_FORMAT)
+    for record in records.splitlines():
+        yield TagRecord.from_ref_record(repo, record)
@@ -5,6 +5,7 @@ from __future__ import annotations
 from contextlib import nullcontext
 from logging import getLogger
 from pathlib import Path
+from tempfile import TemporaryFile
 from typing import TYPE_CHECKING
 
 from git import GitCommandError, Repo
@@ -22,7 +23,7 @@ from semantic_release.errors import (
 if TYPE_CHECKING:
     from contextlib import _GeneratorContextManager
     from logging import Logger
-    from typing import Sequence
+    from typing import Mapping, Sequence
 
     from git import Actor
 
@@ -33,8 +34,10 @@ class GitProject:
         directory: Path | str = ".",
         commit_author: Actor | None = None,
         credential_masker: MaskingFilter | None = None,
+        repo: Repo | None = None,
     ) -> None:
         self._project_root = Path(directory).resolve()
+        self._repo = repo
         self._logger = getLogger(__name__)
         self._cred_masker = credential_masker or MaskingFilter()
         self._commit_author = commit_author
@@ -47,6 +50,17 @@ class GitProject:
     def logger(self) -> Logger:
         return self._logger
 
+    def _open_repo(self) -> nullcontext[Repo] | Repo:
+        """
+        The repository this project was given, which is left open for its owner to
+        close, otherwise a newly opened repository to be used as a context manager
+        """
+        return (
+            nullcontext(self._repo)
+            if self._repo is not None
+            else Repo(str(self.project_root))
+        )
+
     def _get_custom_environment(
         self, repo: Repo
     ) -> nullcontext[None] | _GeneratorContextManager[None]:
@@ -68,7 +82,7 @@ class GitProject:
         )
 
     def is_dirty(self) -> bool:
-        with Repo(str(self.project_root)) as repo:
+        with self._open_repo() as repo:
             return repo.is_dirty()
 
     def git_add(
@@ -98,11 +112,22 @@ class GitProject:
             )
         )
 
-        with Repo(str(self.project_root)) as repo:
-            # TODO: in future this loop should be 1 line:
-            # repo.index.add(all_paths_to_add, force=False)  # noqa: ERA001
-            # but since 'force' is deliberately ineffective (as in docstring) in gitpython 3.1.18
-            # we have to do manually add each filepath, and catch the exception if it is an ignored file
+        if not paths:
+            return
+
+        with self._open_repo() as repo:
+            # Stage every path with a single command, so the index is only read &
+            # written once. 'force' is deliberately ineffective (as in docstring) for
+            # repo.index.add() in gitpython 3.1.18, so the git command is used instead
+            try:
+                repo.git.add(*[str(Path(p)) for p in paths], **git_args)
+            except GitCommandError as err:
+                self.logger.debug("Failed to add all paths at once: %s", err)
+            else:
+                return
+
+            # Add each filepath separately to find out which of them failed, e.g.
+            # because it is an ignored file
             for updated_path in paths:
                 try:
                     repo.git.add(str(Path(updated_path)), **git_args)
@@ -120,7 +145,16 @@ class GitProject:
         commit_all: bool = False,
         no_verify: bool = False,
         noop: bool = False,
+        paths: Sequence[Path | str] = (),
     ) -> None:
+        """
+        Commit the staged changes, raising GitCommitEmptyIndexError if there are
+        none. If `paths` are given, changes to these paths are looked for first,
+        and the rest of the index is only compared against HEAD when none of them
+        changed; `git commit` always records the whole index, so changes staged by
+        other means (e.g. the build command) still make a commit. The working tree
+        is only checked for changes when `commit_all` is set.
+        """
         git_args = dict(
             filter(
                 lambda k_v: k_v[1],  # if truthy
@@ -165,11 +199,12 @@ class GitProject:
             )
             return
 
-        with Repo(str(self.project_root)) as repo:
-            has_index_changes = bool(repo.index.diff("HEAD"))
-            has_working_changes = self.is_dirty()
-            will_commit_files = has_index_changes or (
-                has_working_changes and commit_all
+        with self._open_repo() as repo:
+            will_commit_files = (
+                bool(repo.index.diff("HEAD")) or repo.is_dirty()
+                if commit_all
+                else self._has_staged_changes(repo, paths)
+                or (bool(paths) and self._has_staged_changes(repo))
             )
 
             if not will_commit_files:
@@ -182,6 +217,19 @@ class GitProject:
                     self.logger.exception(str(err))
                     raise GitCommitError("Failed to commit changes") from err
 
+    @staticmethod
+    def _has_staged_changes(repo: Repo, paths: Sequence[Path | str] = ()) -> bool:
+        # git diff --quiet exits with 1 if there are differences
+        status, _, _ = repo.git.diff(
+            "--cached",
+            "--quiet",
+            "--",
+            *[str(Path(p)) for p in paths],
+            with_extended_output=True,
+            with_exceptions=False,
+        )
+        return status != 0
+
     def git_tag(self, tag_name: str, message: str, noop: bool = False) -> None:
         if noop:
             command = (
@@ -206,13 +254,166 @@ class GitProject:
             )
             return
 
-        with Repo(str(self.project_root)) as repo, self._get_custom_environment(repo):
+        with self._open_repo() as repo, self._get_custom_environment(repo):
             try:
                 repo.git.tag("-a", tag_name, m=message)
             except GitCommandError as err:
                 self.logger.exception(str(err))
                 raise GitTagError(f"Failed to create tag ({tag_name})") from err
 
+    def git_tags(
+        self, tags: Mapping[str, str], ref: str = "HEAD", noop: bool = False
+    ) -> None:
+        """
+        Create an annotated tag of `ref` for each tag name & message in `tags`.
+
+        The tag objects are written with ``git mktag`` and the tag refs are all
+        created in a single ``git update-ref --stdin`` transaction, so either all of
+        the tags are created or none of them are.
+
+        Signed tags can only be created one at a time with ``git tag``, so when
+        ``tag.gpgSign`` or ``tag.forceSignAnnotated`` is set the tags which were
+        already created are deleted again if creating any of the others fails.
+        """
+        if not tags:
+            return
+
+        if noop:
+            commands = str.join(
+                "\n" + " " * 24,
+                [f"git tag -a {name} -m '{message}'" for name, message in tags.items()],
+            )
+            noop_report(
+                indented(
+                    f"""\
+                    would have run, in a single ref transaction:
+                        {commands}
+                    """
+                )
+            )
+            return
+
+        with self._open_repo() as repo, self._get_custom_environment(repo):
+            config = repo.config_reader()
+            sign_tags = config.get_value("tag", "gpgSign", False) or config.get_value(
+                "tag", "forceSignAnnotated", False
+            )
+            try:
+                if sign_tags:
+                    self._create_signed_tags(repo, tags, ref)
+                else:
+                    self._create_tag_refs(repo, tags, ref)
+            except (GitCommandError, ValueError) as err:
+                self.logger.exception(str(err))
+                raise GitTagError(
+                    f"Failed to create tags ({str.join(', ', tags)})"
+                ) from err
+
+    def _create_signed_tags(
+        self, repo: Repo, tags: Mapping[str, str], ref: str
+    ) -> None:
+        target = repo.commit(ref).hexsha
+        created: list[str] = []
+        try:
+            for name, message in tags.items():
+                repo.git.tag("-a", name, target, m=message)
+                created.append(name)
+        except GitCommandError:
+            if created:
+                try:
+                    repo.git.tag("-d", *created)
+                except GitCommandError:
+                    # Logged rather than raised, so the reason the tags couldn't be
+                    # created isn't hidden
+                    self.logger.exception(
+                        "Failed to delete tags (%s)", str.join(", ", created)
+                    )
+            raise
+
+    @staticmethod
+    def _create_tag_refs(repo: Repo, tags: Mapping[str, str], ref: str) -> None:
+        target = repo.commit(ref).hexsha
+        # Includes the date, in the same format as in the tag object
+        tagger = repo.git.var("GIT_COMMITTER_IDENT")
+
+        updates = []
+        for name, message in tags.items():
+            # Fail before writing any objects if the name isn't a valid tag name
+            repo.git.check_ref_format(f"refs/tags/{name}")
+            data = str.join(
+                "\n",
+                [
+                    f"object {target}",
+                    "type commit",
+                    f"tag {name}",
+                    f"tagger {tagger}",
+                    "",
+                    message.rstrip("\n") + "\n",
+                ],
+            )
+            with TemporaryFile() as stdin:
+                stdin.write(data.encode("utf-8"))
+                stdin.seek(0)
+                # git mktag validates the tag object before writing it
+                tag_sha = repo.git.mktag(istream=stdin)
+            # 'create' fails if the tag already exists
+            updates.append(f"create refs/tags/{name} {tag_sha}\n")
+
+        with TemporaryFile() as stdin:
+            stdin.write(str.join("", updates).encode("utf-8"))
+            stdin.seek(0)
+            repo.git.update_ref("--stdin", istream=stdin)
+
+    def git_push(
+        self,
+        remote_url: str,
+        branch: str | None = None,
+        tags: Sequence[str] = (),
+        noop: bool = False,
+    ) -> None:
+        """
+        Push `branch` and `tags` to the remote in a single atomic push, so either
+        all of them or none of them are updated on the remote. Only if the remote
+        doesn't support atomic pushes at all are they pushed without `--atomic`;
+        any other rejection raises GitPushError.
+        """
+        refspecs = [
+            *([branch] if branch else []),
+            *(f"refs/tags/{tag}" for tag in tags),
+        ]
+        if not refspecs:
+            return
+
+        if noop:
+            noop_report(
+                indented(
+                    f"""\
+                    would have run:
+                        git push --atomic {self._cred_masker.mask(remote_url)} {str.join(" ", refspecs)}
+                    """  # noqa: E501
+                )
+            )
+            return
+
+        with self._open_repo() as repo:
+            try:
+                try:
+                    repo.git.push("--atomic", remote_url, *refspecs)
+                except GitCommandError as err:
+                    # Other failures also mention "atomic push failure", and
+                    # retrying them would leave the remote partially updated
+                    if "does not support --atomic push" not in str(err.stderr):
+                        raise
+                    self.logger.warning(
+                        "Atomic push not supported by the remote, pushing without it"
+                    )
+                    repo.git.push(remote_url, *refspecs)
+            except GitCommandError as err:
+                self.logger.exception(str(err))
+                raise GitPushError(
+                    f"Failed to push ({str.join(', ', refspecs)}) to remote"
+                ) from err
+
     def git_push_branch(self, remote_url: str, branch: str, noop: bool = False) -> None:
         if noop:
             noop_report(
@@ -225,7 +426,7 @@ class GitProject:
             )
             return
 
-        with Repo(str(self.project_root)) as repo:
+        with self._open_repo() as repo:
             try:
                 repo.git.push(remote_url, branch)
             except GitCommandError as err:
@@ -246,7 +447,7 @@ class GitProject:
             )
             return
 
-        with Repo(str(self.project_root)) as repo:
+        with self._open_repo() as repo:
             try:
                 repo.git.push(remote_url, "tag", tag)
             except GitCommandError as err:
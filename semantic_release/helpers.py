@@ -1,10 +1,19 @@
+from __future__ import annotations
+
+import hashlib
 import importlib
+import json
 import logging
+import os
 import re
+import secrets
+import shutil
 import string
+import tempfile
+from contextlib import suppress
 from functools import lru_cache, wraps
-from pathlib import PurePosixPath
-from typing import Any, Callable, NamedTuple, TypeVar
+from pathlib import Path, PurePosixPath
+from typing import Any, Callable, Iterable, NamedTuple, TypeVar
 from urllib.parse import urlsplit
 
 log = logging.getLogger(__name__)
@@ -164,3 +173,195 @@ def parse_git_url(url: str) -> ParsedGitUrl:
         namespace=namespace,
         repo_name=name,
     )
+
+
+CACHEDIR_TAG = """\
+Signature: 8a477f597d28d172789f06886806bc55
+# This file is a cache directory tag created by python-semantic-release.
+# For information about cache directory tags, see:
+#	https://bford.info/cachedir/spec.html
+"""
+
+
+def prepare_cache_dir(cache_dir: Path) -> Path:
+    """
+    Create ``cache_dir`` if it doesn't exist yet, in the same way as pytest & mypy
+    create theirs: the directory ignores itself for git, and is tagged so that backup
+    tools skip it. Returns the directory for convenience.
+    """
+    if not cache_dir.exists():
+        log.debug("creating cache directory %s", cache_dir)
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        (cache_dir / ".gitignore").write_text(
+            "# Created by python-semantic-release automatically.\n*\n",
+            encoding="utf-8",
+        )
+        (cache_dir / "CACHEDIR.TAG").write_text(CACHEDIR_TAG, encoding="utf-8")
+    return cache_dir
+
+
+def cache_key(*parts: Any) -> str:
+    """A short, stable hash of ``parts``, to name the file of a cache after"""
+    data = json.dumps(parts, sort_keys=True, default=str)
+    return hashlib.sha256(data.encode("utf-8")).hexdigest()[:32]
+
+
+class JsonCacheFile:
+    """
+    A JSON file in ``cache_dir`` which maps keys to cached entries, read when the
+    entries are first used. New entries are held in memory until :py:meth:`save`
+    is called. A file which can't be read is treated as empty and a failure to
+    write it is only logged, as the cache must never fail a run.
+    """
+
+    def __init__(
+        self, cache_dir: Path, path: Path, version: int, description: str
+    ) -> None:
+        self.cache_dir = cache_dir
+        self.path = path
+        self.version = version
+        self.description = description
+        self._entries: dict[str, Any] | None = None
+        self._new_entries: dict[str, Any] = {}
+
+    @property
+    def entries(self) -> dict[str, Any]:
+        if self._entries is None:
+            self._entries = self._read()
+            log.debug(
+                "loaded %s entries of the %s from %s",
+                len(self._entries),
+                self.description,
+                self.path,
+            )
+        return self._entries
+
+    def add(self, key: str, entry: Any) -> None:
+        self.entries[key] = entry
+        self._new_entries[key] = entry
+
+    def _read(self) -> dict[str, Any]:
+        try:
+            content = json.loads(self.path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as err:
+            log.warning("Ignoring unreadable %s %s", self.description, self.path)
+            log.debug("stack trace", exc_info=err)
+            return {}
+
+        if (
+            not isinstance(content, dict)
+            or content.get("version") != self.version
+            or not isinstance(content.get("entries"), dict)
+        ):
+            log.debug("Ignoring %s with an unexpected format", self.description)
+            return {}
+
+        return content["entries"]
+
+    def save(self) -> None:
+        """Persist any entries which were not previously in the file"""
+        if not self._new_entries:
+            return
+
+        # Re-read the file in case another process has written to it since we did
+        entries = {**self._read(), **self._new_entries}
+
+        log.debug(
+            "writing %s new entries of the %s to %s",
+            len(self._new_entries),
+            self.description,
+            self.path,
+        )
+        try:
+            prepare_cache_dir(self.cache_dir)
+            write_text_atomic(
+                self.path, json.dumps({"version": self.version, "entries": entries})
+            )
+        except OSError as err:
+            # Not fatal, the entries will be produced again next time
+            log.warning("Failed to write %s %s", self.description, self.path)
+            log.debug("stack trace", exc_info=err)
+        self._new_entries.clear()
+
+
+def write_text_atomic(path: Path, text: str) -> None:
+    """
+    Write ``text`` to ``path`` via a temporary file in the same directory, so that
+    a concurrent reader (or an interrupted run) never sees a partially written file.
+    """
+    write_chunks_atomic(path, (text,))
+
+
+def _create_temp_file(directory: Path, prefix: str) -> tuple[int, str]:
+    """
+    Like :py:func:`tempfile.mkstemp`, but the file is created with the usual
+    permissions of a new file (0o666 less the umask), rather than only being
+    accessible to the current user
+    """
+    flags = os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_BINARY", 0)
+    for _ in range(tempfile.TMP_MAX):
+        tmp_path = os.path.join(directory, f"{prefix}{secrets.token_hex(4)}")
+        try:
+            return os.open(tmp_path, flags, 0o666), tmp_path
+        except FileExistsError:
+            continue
+    raise FileExistsError(f"No usable temporary file name found in {directory}")
+
+
+def file_digest(path: Path | str) -> bytes | None:
+    """The SHA-256 digest of the file at ``path``, or None if it doesn't exist"""
+    digest = hashlib.sha256()
+    try:
+        with open(path, "rb") as file:
+            for block in iter(lambda: file.read(65536), b""):
+                digest.update(block)
+    except FileNotFoundError:
+        return None
+    return digest.digest()
+
+
+def write_chunks_atomic(
+    path: Path | str,
+    chunks: Iterable[str],
+    newline: str | None = None,
+    skip_unchanged: bool = False,
+) -> bool:
+    """
+    Like :py:func:`write_text_atomic`, but the text is written a chunk at a time as
+    ``chunks`` is consumed. If ``path`` already exists it keeps its permissions,
+    otherwise it is given the same permissions as any other new file.
+
+    ``newline`` controls how line endings are written, as for :py:func:`open`. With
+    ``skip_unchanged``, ``path`` is left untouched if it already has the new
+    content. Returns whether ``path`` was written.
+    """
+    # Replace the target of a symlink, rather than the link itself
+    path = Path(os.path.realpath(path))
+    path.parent.mkdir(parents=True, exist_ok=True)
+    linesep = os.linesep if newline is None else newline
+    digest = hashlib.sha256()
+    fd, tmp_path = _create_temp_file(path.parent, prefix=f".{path.name}.")
+    try:
+        with os.fdopen(fd, "wb") as tmp_file:
+            for chunk in chunks:
+                if linesep not in ("", "\n"):
+                    chunk = chunk.replace("\n", linesep)  # noqa: PLW2901
+                data = chunk.encode("utf-8")
+                digest.update(data)
+                tmp_file.write(data)
+
+        if skip_unchanged and digest.digest() == file_digest(path):
+            log.debug("%s is unchanged", path)
+            os.unlink(tmp_path)
+            return False
+
+        with suppress(FileNotFoundError):
+            shutil.copymode(path, tmp_path)
+        os.replace(tmp_path, path)
+    except BaseException:
+        with suppress(FileNotFoundError):
+            os.unlink(tmp_path)
+        raise
+    return True
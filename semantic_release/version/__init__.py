@@ -1,7 +1,9 @@
 import semantic_release.version.declaration as declaration
 from semantic_release.version.algorithm import (
+    HistorySnapshot,
     next_version,
     tags_and_versions,
 )
+from semantic_release.version.table import VersionTable
 from semantic_release.version.translator import VersionTranslator
 from semantic_release.version.version import Version
@@ -1,13 +1,18 @@
 from __future__ import annotations
 
 import logging
-from queue import Queue
-from typing import TYPE_CHECKING, Iterable
+from collections import deque
+from typing import TYPE_CHECKING, Any, Iterable, Iterator, Sequence
+
+from git.exc import GitCommandError
 
 from semantic_release.commit_parser import ParsedCommit
+from semantic_release.commit_parser.parallel import parse_commits
 from semantic_release.const import DEFAULT_VERSION
-from semantic_release.enums import LevelBump
+from semantic_release.enums import HistoryBackend, LevelBump
 from semantic_release.errors import InvalidVersion, MissingMergeBaseError
+from semantic_release.gitlog import CommitRecord, iter_commit_records, iter_tag_refs
+from semantic_release.version.table import VersionTable
 from semantic_release.version.version import Version
 
 if TYPE_CHECKING:
@@ -27,6 +32,10 @@ if TYPE_CHECKING:
 
 log = logging.getLogger(__name__)
 
+# The number of times to ask `git describe` for the latest full release before
+# falling back to searching the history ourselves
+MAX_DESCRIBE_ATTEMPTS = 10
+
 
 def tags_and_versions(
     tags: Iterable[Tag], translator: VersionTranslator
@@ -40,23 +49,173 @@ def tags_and_versions(
     Tags which are not matched by `translator` are ignored.
     """
     ts_and_vs: list[tuple[Tag, Version]] = []
+    unparseable_tags: list[str] = []
     for tag in tags:
         try:
             version = translator.from_tag(tag.name)
         except (NotImplementedError, InvalidVersion) as e:
-            log.warning(
+            log.debug(
                 "Couldn't parse tag %s as as Version: %s",
                 tag.name,
                 str(e),
                 exc_info=log.isEnabledFor(logging.DEBUG),
             )
+            unparseable_tags.append(tag.name)
             continue
 
         if version:
             ts_and_vs.append((tag, version))
 
+    if unparseable_tags:
+        log.warning(
+            "Couldn't parse %s tags matching the tag format as Versions, e.g. %s",
+            len(unparseable_tags),
+            str.join(", ", unparseable_tags[:5]),
+        )
+
     log.info("found %s previous tags", len(ts_and_vs))
-    return sorted(ts_and_vs, reverse=True, key=lambda v: v[1])
+    return sorted(ts_and_vs, reverse=True, key=lambda v: v[1].sort_key)
+
+
+class HistorySnapshot:
+    """
+    A view of a repository's history which can be shared between the different
+    steps of a release (e.g. computing the next version & building the release
+    history), so that the tags are only enumerated once, and each commit is only
+    loaded & parsed once no matter how many times the history is walked.
+
+    The snapshot is not updated if the repository changes, so a new one should be
+    created after any new commits or tags have been made.
+
+    `backend` selects how the commits are read; see `HistoryBackend`.
+    `parse_workers` is the number of processes used by `parse_many`.
+
+    Parse results are kept with a compact `CommitRecord` in place of the commit
+    which was parsed, so that results which outlive the snapshot (e.g. in a
+    `ReleaseHistory`) don't hold on to GitPython's `Commit` objects.
+    """
+
+    def __init__(
+        self,
+        repo: Repo,
+        translator: VersionTranslator,
+        commit_parser: CommitParser[ParseResult, ParserOptions],
+        backend: HistoryBackend = HistoryBackend.GITPYTHON,
+        parse_workers: int = 1,
+    ) -> None:
+        self.repo = repo
+        self.translator = translator
+        self.commit_parser = commit_parser
+        self.backend = backend
+        self.parse_workers = parse_workers
+        self._tags_and_versions: list[tuple[Tag, Version]] | None = None
+        self._tagged_commits: list[tuple[str, Tag, Version]] | None = None
+        self._version_table: VersionTable | None = None
+        self._commits: dict[str, CommitRecord] = {}
+        self._parse_results: dict[str, ParseResult] = {}
+        self._bumps: dict[str, LevelBump | None] = {}
+
+    @property
+    def tags_and_versions(self) -> list[tuple[Tag, Version]]:
+        """
+        The result of `tags_and_versions` for the repository's tags, only listing
+        the tags which could match the translator's tag format
+        """
+        if self._tags_and_versions is None:
+            self._tags_and_versions = tags_and_versions(
+                iter_tag_refs(self.repo, self.translator.tag_ref_pattern),
+                self.translator,
+            )
+        return self._tags_and_versions
+
+    @property
+    def version_table(self) -> VersionTable:
+        """A `VersionTable` indexing `tags_and_versions`"""
+        if self._version_table is None:
+            self._version_table = VersionTable(self.tags_and_versions)
+        return self._version_table
+
+    @property
+    def tagged_commits(self) -> list[tuple[str, Tag, Version]]:
+        """`tags_and_versions`, with the sha of the commit each tag points to"""
+        if self._tagged_commits is None:
+            self._tagged_commits = [
+                (tag.commit.hexsha, tag, version)
+                for tag, version in self.tags_and_versions
+            ]
+        return self._tagged_commits
+
+    def iter_commits(self, rev: str | None = None, **kwargs: Any) -> Iterator[Commit]:
+        """
+        Walk the commits of `rev` like `Repo.iter_commits`, only reading the data of
+        each commit from the object database the first time it is seen.
+
+        Only a compact `CommitRecord` of each commit is kept, rather than the
+        GitPython `Commit`, so that a long history isn't held in memory. With the
+        git log backend the records are yielded, otherwise a `Commit` is made from
+        the record when a commit is seen again.
+        """
+        if self.backend is HistoryBackend.GIT_LOG:
+            for record in iter_commit_records(self.repo, rev, **kwargs):
+                yield self._commits.setdefault(record.hexsha, record)  # type: ignore[misc]
+            return
+
+        for commit in self.repo.iter_commits(rev, **kwargs):
+            if (seen := self._commits.get(commit.hexsha)) is not None:
+                yield seen.to_commit()
+                continue
+            self._commits[commit.hexsha] = CommitRecord.from_commit(commit, self.repo)
+            yield commit
+
+    def _compact(self, result: ParseResult) -> ParseResult:
+        """Replace the commit of `result` with a `CommitRecord` where possible"""
+        commit = getattr(result, "commit", None)
+        if commit is None or isinstance(commit, CommitRecord):
+            return result
+        if "commit" not in getattr(result, "_fields", ()):
+            # Not a NamedTuple, so we can't make a copy with another commit
+            return result
+        record = CommitRecord.from_commit(commit, self.repo)
+        return result._replace(commit=record)  # type: ignore[arg-type]
+
+    def parse(self, commit: Commit) -> ParseResult:
+        """Parse `commit` with the commit parser, reusing any previous result"""
+        if (result := self._parse_results.get(commit.hexsha)) is None:
+            result = self._compact(self.commit_parser.parse(commit))
+            self._parse_results[commit.hexsha] = result
+        return result
+
+    def parse_bump(self, commit: Commit) -> LevelBump | None:
+        """
+        The level bump introduced by `commit`, or None if it can't be parsed. Only
+        the bump is determined unless the commit has already been fully parsed.
+        """
+        if (result := self._parse_results.get(commit.hexsha)) is not None:
+            return result.bump if isinstance(result, ParsedCommit) else None
+        if commit.hexsha not in self._bumps:
+            self._bumps[commit.hexsha] = self.commit_parser.parse_bump(commit)
+        return self._bumps[commit.hexsha]
+
+    def parse_many(self, commits: Sequence[Commit]) -> list[ParseResult]:
+        """
+        Parse each of `commits`, reusing any previous results. The commits which
+        haven't been parsed yet are parsed together, in parallel if the snapshot
+        has more than one `parse_workers`.
+        """
+        unparsed = list(
+            {
+                commit.hexsha: commit
+                for commit in commits
+                if commit.hexsha not in self._parse_results
+            }.values()
+        )
+        if unparsed:
+            for commit, result in zip(
+                unparsed,
+                parse_commits(self.commit_parser, unparsed, self.parse_workers),
+            ):
+                self._parse_results[commit.hexsha] = self._compact(result)
+        return [self._parse_results[commit.hexsha] for commit in commits]
 
 
 def _bfs_for_latest_version_in_history(
@@ -81,22 +240,21 @@ def _bfs_for_latest_version_in_history(
         # https://www.geeksforgeeks.org/python-program-for-breadth-first-search-or-bfs-for-a-graph/?ref=lbp
 
         # Create a queue for BFS
-        q: Queue[Commit | TagObject | Blob | Tree] = Queue()
+        q: deque[Commit | TagObject | Blob | Tree] = deque()
 
         # Create a set to store visited graph nodes (commit objects in this case)
         visited: set[Commit | TagObject | Blob | Tree] = set()
 
         # Add the source node in the queue & mark as visited to start the search
-        q.put(start_commit)
+        q.append(start_commit)
         visited.add(start_commit)
 
         # Initialize the result to None
         result = None
 
         # Traverse the git history until it finds a version tag if one exists
-        while not q.empty():
-            node = q.get()
-            visited.add(node)
+        while q:
+            node = q.popleft()
 
             log.debug("checking if commit %s matches any tags", node.hexsha)
             version = tag_sha_2_version_lookup.get(node.hexsha, None)
@@ -119,7 +277,8 @@ def _bfs_for_latest_version_in_history(
                     continue
 
                 log.debug("queuing parent commit %s", parent.hexsha)
-                q.put(parent)
+                visited.add(parent)
+                q.append(parent)
 
         return result
 
@@ -133,6 +292,113 @@ def _bfs_for_latest_version_in_history(
     return latest_version
 
 
+def _has_merges_between(repo: Repo, ancestor_sha: str, descendant_sha: str) -> bool:
+    """
+    Whether any commit reachable from `descendant_sha` but not from `ancestor_sha`
+    is a merge commit
+    """
+    return bool(
+        repo.git.rev_list(
+            "--min-parents=2", "--max-count=1", f"{ancestor_sha}..{descendant_sha}"
+        )
+    )
+
+
+def _describe_latest_version_in_history(
+    snapshot: HistorySnapshot,
+    merge_base: Commit | TagObject | Blob | Tree,
+    full_release_tags_and_versions: list[tuple[Tag, Version]],
+) -> Version | None:
+    """
+    Ask ``git describe`` for the nearest tag matching the tag format which is
+    reachable from the given `merge_base`, which git can answer quickly (especially
+    when the repository has a commit-graph) without us visiting each commit.
+
+    Tags matched by the tag format which aren't full releases, such as prereleases,
+    are excluded and git is asked again, up to a limited number of attempts.
+
+    git picks the tag with the fewest commits which aren't contained in it, which is
+    only certain to be the tag the breadth-first search finds when there are no
+    merges between the tag and `merge_base`. Return None if git can't find a full
+    release tag in the history, or if its answer can't be relied upon
+    """
+    tagged_shas = {tag.name: sha for sha, tag, _ in snapshot.tagged_commits}
+    tag_name_2_sha = {
+        tag.name: tagged_shas[tag.name] for tag, _ in full_release_tags_and_versions
+    }
+    tag_sha_2_version_lookup = {
+        tagged_shas[tag.name]: version
+        for tag, version in full_release_tags_and_versions
+    }
+
+    excluded_tags: list[str] = []
+    for _ in range(MAX_DESCRIBE_ATTEMPTS):
+        try:
+            tag_name = snapshot.repo.git.describe(
+                merge_base.hexsha,
+                "--tags",
+                "--abbrev=0",
+                f"--match={snapshot.translator.tag_glob}",
+                *(f"--exclude={name}" for name in excluded_tags),
+            )
+        except GitCommandError as err:
+            log.debug("git describe couldn't find a tag: %s", str(err).strip())
+            return None
+
+        if (sha := tag_name_2_sha.get(tag_name)) is not None:
+            break
+
+        log.debug("tag %s is not a full release, excluding it", tag_name)
+        excluded_tags.append(tag_name)
+    else:
+        log.debug(
+            "git describe didn't find a full release in %s attempts",
+            MAX_DESCRIBE_ATTEMPTS,
+        )
+        return None
+
+    if _has_merges_between(snapshot.repo, sha, merge_base.hexsha):
+        log.debug(
+            "there are merges since %s, so it may not be the nearest tag", tag_name
+        )
+        return None
+
+    version = tag_sha_2_version_lookup[sha]
+    log.info(
+        "found latest version in branch history: %r (%s)",
+        str(version),
+        sha[:7],
+    )
+    return version
+
+
+def _latest_version_in_history(
+    snapshot: HistorySnapshot,
+    merge_base: Commit | TagObject | Blob | Tree,
+    full_release_tags_and_versions: list[tuple[Tag, Version]],
+) -> Version | None:
+    """
+    Find the latest full release within the history of the `merge_base`, asking
+    git first, then falling back to the breadth-first search when git can't answer
+    """
+    if not full_release_tags_and_versions:
+        log.info("no version tags found in this branch's history")
+        return None
+
+    if latest_version := _describe_latest_version_in_history(
+        snapshot=snapshot,
+        merge_base=merge_base,
+        full_release_tags_and_versions=full_release_tags_and_versions,
+    ):
+        log.info("the latest version in this branch's history is %s", latest_version)
+        return latest_version
+
+    return _bfs_for_latest_version_in_history(
+        merge_base=merge_base,
+        full_release_tags_and_versions=full_release_tags_and_versions,
+    )
+
+
 def _increment_version(
     latest_version: Version,
     latest_full_version: Version,
@@ -269,25 +535,29 @@ def next_version(
     prerelease: bool = False,
     major_on_zero: bool = True,
     allow_zero_version: bool = True,
+    snapshot: HistorySnapshot | None = None,
 ) -> Version:
     """
     Evaluate the history within `repo`, and based on the tags and commits in the repo
     history, identify the next semantic version that should be applied to a release
+
+    A `snapshot` of the history can be given to share the tags and parsed commits
+    with other consumers of the same history, such as the release history.
     """
+    snapshot = snapshot or HistorySnapshot(repo, translator, commit_parser)
+
     # Step 1. All tags, sorted descending by semver ordering rules
-    all_git_tags_as_versions = tags_and_versions(repo.tags, translator)
-    all_full_release_tags_and_versions = list(
-        filter(lambda t_v: not t_v[1].is_prerelease, all_git_tags_as_versions)
-    )
+    version_table = snapshot.version_table
+    all_full_release_tags_and_versions = version_table.full_releases()
     log.info(
         "Found %s full releases (excluding prereleases)",
         len(all_full_release_tags_and_versions),
     )
 
     # Default initial version
-    latest_full_release_tag, latest_full_release_version = next(
-        iter(all_full_release_tags_and_versions),
-        (None, translator.from_string(DEFAULT_VERSION)),
+    latest_full_release_tag, latest_full_release_version = (
+        version_table.latest_full_release()
+        or (None, translator.from_string(DEFAULT_VERSION))
     )
 
     # we can safely scan the extra commits on this
@@ -351,7 +621,8 @@ def next_version(
             "is None"
         )
 
-    latest_full_version_in_history = _bfs_for_latest_version_in_history(
+    latest_full_version_in_history = _latest_version_in_history(
+        snapshot=snapshot,
         merge_base=merge_base,
         full_release_tags_and_versions=all_full_release_tags_and_versions,
     )
@@ -361,9 +632,9 @@ def next_version(
     )
 
     commits_since_last_full_release = (
-        repo.iter_commits()
+        snapshot.iter_commits()
         if latest_full_version_in_history is None
-        else repo.iter_commits(f"{latest_full_version_in_history.as_tag()}...")
+        else snapshot.iter_commits(f"{latest_full_version_in_history.as_tag()}...")
     )
 
     # Step 4. Parse each commit since the last release and find any tags that have
@@ -389,20 +660,20 @@ def next_version(
     # the new kind of version will be produced from the commits already
     # included in a prerelease since the last full release on the branch
     tag_sha_2_version_lookup = {
-        tag.commit.hexsha: (tag, version)
-        for tag, version in all_git_tags_as_versions
+        sha: (tag, version)
+        for sha, tag, version in snapshot.tagged_commits
         if prerelease or not version.is_prerelease
     }
 
     # N.B. these should be sorted so long as we iterate the commits in reverse order
     for commit in commits_since_last_full_release:
-        parse_result = commit_parser.parse(commit)
-        if isinstance(parse_result, ParsedCommit):
+        bump = snapshot.parse_bump(commit)
+        if bump is not None:
             log.debug(
                 "adding %s to the levels identified in commits_since_last_full_release",
-                parse_result.bump,
+                bump,
             )
-            parsed_levels.add(parse_result.bump)
+            parsed_levels.add(bump)
 
         log.debug("checking if commit %s matches any tags", commit.hexsha)
         t_v = tag_sha_2_version_lookup.get(commit.hexsha, None)
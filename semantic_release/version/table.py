@@ -0,0 +1,154 @@
+from __future__ import annotations
+
+import logging
+from array import array
+from bisect import bisect_left
+from typing import TYPE_CHECKING, Iterable
+
+if TYPE_CHECKING:
+    from git.refs.tag import Tag
+
+    from semantic_release.version.version import Version
+
+log = logging.getLogger(__name__)
+
+# Stored in place of a prerelease token id for full releases
+_NOT_A_PRERELEASE = -1
+
+
+class _ReleaseColumns:
+    """
+    A read-only sequence of the (major, minor, patch) of some of the rows of a
+    `VersionTable`, in ascending order, which can be searched with `bisect`
+    without building a list of tuples
+    """
+
+    def __init__(
+        self,
+        majors: array[int],
+        minors: array[int],
+        patches: array[int],
+        rows: array[int] | None = None,
+    ) -> None:
+        self._majors = majors
+        self._minors = minors
+        self._patches = patches
+        self._rows = rows
+
+    def row(self, index: int) -> int:
+        return index if self._rows is None else self._rows[index]
+
+    def __len__(self) -> int:
+        return len(self._majors) if self._rows is None else len(self._rows)
+
+    def __getitem__(self, index: int) -> tuple[int, int, int]:
+        row = self.row(index)
+        return (self._majors[row], self._minors[row], self._patches[row])
+
+
+class VersionTable:
+    """
+    An index of the versions of a repository's tags, to answer questions such as
+    "what is the latest full release?" without scanning every tag.
+
+    The components of each version are stored in compact columns, ordered by
+    semver precedence, so that the versions of a release (or a major version line)
+    can be found by a binary search. Prerelease tokens are stored as ids into a
+    shared list of distinct tokens; the prereleases of a release are already
+    ordered by their token & revision.
+
+    `tags_and_versions` should be sorted in descending order, as returned by
+    `semantic_release.version.algorithm.tags_and_versions`. Where two tags have
+    equal versions, the one listed first is considered to be the latest.
+    """
+
+    def __init__(self, tags_and_versions: Iterable[tuple[Tag, Version]]) -> None:
+        self._majors = array("q")
+        self._minors = array("q")
+        self._patches = array("q")
+        self._token_ids = array("l")
+        self._full_release_rows = array("l")
+        self._tokens: list[str] = []
+        self._token_2_id: dict[str, int] = {}
+        self._tags_and_versions: list[tuple[Tag, Version]] = []
+
+        for row, (tag, version) in enumerate(reversed(list(tags_and_versions))):
+            self._tags_and_versions.append((tag, version))
+            self._majors.append(version.major)
+            self._minors.append(version.minor)
+            self._patches.append(version.patch)
+            if version.is_prerelease:
+                self._token_ids.append(self._token_id(version.prerelease_token))
+            else:
+                self._token_ids.append(_NOT_A_PRERELEASE)
+                self._full_release_rows.append(row)
+
+        self._releases = _ReleaseColumns(self._majors, self._minors, self._patches)
+        self._full_releases = _ReleaseColumns(
+            self._majors, self._minors, self._patches, self._full_release_rows
+        )
+        log.debug(
+            "indexed %s versions (%s full releases, %s prerelease tokens)",
+            len(self._tags_and_versions),
+            len(self._full_release_rows),
+            len(self._tokens),
+        )
+
+    def _token_id(self, token: str) -> int:
+        if (token_id := self._token_2_id.get(token)) is None:
+            token_id = self._token_2_id[token] = len(self._tokens)
+            self._tokens.append(token)
+        return token_id
+
+    def __len__(self) -> int:
+        return len(self._tags_and_versions)
+
+    def latest(self) -> tuple[Tag, Version] | None:
+        """The tag & version of the latest release, including prereleases"""
+        return self._tags_and_versions[-1] if self._tags_and_versions else None
+
+    def latest_full_release(self) -> tuple[Tag, Version] | None:
+        """The tag & version of the latest full release (i.e. not a prerelease)"""
+        if not self._full_release_rows:
+            return None
+        return self._tags_and_versions[self._full_release_rows[-1]]
+
+    def full_releases(self) -> list[tuple[Tag, Version]]:
+        """The tags & versions of all full releases, latest first"""
+        return [
+            self._tags_and_versions[row] for row in reversed(self._full_release_rows)
+        ]
+
+    def latest_prerelease(
+        self, major: int, minor: int, patch: int, prerelease_token: str
+    ) -> tuple[Tag, Version] | None:
+        """
+        The tag & version of the latest prerelease of `major.minor.patch` which uses
+        `prerelease_token`, if any
+        """
+        token_id = self._token_2_id.get(prerelease_token)
+        if token_id is None:
+            return None
+
+        start = bisect_left(self._releases, (major, minor, patch))
+        end = bisect_left(self._releases, (major, minor, patch + 1))
+        # Within a release, the prereleases come first (ordered by their token &
+        # revision) followed by the full releases
+        for row in range(end - 1, start - 1, -1):
+            if self._token_ids[row] == token_id:
+                return self._tags_and_versions[row]
+        return None
+
+    def latest_in_major_version(
+        self, major: int, include_prereleases: bool = False
+    ) -> tuple[Tag, Version] | None:
+        """
+        The tag & version of the latest full release in the `major`.x.x line of
+        releases, or the latest release including prereleases if
+        `include_prereleases` is True
+        """
+        columns = self._releases if include_prereleases else self._full_releases
+        index = bisect_left(columns, (major + 1,)) - 1
+        if index < 0 or columns[index][0] != major:
+            return None
+        return self._tags_and_versions[columns.row(index)]
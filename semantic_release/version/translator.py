@@ -2,14 +2,21 @@ from __future__ import annotations
 
 import logging
 import re
+from functools import lru_cache
 
 from semantic_release.const import SEMVER_REGEX
 from semantic_release.helpers import check_tag_format
-from semantic_release.version.version import Version
+from semantic_release.version.version import PARSE_CACHE_SIZE, Version
 
 log = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=PARSE_CACHE_SIZE)
+def _version_str_from_tag(from_tag_re: re.Pattern[str], tag: str) -> str | None:
+    tag_match = from_tag_re.match(tag)
+    return tag_match.group("version") if tag_match else None
+
+
 class VersionTranslator:
     """
     Class to handle translation from Git tags into their corresponding Version
@@ -40,6 +47,46 @@ class VersionTranslator:
         log.debug("inverted tag_format %r to %r", tag_format, pat.pattern)
         return pat
 
+    @classmethod
+    def _tag_format_to_glob(cls, tag_format: str) -> str:
+        """
+        Create a glob pattern, as understood by ``git describe --match``, which
+        matches at least every tag that the inverted "tag_format" regex can match.
+
+        As the regex is only anchored at the start of the tag, the pattern is the
+        literal text at the start of "tag_format", followed by a wildcard:
+        >>> VersionTranslator._tag_format_to_glob("v{version}")
+        'v*'
+        >>> VersionTranslator._tag_format_to_glob("(dev|prod)-v{version}")
+        '*'
+        """
+        literal_prefix = re.split(r"[\\.^$*+?{}\[\]|()#\s]", tag_format, maxsplit=1)[0]
+        return f"{literal_prefix}*"
+
+    @classmethod
+    def _tag_format_to_ref_pattern(cls, tag_format: str) -> str:
+        """
+        Create a pattern for ``git for-each-ref`` which matches at least every tag
+        ref that the inverted "tag_format" regex can match.
+
+        In these patterns a wildcard doesn't match a "/", so a wildcard is only used
+        when the rest of the tag after the literal prefix cannot contain one.
+        Otherwise the pattern matches every tag beneath the last "/" of the prefix:
+        >>> VersionTranslator._tag_format_to_ref_pattern("mypkg-v{version}")
+        'refs/tags/mypkg-v*'
+        >>> VersionTranslator._tag_format_to_ref_pattern("mypkg/(dev|prod)-{version}")
+        'refs/tags/mypkg/'
+        """
+        glob = cls._tag_format_to_glob(tag_format)
+        literal_prefix = glob[:-1]
+        if re.fullmatch(
+            r"\{version\}[^\\.^$*+?{}\[\]|()#\s/]*",
+            tag_format[len(literal_prefix) :],
+        ):
+            return f"refs/tags/{glob}"
+
+        return f"refs/tags/{literal_prefix[: literal_prefix.rfind('/') + 1]}"
+
     def __init__(
         self,
         tag_format: str = "v{version}",
@@ -49,6 +96,8 @@ class VersionTranslator:
         self.tag_format = tag_format
         self.prerelease_token = prerelease_token
         self.from_tag_re = self._invert_tag_format_to_re(self.tag_format)
+        self.tag_glob = self._tag_format_to_glob(self.tag_format)
+        self.tag_ref_pattern = self._tag_format_to_ref_pattern(self.tag_format)
 
     def from_string(self, version_str: str) -> Version:
         """
@@ -68,10 +117,9 @@ class VersionTranslator:
         For example, a tag of 'v1.2.3' should be matched if `tag_format = 'v{version}`,
         but not if `tag_format = staging--v{version}`.
         """
-        tag_match = self.from_tag_re.match(tag)
-        if not tag_match:
+        raw_version_str = _version_str_from_tag(self.from_tag_re, tag)
+        if raw_version_str is None:
             return None
-        raw_version_str = tag_match.group("version")
         return self.from_string(raw_version_str)
 
     def str_to_tag(self, version_str: str) -> str:
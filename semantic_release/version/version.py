@@ -2,9 +2,8 @@ from __future__ import annotations
 
 import logging
 import re
-from functools import wraps
-from itertools import zip_longest
-from typing import Callable, Union, overload
+from functools import lru_cache, wraps
+from typing import Any, Callable, Union, overload
 
 from semantic_release.const import SEMVER_REGEX
 from semantic_release.enums import LevelBump
@@ -13,6 +12,9 @@ from semantic_release.helpers import check_tag_format
 
 log = logging.getLogger(__name__)
 
+# The number of distinct version strings whose parsed components are remembered
+PARSE_CACHE_SIZE = 4096
+
 
 # Very heavily inspired by semver.version:_comparator, I don't think there's
 # a cleaner way to do this
@@ -47,28 +49,98 @@ def _comparator(
 
     @wraps(method)
     def _wrapper(self: Version, other: VersionComparable) -> bool:
-        if not isinstance(other, (str, Version)):
+        if isinstance(other, Version):
+            return method(self, other)  # type: ignore[misc]
+        if not isinstance(other, str):
             return False if not type_guard else NotImplemented
-        if isinstance(other, str):
-            try:
-                other_v = self.parse(
-                    other,
-                    tag_format=self.tag_format,
-                    prerelease_token=self.prerelease_token,
-                )
-            except InvalidVersion as ex:
-                raise TypeError(str(ex)) from ex
-        else:
-            other_v = other
+        try:
+            other_v = self.parse(
+                other,
+                tag_format=self.tag_format,
+                prerelease_token=self.prerelease_token,
+            )
+        except InvalidVersion as ex:
+            raise TypeError(str(ex)) from ex
 
         return method(self, other_v)  # type: ignore[misc]
 
     return _wrapper
 
 
+@lru_cache(maxsize=PARSE_CACHE_SIZE)
+def _parse_version_str(
+    version_regex: re.Pattern[str], version_str: str
+) -> tuple[int, int, int, str | None, int | None, str]:
+    """
+    Parse a version string into its components (major, minor, patch,
+    prerelease_token, prerelease_revision, build_metadata). The prerelease token
+    is None if the version string isn't a prerelease.
+
+    The components are cached rather than `Version` instances, as the latter are
+    mutable.
+    """
+    log.debug("attempting to parse string %r as Version", version_str)
+    match = version_regex.fullmatch(version_str)
+    if not match:
+        raise InvalidVersion(f"{version_str!r} is not a valid Version")
+
+    prerelease = match.group("prerelease")
+    prerelease_token: str | None = None
+    if prerelease:
+        pm = re.match(r"(?P<token>[a-zA-Z0-9-\.]+)\.(?P<revision>\d+)", prerelease)
+        if not pm:
+            raise NotImplementedError(
+                f"{Version.__qualname__} currently supports only prereleases "
+                r"of the format (-([a-zA-Z0-9-])\.\(\d+)), for example "
+                r"'1.2.3-my-custom-3rc.4'."
+            )
+        prerelease_token, prerelease_revision = pm.groups()
+        log.debug(
+            "parsed prerelease_token %s, prerelease_revision %s from version "
+            "string %s",
+            prerelease_token,
+            prerelease_revision,
+            version_str,
+        )
+    else:
+        prerelease_revision = None
+        log.debug("version string %s parsed as a non-prerelease", version_str)
+
+    build_metadata = match.group("buildmetadata") or ""
+    log.debug(
+        "parsed build metadata %r from version string %s",
+        build_metadata,
+        version_str,
+    )
+
+    return (
+        int(match.group("major")),
+        int(match.group("minor")),
+        int(match.group("patch")),
+        prerelease_token,
+        int(prerelease_revision) if prerelease_revision else None,
+        build_metadata,
+    )
+
+
 class Version:
     _VERSION_REGEX = SEMVER_REGEX
 
+    __slots__ = (
+        "major",
+        "minor",
+        "patch",
+        "prerelease_token",
+        "prerelease_revision",
+        "build_metadata",
+        "_tag_format",
+        "_sort_key",
+        "_hash",
+    )
+
+    _sort_key: tuple[int, int, int, int, tuple[str, ...], int] | None
+    _hash: int | None
+
     def __init__(
         self,
         major: int,
@@ -88,6 +160,37 @@ class Version:
         self.build_metadata = build_metadata
         self._tag_format = tag_format
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        # Any change to the version invalidates the precomputed keys
+        if name not in ("_sort_key", "_hash"):
+            super().__setattr__("_sort_key", None)
+            super().__setattr__("_hash", None)
+
+    @property
+    def sort_key(self) -> tuple[int, int, int, int, tuple[str, ...], int]:
+        """
+        A tuple which orders versions by semver precedence, such that for two
+        versions ``a > b`` exactly when ``a.sort_key > b.sort_key``.
+
+        Full releases sort after any prerelease of the same version. Prereleases
+        are ordered by their token, one "." separated part at a time, and then by
+        their revision. Build metadata is not used for comparison.
+        """
+        if self._sort_key is None:
+            if self.prerelease_revision is not None:
+                self._sort_key = (
+                    self.major,
+                    self.minor,
+                    self.patch,
+                    0,
+                    tuple(self.prerelease_token.split(".")),
+                    self.prerelease_revision,
+                )
+            else:
+                self._sort_key = (self.major, self.minor, self.patch, 1, (), 0)
+        return self._sort_key
+
     @property
     def tag_format(self) -> str:
         return self._tag_format
@@ -97,7 +200,6 @@ class Version:
         check_tag_format(new_format)
         self._tag_format = new_format
 
-    # Maybe cache?
     @classmethod
     def parse(
         cls,
@@ -116,47 +218,21 @@ class Version:
         if not isinstance(version_str, str):
             raise InvalidVersion(f"{version_str!r} cannot be parsed as a Version")
 
-        log.debug("attempting to parse string %r as Version", version_str)
-        match = cls._VERSION_REGEX.fullmatch(version_str)
-        if not match:
-            raise InvalidVersion(f"{version_str!r} is not a valid Version")
-
-        prerelease = match.group("prerelease")
-        if prerelease:
-            pm = re.match(r"(?P<token>[a-zA-Z0-9-\.]+)\.(?P<revision>\d+)", prerelease)
-            if not pm:
-                raise NotImplementedError(
-                    f"{cls.__qualname__} currently supports only prereleases "
-                    r"of the format (-([a-zA-Z0-9-])\.\(\d+)), for example "
-                    r"'1.2.3-my-custom-3rc.4'."
-                )
-            prerelease_token, prerelease_revision = pm.groups()
-            log.debug(
-                "parsed prerelease_token %s, prerelease_revision %s from version "
-                "string %s",
-                prerelease_token,
-                prerelease_revision,
-                version_str,
-            )
-        else:
-            prerelease_revision = None
-            log.debug("version string %s parsed as a non-prerelease", version_str)
-
-        build_metadata = match.group("buildmetadata") or ""
-        log.debug(
-            "parsed build metadata %r from version string %s",
+        (
+            major,
+            minor,
+            patch,
+            parsed_prerelease_token,
+            prerelease_revision,
             build_metadata,
-            version_str,
-        )
+        ) = _parse_version_str(cls._VERSION_REGEX, version_str)
 
         return Version(
-            int(match.group("major")),
-            int(match.group("minor")),
-            int(match.group("patch")),
-            prerelease_token=prerelease_token,
-            prerelease_revision=(
-                int(prerelease_revision) if prerelease_revision else None
-            ),
+            major,
+            minor,
+            patch,
+            prerelease_token=parsed_prerelease_token or prerelease_token,
+            prerelease_revision=prerelease_revision,
             build_metadata=build_metadata,
             tag_format=tag_format,
         )
@@ -272,85 +348,64 @@ class Version:
     __add__ = bump
 
     def __hash__(self) -> int:
-        # If we use str(self) we don't capture tag_format, so another
+        # If we only used str(self) we wouldn't capture tag_format, so another
         # instance with a tag_format "special_{version}_format" would
         # collide with an instance using "v{version}"/other format
-        return hash(self.__repr__())
+        if self._hash is None:
+            self._hash = hash(
+                (
+                    self.major,
+                    self.minor,
+                    self.patch,
+                    self.prerelease_token,
+                    self.prerelease_revision,
+                    self.build_metadata,
+                    self._tag_format,
+                )
+            )
+        return self._hash
 
-    @_comparator(type_guard=False)
-    def __eq__(self, other: Version) -> bool:  # type: ignore[override]
+    def _eq(self, other: Version) -> bool:
         # https://semver.org/#spec-item-11 -
         # build metadata is not used for comparison
-        return all(
-            getattr(self, attr) == getattr(other, attr)
-            for attr in (
-                "major",
-                "minor",
-                "patch",
-                "prerelease_token",
-                "prerelease_revision",
-            )
+        return (
+            self.major == other.major
+            and self.minor == other.minor
+            and self.patch == other.patch
+            and self.prerelease_token == other.prerelease_token
+            and self.prerelease_revision == other.prerelease_revision
         )
 
+    @_comparator(type_guard=False)
+    def __eq__(self, other: Version) -> bool:  # type: ignore[override]
+        return self._eq(other)
+
     @_comparator(type_guard=False)
     def __neq__(self, other: Version) -> bool:
-        return not self.__eq__(other)
+        return not self._eq(other)
 
     # mypy wants to compare signature types with __lt__,
     # but can't because of the decorator
     @_comparator
     def __gt__(self, other: Version) -> bool:  # type: ignore[has-type]
-        # https://semver.org/#spec-item-11 -
-        # build metadata is not used for comparison
-
         # Note we only support the following versioning currently, which
         # is a subset of the full spec:
         # (\d+\.\d+\.\d+)(-\w+\.\d+)?(\+.*)?
-        if self.major != other.major:
-            return self.major > other.major
-        if self.minor != other.minor:
-            return self.minor > other.minor
-        if self.patch != other.patch:
-            return self.patch > other.patch
-        # If just one is a prerelease, then self > other if other is the prerelease
-        # If neither are prereleases then they're equal (so return False)
-        if not (self.is_prerelease and other.is_prerelease):
-            return other.is_prerelease
-        # If both are prereleases...
-        # According to the semver spec 11.4 there are many other rules for
-        # comparing precedence of pre-release versions. Here we just compare
-        # the prerelease tokens, and their revision numbers
-        if self.prerelease_token != other.prerelease_token:
-            for self_tk, other_tk in zip_longest(
-                self.prerelease_token.split("."),
-                other.prerelease_token.split("."),
-                fillvalue=None,
-            ):
-                if self_tk == other_tk:
-                    continue
-                if (self_tk is None) ^ (other_tk is None):
-                    # Longest token (i.e. non-None) is greater
-                    return other_tk is None
-                # Lexical sort, e.g. "rc" > "beta" > "alpha"
-                # we have eliminated that one or both might be None above,
-                # but mypy doesn't recognise this
-                return self_tk > other_tk  # type: ignore[operator]
-        # We have eliminated that one or both aren't prereleases by the above
-        return self.prerelease_revision > other.prerelease_revision  # type: ignore[operator]  # noqa: E501
+        return self.sort_key > other.sort_key
 
     # mypy wants to compare signature types with __le__,
     # but can't because of the decorator
     @_comparator
     def __ge__(self, other: Version) -> bool:  # type: ignore[has-type]
-        return self.__gt__(other) or self.__eq__(other)
+        return self.sort_key > other.sort_key or self._eq(other)
 
     @_comparator
     def __lt__(self, other: Version) -> bool:
-        return not (self.__gt__(other) or self.__eq__(other))
+        return not (self.sort_key > other.sort_key or self._eq(other))
 
     @_comparator
     def __le__(self, other: Version) -> bool:
-        return not self.__gt__(other)
+        return not self.sort_key > other.sort_key
 
     def __sub__(self, other: Version) -> LevelBump:
         if not isinstance(other, Version):
@@ -13,7 +13,9 @@ from pytest_lazy_fixtures.lazy_fixture import lf as lazy_fixture
 from requests import Session
 
 import semantic_release.hvcs.github
+from semantic_release.changelog import ReleaseHistory
 from semantic_release.cli.commands.main import main
+from semantic_release.version import VersionTranslator, tags_and_versions
 
 from tests.const import (
     CHANGELOG_SUBCMD,
@@ -51,6 +53,7 @@ from tests.fixtures.repos import (
     repo_with_single_branch_tag_commits,
 )
 from tests.util import (
+    add_text_to_file,
     assert_exit_code,
     assert_successful_exit_code,
     flatten_dircmp,
@@ -464,3 +467,84 @@ def test_changelog_prevent_external_path_traversal_dir(
         "Template directory must be inside of the repository directory."
         in result.stderr
     )
+
+
+@pytest.mark.usefixtures(repo_with_git_flow_angular_commits.__name__)
+def test_changelog_update_mode_inserts_new_releases(
+    repo_with_git_flow_angular_commits: Repo,
+    example_changelog_md: Path,
+    update_pyproject_toml: UpdatePyprojectTomlFn,
+    cli_runner: CliRunner,
+):
+    repo = repo_with_git_flow_angular_commits
+    insertion_flag = "<!-- version list -->"
+    cli_cmd = [MAIN_PROG_NAME, CHANGELOG_SUBCMD]
+
+    def expected_changelog() -> str:
+        # The full changelog, with the insertion flag before the first section
+        update_pyproject_toml("tool.semantic_release.changelog.mode", "init")
+        example_changelog_md.unlink()
+        assert_successful_exit_code(cli_runner.invoke(main, cli_cmd[1:]), cli_cmd)
+        update_pyproject_toml("tool.semantic_release.changelog.mode", "update")
+        return example_changelog_md.read_text().replace(
+            "# CHANGELOG\n\n", f"# CHANGELOG\n\n{insertion_flag}\n\n", 1
+        )
+
+    # The first update writes the whole changelog, including the insertion flag
+    expected = expected_changelog()
+    example_changelog_md.unlink()
+    result = cli_runner.invoke(main, cli_cmd[1:])
+    assert_successful_exit_code(result, cli_cmd)
+    assert example_changelog_md.read_text() == expected
+
+    # Unreleased changes are added, then replaced by the release
+    add_text_to_file(repo, "some_file.txt")
+    repo.git.commit(m="feat: a new feature", a=True)
+    previous = example_changelog_md.read_text()
+    result = cli_runner.invoke(main, cli_cmd[1:])
+    assert_successful_exit_code(result, cli_cmd)
+    assert "## Unreleased" in example_changelog_md.read_text()
+    assert example_changelog_md.read_text().endswith(
+        previous.partition(insertion_flag)[2]
+    )
+
+    latest_tag = tags_and_versions(repo.tags, VersionTranslator())[0][0].name
+    repo.git.tag("v9.0.0")
+    add_text_to_file(repo, "some_file.txt")
+    repo.git.commit(m="fix: a fix", a=True)
+    repo.git.tag("v9.0.1")
+    with mock.patch.object(
+        ReleaseHistory, "from_git_history", wraps=ReleaseHistory.from_git_history
+    ) as from_git_history:
+        result = cli_runner.invoke(main, cli_cmd[1:])
+    assert_successful_exit_code(result, cli_cmd)
+    assert from_git_history.call_args.kwargs["since"] == latest_tag
+
+    actual = example_changelog_md.read_text()
+    assert actual == expected_changelog()
+    assert "## Unreleased" not in actual
+
+
+@pytest.mark.usefixtures(repo_with_git_flow_angular_commits.__name__)
+def test_changelog_update_mode_keeps_changelog_on_failed_write(
+    repo_with_git_flow_angular_commits: Repo,
+    example_changelog_md: Path,
+    update_pyproject_toml: UpdatePyprojectTomlFn,
+    cli_runner: CliRunner,
+):
+    update_pyproject_toml("tool.semantic_release.changelog.mode", "update")
+    cli_cmd = [MAIN_PROG_NAME, CHANGELOG_SUBCMD]
+    assert_successful_exit_code(cli_runner.invoke(main, cli_cmd[1:]), cli_cmd)
+    add_text_to_file(repo_with_git_flow_angular_commits, "some_file.txt")
+    repo_with_git_flow_angular_commits.git.commit(m="feat: a new feature", a=True)
+    previous = example_changelog_md.read_text()
+    previous_files = sorted(os.listdir(example_changelog_md.parent))
+
+    # The write is interrupted before the new changelog replaces the old one
+    with mock.patch("os.replace", side_effect=OSError("interrupted")):
+        result = cli_runner.invoke(main, cli_cmd[1:])
+
+    assert_exit_code(1, result, cli_cmd)
+    assert example_changelog_md.read_text() == previous
+    # Nor is a temporary file left behind
+    assert sorted(os.listdir(example_changelog_md.parent)) == previous_files
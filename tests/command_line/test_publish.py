@@ -16,6 +16,7 @@ if TYPE_CHECKING:
     from typing import Sequence
 
     from click.testing import CliRunner
+    from git import Repo
 
     from tests.fixtures.git_repo import GetVersionStringsFn
 
@@ -63,6 +64,23 @@ def test_publish_to_tag_uses_tag(
         )
 
 
+def test_publish_to_tag_not_matching_tag_format(
+    cli_runner: CliRunner, repo_with_single_branch_angular_commits: Repo
+):
+    custom_tag = "custom-release"
+    repo_with_single_branch_angular_commits.create_tag(custom_tag)
+
+    with mock.patch.object(Github, Github.upload_dists.__name__) as mocked_upload_dists:
+        cli_cmd = [MAIN_PROG_NAME, PUBLISH_SUBCMD, "--tag", custom_tag]
+
+        # Act
+        result = cli_runner.invoke(main, cli_cmd[1:])
+
+        # Evaluate
+        assert_successful_exit_code(result, cli_cmd)
+        mocked_upload_dists.assert_called_once_with(tag=custom_tag, dist_glob="dist/*")
+
+
 @pytest.mark.usefixtures(repo_with_single_branch_angular_commits.__name__)
 def test_publish_fails_on_nonexistant_tag(cli_runner: CliRunner):
     non_existant_tag = "nonexistant-tag"
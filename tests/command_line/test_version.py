@@ -1077,7 +1077,7 @@ def test_custom_release_notes_template(
 
     # Assert
     assert_successful_exit_code(result, cli_cmd)
-    assert mocked_git_push.call_count == 2  # 1 for commit, 1 for tag
+    assert mocked_git_push.call_count == 1  # commit & tag pushed together
     assert post_mocker.call_count == 1
     assert post_mocker.last_request is not None
     assert post_mocker.last_request.json()["body"] == expected_release_notes
@@ -1112,7 +1112,52 @@ def test_version_tag_only_push(
     assert_successful_exit_code(result, cli_cmd)
     assert tag_after == "v0.1.0"
     assert head_before == head_after
-    assert mocked_git_push.call_count == 1  # 0 for commit, 1 for tag
+    assert mocked_git_push.call_count == 1  # only the tag
+    push_args = mocked_git_push.call_args.args
+    assert push_args[0] == "--atomic"
+    assert push_args[2:] == ("refs/tags/v0.1.0",)
+
+
+def test_version_pushes_branch_and_tag_atomically(
+    mocked_git_push: MagicMock,
+    repo_with_no_tags_angular_commits: Repo,
+    cli_runner: CliRunner,
+) -> None:
+    # Act
+    cli_cmd = [MAIN_PROG_NAME, VERSION_SUBCMD, "--skip-build", "--no-vcs-release"]
+    result = cli_runner.invoke(main, cli_cmd[1:])
+
+    # Assert
+    assert_successful_exit_code(result, cli_cmd)
+    branch = repo_with_no_tags_angular_commits.active_branch.name
+    mocked_git_push.assert_called_once_with(
+        "--atomic", mock.ANY, branch, "refs/tags/v0.1.0"
+    )
+
+
+def test_version_opens_repo_once(
+    mocked_git_push: MagicMock,
+    repo_with_no_tags_angular_commits: Repo,
+    cli_runner: CliRunner,
+) -> None:
+    # Setup
+    repo_cls = type(repo_with_no_tags_angular_commits)
+
+    # Act
+    cli_cmd = [MAIN_PROG_NAME, VERSION_SUBCMD, "--skip-build", "--no-vcs-release"]
+    with mock.patch(
+        "semantic_release.cli.cli_context.Repo", wraps=repo_cls
+    ) as mocked_repo, mock.patch(
+        "semantic_release.gitproject.Repo",
+        side_effect=AssertionError("the shared repository should be used"),
+    ):
+        result = cli_runner.invoke(main, cli_cmd[1:])
+
+    # Assert
+    assert_successful_exit_code(result, cli_cmd)
+    assert repo_with_no_tags_angular_commits.tags[-1].name == "v0.1.0"
+    assert mocked_repo.call_count == 1
+    assert mocked_git_push.call_count == 1  # commit & tag pushed together
 
 
 def test_version_only_update_files_no_git_actions(
@@ -1,13 +1,16 @@
 from __future__ import annotations
 
 from typing import TYPE_CHECKING
+from unittest import mock
 
 import pytest
 
 # Limitation in pytest-lazy-fixture - see https://stackoverflow.com/a/69884019
 from pytest_lazy_fixtures.lazy_fixture import lf as lazy_fixture
 
-from semantic_release.version.algorithm import next_version
+from semantic_release.enums import HistoryBackend
+from semantic_release.version import algorithm
+from semantic_release.version.algorithm import HistorySnapshot, next_version
 from semantic_release.version.translator import VersionTranslator
 
 from tests.const import (
@@ -2611,3 +2614,46 @@ def test_algorithm_with_zero_dot_versions_minimums(
 
     # Verify
     assert expected_new_version == str(new_version)
+
+
+@pytest.mark.parametrize(
+    "repo",
+    [
+        lazy_fixture(repo_with_single_branch_angular_commits.__name__),
+        lazy_fixture(repo_with_single_branch_and_prereleases_angular_commits.__name__),
+        lazy_fixture(
+            repo_w_github_flow_w_feature_release_channel_angular_commits.__name__
+        ),
+        lazy_fixture(repo_with_git_flow_angular_commits.__name__),
+        lazy_fixture(repo_with_git_flow_and_release_channels_angular_commits.__name__),
+    ],
+)
+@pytest.mark.parametrize("prerelease", [True, False])
+def test_algorithm_same_with_git_log_backend(
+    repo: Repo, default_angular_parser, prerelease: bool
+):
+    translator = VersionTranslator()
+    expected_new_version = next_version(
+        repo, translator, default_angular_parser, prerelease
+    )
+
+    # The latest release in the history should be found by git, not the search
+    with mock.patch.object(
+        algorithm,
+        algorithm._bfs_for_latest_version_in_history.__name__,
+        side_effect=AssertionError("should not search the history"),
+    ):
+        new_version = next_version(
+            repo,
+            translator,
+            default_angular_parser,
+            prerelease,
+            snapshot=HistorySnapshot(
+                repo,
+                translator,
+                default_angular_parser,
+                backend=HistoryBackend.GIT_LOG,
+            ),
+        )
+
+    assert expected_new_version == new_version
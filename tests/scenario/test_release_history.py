@@ -1,13 +1,21 @@
 from __future__ import annotations
 
+import re
 from datetime import datetime
 from typing import TYPE_CHECKING, NamedTuple
+from unittest import mock
 
 import pytest
-from git import Actor
+from git import Actor, Commit
 from pytest_lazy_fixtures.lazy_fixture import lf as lazy_fixture
 
-from semantic_release.changelog.release_history import ReleaseHistory
+from semantic_release.changelog.release_history import (
+    ReleaseHistory,
+    _compile_exclusion_patterns,
+)
+from semantic_release.enums import HistoryBackend
+from semantic_release.gitlog import CommitRecord
+from semantic_release.version.algorithm import HistorySnapshot
 from semantic_release.version.translator import VersionTranslator
 from semantic_release.version.version import Version
 
@@ -371,3 +379,122 @@ def test_all_matching_repo_tags_are_released(repo, default_angular_parser):
 
     for tag in repo.tags:
         assert translator.from_tag(tag.name) in release_history.released
+
+
+@pytest.mark.parametrize(
+    "repo",
+    [
+        lazy_fixture(repo_with_single_branch_and_prereleases_angular_commits.__name__),
+        lazy_fixture(repo_with_git_flow_and_release_channels_angular_commits.__name__),
+    ],
+)
+def test_release_history_same_with_git_log_backend(repo: Repo, default_angular_parser):
+    translator = VersionTranslator()
+    expected = ReleaseHistory.from_git_history(
+        repo=repo,
+        translator=translator,
+        commit_parser=default_angular_parser,
+    )
+    actual = ReleaseHistory.from_git_history(
+        repo=repo,
+        translator=translator,
+        commit_parser=default_angular_parser,
+        snapshot=HistorySnapshot(
+            repo=repo,
+            translator=translator,
+            commit_parser=default_angular_parser,
+            backend=HistoryBackend.GIT_LOG,
+        ),
+    )
+
+    assert expected.unreleased == actual.unreleased
+    assert expected.released == actual.released
+
+
+def test_release_history_holds_commit_records(
+    repo_with_git_flow_angular_commits: Repo, default_angular_parser
+):
+    parsed_commit_types: set[type] = set()
+    parse = default_angular_parser.parse
+
+    def tracking_parse(commit):
+        parsed_commit_types.add(type(commit))
+        return parse(commit)
+
+    with mock.patch.object(default_angular_parser, "parse", side_effect=tracking_parse):
+        release_history = ReleaseHistory.from_git_history(
+            repo=repo_with_git_flow_angular_commits,
+            translator=VersionTranslator(),
+            commit_parser=default_angular_parser,
+        )
+
+    # The parser still receives GitPython's commits
+    assert parsed_commit_types == {Commit}
+    results = [
+        result
+        for release in release_history.released.values()
+        for results in release["elements"].values()
+        for result in results
+    ]
+    assert results
+    assert all(isinstance(result.commit, CommitRecord) for result in results)
+
+
+@pytest.mark.parametrize(
+    "exclude_commit_patterns",
+    [
+        # Combined into a single regex
+        [r"chore(?:\([^)]*?\))?: .+", r"ci(?:\([^)]*?\))?: .+"],
+        # Checked one at a time, as one of the patterns sets a global flag
+        [r"(?i)CHORE(?:\([^)]*?\))?: .+", r"ci(?:\([^)]*?\))?: .+"],
+    ],
+)
+def test_release_history_excluded_commits_are_not_parsed(
+    repo_with_git_flow_angular_commits: Repo,
+    default_angular_parser,
+    exclude_commit_patterns: list[str],
+):
+    repo = repo_with_git_flow_angular_commits
+    add_text_to_file(repo, "some_file.txt")
+    repo.git.commit(m="chore: an excluded commit", a=True)
+    add_text_to_file(repo, "some_file.txt")
+    repo.git.commit(m="ci(release): another excluded commit", a=True)
+    excluded_shas = {repo.head.commit.hexsha, repo.head.commit.parents[0].hexsha}
+
+    patterns = [re.compile(pattern) for pattern in exclude_commit_patterns]
+    parsed_shas: list[str] = []
+    parse = default_angular_parser.parse
+
+    def tracking_parse(commit):
+        parsed_shas.append(commit.hexsha)
+        return parse(commit)
+
+    with mock.patch.object(default_angular_parser, "parse", side_effect=tracking_parse):
+        release_history = ReleaseHistory.from_git_history(
+            repo=repo,
+            translator=VersionTranslator(),
+            commit_parser=default_angular_parser,
+            exclude_commit_patterns=patterns,
+        )
+
+    assert parsed_shas
+    assert excluded_shas.isdisjoint(parsed_shas)
+    assert all(
+        not any(pat.match(str(result.commit.message)) for pat in patterns)
+        for results in release_history.unreleased.values()
+        for result in results
+    )
+
+
+@pytest.mark.parametrize(
+    "patterns, message",
+    [
+        # Group numbers would be shifted by combining the patterns
+        ([r"(a)z", r"(b)\1c"], "bbc"),
+        ([r"(a)z", r"(b)?(?(1)x|c)"], "bx"),
+    ],
+)
+def test_exclusion_patterns_referring_to_groups(patterns: list[str], message: str):
+    is_excluded = _compile_exclusion_patterns(re.compile(p) for p in patterns)
+
+    assert is_excluded(message)
@@ -175,3 +175,46 @@ def test_recursive_render_with_top_level_dotfolder(
     assert set(example_project_dir.rglob("**/*")) == preexisting_paths.union(
         {example_project_dir / rendered_template}
     )
+
+
+@pytest.mark.parametrize("max_workers", [1, None])
+def test_recursive_render_only_writes_changed_files(
+    init_example_project: None,
+    example_project_dir: Path,
+    example_project_template_dir: Path,
+    normal_template: Path,
+    deeply_nested_file: Path,
+    max_workers: int | None,
+):
+    env = environment(template_dir=str(example_project_template_dir.resolve()))
+    rendered_normal_template = _strip_trailing_j2(
+        example_project_dir / normal_template.relative_to(example_project_template_dir)
+    ).resolve()
+    rendered_deeply_nested = (
+        example_project_dir
+        / deeply_nested_file.relative_to(example_project_template_dir)
+    ).resolve()
+
+    def render() -> list[str]:
+        return recursive_render(
+            template_dir=example_project_template_dir.resolve(),
+            environment=env,
+            _root_dir=str(example_project_dir.resolve()),
+            max_workers=max_workers,
+        )
+
+    all_outputs = sorted([str(rendered_normal_template), str(rendered_deeply_nested)])
+    assert sorted(render()) == all_outputs
+
+    # Nothing has changed, so nothing is written, but every output is still
+    # returned, as it may not have been committed yet
+    os.utime(rendered_normal_template, ns=(0, 0))
+    os.utime(rendered_deeply_nested, ns=(0, 0))
+    assert sorted(render()) == all_outputs
+    assert rendered_normal_template.stat().st_mtime_ns == 0
+    assert rendered_deeply_nested.stat().st_mtime_ns == 0
+
+    rendered_deeply_nested.write_text("modified")
+    assert sorted(render()) == all_outputs
+    assert rendered_normal_template.stat().st_mtime_ns == 0
+    assert rendered_deeply_nested.read_text() == PLAINTEXT_FILE_CONTENT
@@ -0,0 +1,167 @@
+from __future__ import annotations
+
+from datetime import datetime
+from pathlib import Path
+from typing import TYPE_CHECKING
+from unittest import mock
+
+import pytest
+from git import Commit, Repo
+
+# NOTE: use backport with newer API
+from importlib_resources import files
+
+import semantic_release
+from semantic_release.changelog.cache import ReleaseSectionCache
+from semantic_release.changelog.context import make_changelog_context
+from semantic_release.changelog.release_history import Release, ReleaseHistory
+from semantic_release.changelog.template import environment
+from semantic_release.commit_parser import ParsedCommit
+from semantic_release.enums import LevelBump
+from semantic_release.hvcs import Github
+from semantic_release.version.version import Version
+
+if TYPE_CHECKING:
+    from git import Actor
+    from jinja2 import Environment
+
+
+@pytest.fixture
+def default_changelog_template() -> str:
+    return (
+        files(semantic_release.__name__)
+        .joinpath(Path("data", "templates", "CHANGELOG.md.j2"))
+        .read_text(encoding="utf-8")
+    )
+
+
+def _parsed_commit(hexsha: str, message: str, type_: str) -> ParsedCommit:
+    return ParsedCommit(
+        bump=LevelBump.PATCH,
+        type=type_,
+        scope="",
+        descriptions=[message],
+        breaking_descriptions=[],
+        commit=Commit(Repo("."), bytes.fromhex(hexsha), message=message),
+    )
+
+
+@pytest.fixture
+def release_history(commit_author: Actor) -> ReleaseHistory:
+    def release(version: str, *commits: ParsedCommit) -> Release:
+        return Release(
+            tagger=commit_author,
+            committer=commit_author,
+            tagged_date=datetime(2024, 1, 1),
+            elements={commit.type: [commit] for commit in commits},
+            version=Version.parse(version),
+        )
+
+    return ReleaseHistory(
+        unreleased={"feature": [_parsed_commit("c" * 40, "feat: unreleased", "feat")]},
+        released={
+            Version.parse("1.1.0"): release(
+                "1.1.0",
+                _parsed_commit("b" * 40, "feat: add a feature", "feature"),
+                _parsed_commit("a" * 40, "fix: fix a bug", "fix"),
+            ),
+            Version.parse("1.0.0"): release(
+                "1.0.0", _parsed_commit("9" * 40, "fix: initial fix", "fix")
+            ),
+        },
+    )
+
+
+def _render(
+    env: Environment,
+    template_source: str,
+    release_history: ReleaseHistory,
+    cache_dir: Path,
+) -> tuple[str, str | None]:
+    context = make_changelog_context(
+        hvcs_client=Github("https://github.com/example/repo.git"),
+        release_history=release_history,
+    )
+    context.bind_to_environment(env)
+    template = env.from_string(template_source)
+    section_cache = ReleaseSectionCache(cache_dir, template_source, env, context)
+    sections = section_cache.render(template, env)
+    section_cache.save()
+    return template.render(), None if sections is None else str.join("", sections)
+
+
+@pytest.mark.parametrize(
+    "env_options",
+    [{}, {"trim_blocks": True, "lstrip_blocks": True, "keep_trailing_newline": True}],
+)
+def test_cached_sections_match_full_render(
+    tmp_path: Path,
+    default_changelog_template: str,
+    release_history: ReleaseHistory,
+    env_options: dict[str, bool],
+):
+    env = environment(**env_options)
+
+    expected, rendered = _render(
+        env, default_changelog_template, release_history, tmp_path
+    )
+    assert rendered == expected
+
+    # Rendered again using only the cached sections
+    with mock.patch.object(
+        ReleaseSectionCache,
+        "_render_section",
+        autospec=True,
+        side_effect=ReleaseSectionCache._render_section,
+    ) as mocked_render_section:
+        expected, rendered = _render(
+            env, default_changelog_template, release_history, tmp_path
+        )
+
+    assert rendered == expected
+    # Only the unreleased changes were rendered
+    assert mocked_render_section.call_count == 1
+
+
+def test_changed_release_is_rendered_again(
+    tmp_path: Path,
+    default_changelog_template: str,
+    release_history: ReleaseHistory,
+):
+    env = environment()
+    _render(env, default_changelog_template, release_history, tmp_path)
+
+    release = release_history.released[Version.parse("1.0.0")]
+    release["elements"]["fix"] = [
+        _parsed_commit("9" * 40, "fix: reworded initial fix", "fix")
+    ]
+    release_history.unreleased = {}
+
+    with mock.patch.object(
+        ReleaseSectionCache,
+        "_render_section",
+        autospec=True,
+        side_effect=ReleaseSectionCache._render_section,
+    ) as mocked_render_section:
+        expected, rendered = _render(
+            env, default_changelog_template, release_history, tmp_path
+        )
+
+    assert rendered == expected
+    assert "reworded initial fix" in str(rendered)
+    assert mocked_render_section.call_count == 1
+
+
+def test_template_with_dependent_heading_is_not_split(
+    tmp_path: Path, release_history: ReleaseHistory
+):
+    template_source = (
+        "{{ context.history.released | length }} releases\n"
+        "{% for version in context.history.released %}{{ version }}\n{% endfor %}"
+    )
+    expected, rendered = _render(
+        environment(), template_source, release_history, tmp_path
+    )
+
+    assert rendered is None
+    assert expected.startswith("2 releases")
@@ -335,3 +335,58 @@ def test_changelog_context_gitlab(
 
     # Evaluate
     assert expected_changelog == actual_changelog
+
+
+@pytest.mark.parametrize("hvcs_client", [Github, Gitlab, Gitea, Bitbucket])
+@pytest.mark.parametrize(
+    "commit_hash", [Object.NULL_HEX_SHA, "0123abc", "DEADBEEF", "", "not/a-hash"]
+)
+def test_changelog_context_commit_hash_url(
+    hvcs_client: type[Bitbucket | Gitea | Github | Gitlab],
+    example_git_https_url: str,
+    commit_hash: str,
+):
+    hvcs = hvcs_client(example_git_https_url)
+    context = make_changelog_context(
+        hvcs_client=hvcs, release_history=ReleaseHistory(unreleased={}, released={})
+    )
+    env = context.bind_to_environment(environment())
+
+    assert env.filters["commit_hash_url"](commit_hash) == hvcs.commit_hash_url(
+        commit_hash
+    )
+
+
+def test_changelog_context_index(
+    example_git_https_url: str, artificial_release_history: ReleaseHistory
+):
+    breaking_commit = ParsedCommit(
+        bump=LevelBump.MAJOR,
+        type="breaking",
+        scope="",
+        descriptions=["feat!: remove the old api"],
+        breaking_descriptions=["the old api has been removed"],
+        commit=Commit(
+            Repo("."),
+            Object.NULL_HEX_SHA[:20].encode("utf-8"),
+            message="feat!: remove the old api",
+        ),
+    )
+    release = artificial_release_history.released[Version.parse("1.0.0")]
+    release["elements"] = {"breaking": [breaking_commit], **release["elements"]}
+
+    context = make_changelog_context(
+        hvcs_client=Github(example_git_https_url),
+        release_history=artificial_release_history,
+    )
+    index = context.index.released[Version.parse("1.0.0")]
+
+    assert list(index.by_type) == ["breaking", "feature", "fix"]
+    assert list(index.by_scope) == ["", "cli"]
+    assert index.by_scope["cli"] == [
+        *release["elements"]["feature"],
+        *release["elements"]["fix"],
+    ]
+    assert index.breaking == [breaking_commit]
+    assert index.commit_count == 3
+    assert context.index.unreleased.commit_count == 1
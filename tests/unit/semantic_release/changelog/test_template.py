@@ -2,11 +2,25 @@
 # but not all of them. The testing can be expanded to cover all the options later.
 # It's not super essential as Jinja2 does most of the testing, we're just checking
 # that we can properly set the right strings in the template environment.
+from __future__ import annotations
+
 from textwrap import dedent
+from typing import TYPE_CHECKING
+from unittest import mock
 
 import pytest
+from jinja2.exceptions import SecurityError
+from jinja2.sandbox import SandboxedEnvironment
+
+from semantic_release.changelog import template as template_module
+from semantic_release.changelog.template import (
+    environment,
+    environment_fingerprint,
+    template_from_string,
+)
 
-from semantic_release.changelog.template import environment
+if TYPE_CHECKING:
+    from pathlib import Path
 
 EXAMPLE_TEMPLATE_FORMAT_STR = """
 <h1>This is an example template document</h1>
@@ -56,3 +70,76 @@ def test_template_env_configurable(format_map, subjects):
         <h2>The title is {title.upper()}</h2>
         {(newline + " " * 8).join(f'<p>This is a paragraph about {subject}</p>' for subject in subjects)}"""  # noqa: E501
     )
+
+
+@pytest.fixture
+def clean_compiled_code():
+    with mock.patch.dict(template_module._compiled_code, clear=True):
+        yield
+
+
+@pytest.mark.usefixtures(clean_compiled_code.__name__)
+def test_template_from_string_compiles_once(tmp_path: Path):
+    source = "{{ greeting }}, {{ name }}!"
+    first_env = environment(template_dir=tmp_path)
+    second_env = environment(template_dir=tmp_path)
+
+    with mock.patch.object(
+        type(first_env), "compile", autospec=True, side_effect=type(first_env).compile
+    ) as mocked_compile:
+        first = template_from_string(first_env, source)
+        second = template_from_string(second_env, source)
+
+    assert mocked_compile.call_count == 1
+    assert first.render(greeting="Hello", name="world") == "Hello, world!"
+    assert second.render(greeting="Hi", name="there") == "Hi, there!"
+
+
+def test_environment_fingerprint_depends_on_settings(tmp_path: Path):
+    assert environment_fingerprint(environment(tmp_path)) == environment_fingerprint(
+        environment(tmp_path / "other")
+    )
+    assert environment_fingerprint(environment(tmp_path)) != environment_fingerprint(
+        environment(tmp_path, variable_start_string="[[", variable_end_string="]]")
+    )
+
+
+@pytest.mark.usefixtures(clean_compiled_code.__name__)
+def test_template_from_string_bytecode_cache(tmp_path: Path):
+    cache_dir = tmp_path / "cache"
+    source = "{{ name | upper }}"
+
+    env = environment(template_dir=tmp_path, cache_dir=cache_dir)
+    assert template_from_string(env, source).render(name="psr") == "PSR"
+    assert (cache_dir / ".gitignore").exists()
+    assert len(list((cache_dir / "jinja").iterdir())) == 1
+
+    # A new process would only have the bytecode stored on disk
+    template_module._compiled_code.clear()
+    env = environment(template_dir=tmp_path, cache_dir=cache_dir)
+    with mock.patch.object(type(env), "compile", autospec=True) as mocked_compile:
+        assert template_from_string(env, source).render(name="psr") == "PSR"
+    mocked_compile.assert_not_called()
+
+    # Different delimiters mustn't use the code which was compiled before
+    other_env = environment(
+        template_dir=tmp_path,
+        cache_dir=cache_dir,
+        variable_start_string="[[",
+        variable_end_string="]]",
+    )
+    assert template_from_string(other_env, source).render(name="psr") == source
+    assert len(list((cache_dir / "jinja").iterdir())) == 2
+
+
+@pytest.mark.parametrize("sandboxed", [True, False])
+def test_template_env_sandboxed(sandboxed: bool):
+    env = environment(sandboxed=sandboxed)
+    template = env.from_string("{{ value.__class__.__name__ }}")
+
+    assert isinstance(env, SandboxedEnvironment) == sandboxed
+    if sandboxed:
+        with pytest.raises(SecurityError):
+            template.render(value="text")
+    else:
+        assert template.render(value="text") == "str"
@@ -58,6 +58,34 @@ def test_parser_returns_correct_bump_level(
     result = default_angular_parser.parse(make_commit_obj(commit_message))
     assert isinstance(result, ParsedCommit)
     assert result.bump is bump
+    assert default_angular_parser.parse_bump(make_commit_obj(commit_message)) is bump
+
+
+@pytest.mark.parametrize(
+    "commit_message",
+    [
+        "",
+        "not a conventional commit",
+        "feat(parser\n): Add new parser pattern",
+        "feat: subject\nBREAKING CHANGE: not separated from the subject",
+        "feat: subject\n\n  BREAKING CHANGE: indented",
+        "feat: subject\n\nBREAKING\nCHANGE: wrapped",
+        "feat: subject\r\n\r\nBREAKING CHANGE: windows line endings",
+        "feat: subject\n\nBREAK\rING CHANGE: carriage return",
+        "fix: subject\n\nnot BREAKING CHANGE: mid-paragraph",
+        "fix: subject\n\n" + "a long body\n" * 1000,
+        "docs: subject\n\n",
+    ],
+)
+def test_parse_bump_agrees_with_parse(
+    default_angular_parser: AngularCommitParser,
+    commit_message: str,
+    make_commit_obj: MakeCommitObjFn,
+):
+    commit = make_commit_obj(commit_message)
+    result = default_angular_parser.parse(commit)
+    expected = result.bump if isinstance(result, ParsedCommit) else None
+    assert default_angular_parser.parse_bump(commit) is expected
 
 
 @pytest.mark.parametrize(
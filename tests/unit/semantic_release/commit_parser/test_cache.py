@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING
+from unittest import mock
+
+from git import Commit, Repo
+
+from semantic_release.commit_parser.angular import (
+    AngularCommitParser,
+    AngularParserOptions,
+)
+from semantic_release.commit_parser.cache import CachedCommitParser
+from semantic_release.commit_parser.token import ParsedCommit, ParseError
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    import pytest
+
+
+def make_commit(sha_char: str, message: str) -> Commit:
+    return Commit(repo=Repo(), binsha=sha_char.encode() * 20, message=message)
+
+
+def test_cached_parser_returns_same_results(tmp_path: Path):
+    parser = AngularCommitParser()
+    cached_parser = CachedCommitParser(parser, cache_dir=tmp_path)
+    commits = [
+        make_commit("1", "feat(parser): add a feature\n\nBREAKING CHANGE: boom"),
+        make_commit("2", "fix: a fix"),
+        make_commit("3", "not a conventional commit"),
+    ]
+
+    for commit in commits:
+        assert cached_parser.parse(commit) == parser.parse(commit)
+
+
+def test_cached_parser_persists_results_between_instances(tmp_path: Path):
+    commits = [
+        make_commit("1", "feat(parser): add a feature\n\nmore details"),
+        make_commit("2", "not a conventional commit"),
+    ]
+    cache_dir = tmp_path / ".semantic_release_cache"
+    first_run = CachedCommitParser(AngularCommitParser(), cache_dir=cache_dir)
+    expected = [first_run.parse(commit) for commit in commits]
+    first_run.save()
+
+    assert (cache_dir / ".gitignore").exists()
+    assert first_run.cache_file.exists()
+
+    second_run = CachedCommitParser(AngularCommitParser(), cache_dir=cache_dir)
+    with mock.patch.object(
+        second_run.parser, "parse", side_effect=AssertionError("should be cached")
+    ):
+        actual = [second_run.parse(commit) for commit in commits]
+
+    assert expected == actual
+    assert isinstance(actual[0], ParsedCommit)
+    assert isinstance(actual[1], ParseError)
+    assert actual[0].commit is commits[0]
+
+
+def test_cached_parser_parse_many(tmp_path: Path):
+    commits = [
+        make_commit("1", "feat: add a feature"),
+        make_commit("2", "fix: a fix"),
+        make_commit("3", "fix: a fix"),
+    ]
+    parser = AngularCommitParser()
+    cached_parser = CachedCommitParser(parser, cache_dir=tmp_path)
+    cached_parser.parse(commits[1])
+
+    with mock.patch.object(
+        parser, "parse_many", side_effect=parser.parse_many
+    ) as mocked_parse_many:
+        results = cached_parser.parse_many(commits)
+
+    # Only the commits which weren't in the cache are parsed
+    mocked_parse_many.assert_called_once_with([commits[0], commits[2]])
+    assert results == [parser.parse(commit) for commit in commits]
+    assert cached_parser.lookup(commits[2]) == results[2]
+
+
+def test_cached_parser_invalidated_by_options(tmp_path: Path):
+    commit = make_commit("1", "perf: make it faster")
+    first_run = CachedCommitParser(AngularCommitParser(), cache_dir=tmp_path)
+    first_run.parse(commit)
+    first_run.save()
+
+    other_options = AngularParserOptions(minor_tags=("feat", "perf"))
+    second_run = CachedCommitParser(
+        AngularCommitParser(other_options), cache_dir=tmp_path
+    )
+
+    assert first_run.cache_file != second_run.cache_file
+    assert second_run.records == {}
+    assert second_run.parse(commit) == AngularCommitParser(other_options).parse(commit)
+
+
+def test_cached_parser_ignores_corrupt_cache(tmp_path: Path):
+    cached_parser = CachedCommitParser(AngularCommitParser(), cache_dir=tmp_path)
+    cached_parser.cache_file.parent.mkdir(parents=True)
+    cached_parser.cache_file.write_text("{not json", encoding="utf-8")
+
+    commit = make_commit("1", "fix: a fix")
+    assert cached_parser.parse(commit) == AngularCommitParser().parse(commit)
+
+
+def test_cached_parser_save_ignores_unwritable_cache_dir(
+    tmp_path: Path, caplog: pytest.LogCaptureFixture
+):
+    # The cache directory can't be created beneath a regular file
+    not_a_dir = tmp_path / "file"
+    not_a_dir.write_text("", encoding="utf-8")
+    cached_parser = CachedCommitParser(
+        AngularCommitParser(), cache_dir=not_a_dir / "cache"
+    )
+    cached_parser.parse(make_commit("1", "fix: a fix"))
+
+    with caplog.at_level(logging.WARNING):
+        cached_parser.save()
+
+    assert "Failed to write commit parser cache" in caplog.text
@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+import threading
+from typing import TYPE_CHECKING
+from unittest import mock
+
+import pytest
+
+from semantic_release.commit_parser import parallel
+from semantic_release.commit_parser.angular import AngularCommitParser
+from semantic_release.commit_parser.cache import CachedCommitParser
+from semantic_release.commit_parser.parallel import parse_commits
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from git import Repo
+
+
+class UnpicklableParser(AngularCommitParser):
+    def __init__(self) -> None:
+        super().__init__()
+        self.lock = threading.Lock()
+
+
+@pytest.fixture
+def one_commit_per_worker():
+    with mock.patch.object(parallel, "MIN_COMMITS_PER_WORKER", 1):
+        yield
+
+
+@pytest.mark.usefixtures(one_commit_per_worker.__name__)
+def test_parallel_parse_matches_serial_parse(repo_with_git_flow_angular_commits: Repo):
+    commits = list(repo_with_git_flow_angular_commits.iter_commits(topo_order=True))
+    parser = AngularCommitParser()
+
+    with mock.patch.object(parallel.log, "warning") as log_warning:
+        results = parse_commits(parser, commits, workers=2)
+
+    log_warning.assert_not_called()
+    assert results == [parser.parse(commit) for commit in commits]
+    assert all(result.commit is commit for result, commit in zip(results, commits))
+
+
+@pytest.mark.usefixtures(one_commit_per_worker.__name__)
+def test_unpicklable_parser_parses_serially(repo_with_git_flow_angular_commits: Repo):
+    commits = list(repo_with_git_flow_angular_commits.iter_commits())
+    parser = UnpicklableParser()
+
+    with mock.patch.object(parallel, "ProcessPoolExecutor") as pool_cls:
+        results = parse_commits(parser, commits, workers=2)
+
+    pool_cls.assert_not_called()
+    assert results == [parser.parse(commit) for commit in commits]
+
+
+def test_short_histories_are_parsed_serially(repo_with_git_flow_angular_commits: Repo):
+    commits = list(repo_with_git_flow_angular_commits.iter_commits())
+    assert len(commits) < 2 * parallel.MIN_COMMITS_PER_WORKER
+
+    with mock.patch.object(parallel, "_parse_in_pool") as parse_in_pool:
+        parse_commits(AngularCommitParser(), commits, workers=0)
+
+    parse_in_pool.assert_not_called()
+
+
+@pytest.mark.usefixtures(one_commit_per_worker.__name__)
+def test_cached_parser_stores_parallel_results(
+    repo_with_git_flow_angular_commits: Repo, tmp_path: Path
+):
+    commits = list(repo_with_git_flow_angular_commits.iter_commits())
+    parser = CachedCommitParser(AngularCommitParser(), cache_dir=tmp_path)
+    expected = parse_commits(parser, commits, workers=2)
+    parser.save()
+
+    second_run = CachedCommitParser(AngularCommitParser(), cache_dir=tmp_path)
+    with mock.patch.object(parallel, "_parse_in_pool") as parse_in_pool:
+        assert parse_commits(second_run, commits, workers=2) == expected
+
+    parse_in_pool.assert_not_called()
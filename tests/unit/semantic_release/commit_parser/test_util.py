@@ -1,6 +1,23 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+from unittest import mock
+
 import pytest
 
-from semantic_release.commit_parser.util import parse_paragraphs
+from semantic_release.commit_parser.angular import AngularCommitParser
+from semantic_release.commit_parser.emoji import EmojiCommitParser
+from semantic_release.commit_parser.scipy import ScipyCommitParser
+from semantic_release.commit_parser.tag import TagCommitParser
+from semantic_release.commit_parser.token import ParsedCommit, ParseError
+from semantic_release.commit_parser.util import parse_paragraphs, parse_unique_messages
+
+if TYPE_CHECKING:
+    from git.objects.commit import Commit
+
+    from semantic_release.commit_parser._base import CommitParser
+
+    from tests.conftest import MakeCommitObjFn
 
 
 @pytest.mark.parametrize(
@@ -24,3 +41,48 @@ from semantic_release.commit_parser.util import parse_paragraphs
 )
 def test_parse_paragraphs(text, expected):
     assert parse_paragraphs(text) == expected
+
+
+def test_parse_unique_messages(make_commit_obj: MakeCommitObjFn):
+    parser = AngularCommitParser()
+    commits = [
+        make_commit_obj("feat: add a feature\n\nmore details"),
+        make_commit_obj("not a conventional commit"),
+        make_commit_obj("feat: add a feature\n\nmore details"),
+        make_commit_obj("not a conventional commit"),
+    ]
+
+    with mock.patch.object(parser, "parse", side_effect=parser.parse) as mocked_parse:
+        results = parse_unique_messages(parser.parse, commits)
+
+    assert mocked_parse.call_count == 2
+    assert results == [parser.parse(commit) for commit in commits]
+    assert all(result.commit is commit for result, commit in zip(results, commits))
+    assert isinstance(results[2], ParsedCommit)
+    assert isinstance(results[3], ParseError)
+    # Each result has its own lists of descriptions
+    assert isinstance(results[0], ParsedCommit)
+    assert results[2].descriptions is not results[0].descriptions
+
+
+@pytest.mark.parametrize(
+    "parser_class",
+    [AngularCommitParser, EmojiCommitParser, ScipyCommitParser, TagCommitParser],
+)
+def test_parse_many_with_overridden_parse(
+    parser_class: type[CommitParser], make_commit_obj: MakeCommitObjFn
+):
+    class CustomParser(parser_class):  # type: ignore[valid-type,misc]
+        def parse(self, commit: Commit):
+            # Depends upon more than the commit message
+            return expected[id(commit)]
+
+    commits = [make_commit_obj("feat: add a feature") for _ in range(3)]
+    expected = {id(commit): parser_class().parse(commit) for commit in commits}
+
+    results = CustomParser().parse_many(commits)
+
+    # Every commit is parsed rather than reusing the result of an equal message
+    assert all(
+        result is expected[id(commit)] for result, commit in zip(results, commits)
+    )
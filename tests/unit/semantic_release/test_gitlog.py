@@ -0,0 +1,178 @@
+from __future__ import annotations
+
+import pickle
+from datetime import datetime, timedelta, timezone
+from typing import TYPE_CHECKING
+from unittest import mock
+
+import pytest
+from git import Actor, Git, TagObject
+
+from semantic_release.gitlog import (
+    CommitRecord,
+    TagRecord,
+    iter_commit_records,
+    iter_tag_refs,
+)
+
+if TYPE_CHECKING:
+    from git import Repo
+
+
+@pytest.mark.parametrize("kwargs", [{}, {"topo_order": True}])
+def test_commit_records_match_gitpython_commits(
+    repo_with_git_flow_angular_commits: Repo, kwargs: dict[str, bool]
+):
+    repo = repo_with_git_flow_angular_commits
+    expected = list(repo.iter_commits("HEAD", **kwargs))
+    actual = list(iter_commit_records(repo, "HEAD", **kwargs))
+
+    assert len(expected) == len(actual)
+    for commit, record in zip(expected, actual):
+        assert commit.hexsha == record.hexsha
+        assert commit.binsha == record.binsha
+        assert commit.message == record.message
+        assert commit.summary == record.summary
+        assert commit.author == record.author
+        assert commit.author.email == record.author.email
+        assert commit.committer == record.committer
+        assert commit.authored_datetime == record.authored_datetime
+        assert commit.committed_datetime == record.committed_datetime
+        assert commit.author_tz_offset == record.author_tz_offset
+        assert commit.committer_tz_offset == record.committer_tz_offset
+        assert list(commit.parents) == list(record.parents)
+        assert commit == record
+
+
+def test_commit_records_for_revision_range(repo_with_git_flow_angular_commits: Repo):
+    repo = repo_with_git_flow_angular_commits
+    first_tag = sorted(repo.tags, key=lambda tag: tag.commit.committed_date)[0]
+
+    expected = [c.hexsha for c in repo.iter_commits(f"{first_tag.name}...")]
+    actual = [c.hexsha for c in iter_commit_records(repo, f"{first_tag.name}...")]
+
+    assert expected == actual
+
+
+def test_commit_records_stops_git_log_when_closed_early(
+    repo_with_git_flow_angular_commits: Repo,
+):
+    processes = []
+    original_execute = Git.execute
+
+    def execute(self: Git, *args, **kwargs):
+        result = original_execute(self, *args, **kwargs)
+        processes.append(result)
+        return result
+
+    with mock.patch.object(Git, "execute", autospec=True, side_effect=execute):
+        records = iter_commit_records(repo_with_git_flow_angular_commits)
+        next(records)
+        records.close()
+
+    # The git log process has been reaped, without waiting for garbage collection
+    [process] = processes
+    assert process.proc.returncode is not None
+    assert process.proc.stdout.closed
+
+
+def test_commit_record_loads_other_attributes_on_demand(
+    repo_with_git_flow_angular_commits: Repo,
+):
+    repo = repo_with_git_flow_angular_commits
+    commit = repo.head.commit
+    record = next(iter_commit_records(repo, "HEAD"))
+
+    assert record._commit is None
+    assert record.tree == commit.tree
+    assert record.stats.total == commit.stats.total
+    assert record._commit == commit
+
+    detached_record = CommitRecord.from_commit(commit)
+    with pytest.raises(AttributeError):
+        detached_record.tree  # noqa: B018
+
+
+def test_commit_record_can_be_pickled(repo_with_git_flow_angular_commits: Repo):
+    record = CommitRecord.from_commit(repo_with_git_flow_angular_commits.head.commit)
+    unpickled = pickle.loads(pickle.dumps(record))  # noqa: S301
+
+    assert unpickled == record
+    assert unpickled.message == record.message
+    assert unpickled.parent_shas == record.parent_shas
+
+
+def test_commit_record_from_log_record():
+    record = CommitRecord.from_log_record(
+        None,  # type: ignore[arg-type]
+        str.join(
+            "\x1f",
+            [
+                "a" * 40,
+                f"{'b' * 40} {'c' * 40}",
+                "Author Name",
+                "author@example.com",
+                "1700000000 +0100",
+                "Committer Name",
+                "committer@example.com",
+                "1700000060 -0230",
+                "feat: message containing \x1f a separator\n\nbody\n",
+            ],
+        ).encode(),
+    )
+
+    assert record.hexsha == "a" * 40
+    assert record.parent_shas == ("b" * 40, "c" * 40)
+    assert record.author == Actor("Author Name", "author@example.com")
+    assert record.authored_date == 1700000000
+    assert record.author_tz_offset == -3600
+    assert record.committed_date == 1700000060
+    assert record.committer_tz_offset == 9000
+    assert record.message == "feat: message containing \x1f a separator\n\nbody\n"
+
+
+def test_iter_tag_refs_filters_by_pattern(repo_with_git_flow_angular_commits: Repo):
+    repo = repo_with_git_flow_angular_commits
+    repo.create_tag("other-package-v1.0.0")
+    repo.create_tag("v9.9.9/nested")
+
+    all_tags = {tag.name for tag in iter_tag_refs(repo)}
+    version_tags = {tag.name for tag in iter_tag_refs(repo, "refs/tags/v*")}
+
+    assert all_tags == {tag.name for tag in repo.tags}
+    assert version_tags == {
+        name for name in all_tags if name.startswith("v") and "/" not in name
+    }
+    assert "other-package-v1.0.0" not in version_tags
+
+
+def test_tag_records_match_gitpython_tags(repo_with_git_flow_angular_commits: Repo):
+    repo = repo_with_git_flow_angular_commits
+    repo.create_tag("lightweight-tag")
+    repo.create_tag("annotated-tag", message="an annotated tag")
+
+    records = {tag.name: tag for tag in iter_tag_refs(repo)}
+    assert records.keys() == {tag.name for tag in repo.tags}
+
+    for tag in repo.tags:
+        record = records[tag.name]
+        assert isinstance(record, TagRecord)
+        assert record.commit == tag.commit
+        assert record.commit.hexsha == tag.commit.hexsha
+
+        if isinstance(tag.object, TagObject):
+            tz = timezone(timedelta(seconds=-1 * tag.object.tagger_tz_offset))
+            assert record.tagger == tag.object.tagger
+            assert record.tagger.email == tag.object.tagger.email
+            assert record.committer == tag.object.tagger.committer()
+            assert record.tagged_date == datetime.fromtimestamp(
+                tag.object.tagged_date, tz=tz
+            )
+        else:
+            tz = timezone(timedelta(seconds=-1 * tag.object.author_tz_offset))
+            assert record.tagger == tag.object.author
+            assert record.tagger.email == tag.object.author.email
+            assert record.committer == tag.object.author
+            assert record.tagged_date == datetime.fromtimestamp(
+                tag.object.committed_date, tz=tz
+            )
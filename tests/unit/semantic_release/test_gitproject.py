@@ -0,0 +1,230 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import TYPE_CHECKING
+from unittest import mock
+
+import pytest
+from git import Actor, Git, GitCommandError, Repo
+
+from semantic_release.errors import (
+    GitAddError,
+    GitCommitEmptyIndexError,
+    GitPushError,
+    GitTagError,
+)
+from semantic_release.gitproject import GitProject
+
+if TYPE_CHECKING:
+    from typing import Generator
+
+
+@pytest.fixture
+def git_repo(tmp_path: Path) -> Generator[Repo, None, None]:
+    repo = Repo.init(tmp_path)
+    (tmp_path / ".gitignore").write_text("ignored.txt\n")
+    for name in ("a.txt", "b.txt", "ignored.txt"):
+        (tmp_path / name).write_text(name)
+    yield repo
+    repo.close()
+
+
+@pytest.fixture
+def project(git_repo: Repo) -> GitProject:
+    return GitProject(
+        git_repo.working_dir,
+        commit_author=Actor("Tester", "tester@example.com"),
+        repo=git_repo,
+    )
+
+
+def staged_paths(repo: Repo) -> set[str]:
+    return {str(path) for path, _ in repo.index.entries}
+
+
+def test_git_add_stages_all_paths_at_once(project: GitProject, git_repo: Repo):
+    with mock.patch.object(
+        Git, "execute", autospec=True, side_effect=Git.execute
+    ) as mocked_execute:
+        project.git_add(["a.txt", "b.txt"])
+
+    assert [call.args[1][1:] for call in mocked_execute.call_args_list] == [
+        ["add", "a.txt", "b.txt"]
+    ]
+    assert staged_paths(git_repo) == {"a.txt", "b.txt"}
+
+
+def test_git_add_names_failed_path_when_strict(project: GitProject):
+    with pytest.raises(GitAddError, match=r"\(ignored\.txt\)"):
+        project.git_add(["a.txt", "ignored.txt", "b.txt"], strict=True)
+
+
+def test_git_add_skips_failed_path_when_not_strict(project: GitProject, git_repo: Repo):
+    project.git_add(["a.txt", "ignored.txt", "b.txt"])
+
+    assert staged_paths(git_repo) == {"a.txt", "b.txt"}
+
+
+def test_git_commit_with_paths_commits_other_staged_changes(
+    project: GitProject, git_repo: Repo
+):
+    with pytest.raises(GitCommitEmptyIndexError):
+        project.git_commit("chore: release", paths=["a.txt"])
+
+    # Changes staged outside of the given paths are still committed
+    project.git_add(["b.txt"])
+    project.git_commit("chore: release", paths=["a.txt"])
+
+    assert git_repo.head.commit.message.strip() == "chore: release"
+    assert set(git_repo.head.commit.stats.files) == {"b.txt"}
+    assert not project._has_staged_changes(git_repo)
+
+
+def test_git_push_pushes_branch_and_tags_together(
+    project: GitProject, git_repo: Repo, tmp_path: Path
+):
+    remote = Repo.init(tmp_path / "remote.git", bare=True)
+    project.git_add(["a.txt"])
+    project.git_commit("chore: release")
+    tags = {f"pkg-{name}-v1.0.0": f"pkg-{name}-v1.0.0" for name in "ab"}
+    project.git_tags(tags)
+
+    project.git_push(
+        remote.working_dir,
+        branch=git_repo.active_branch.name,
+        tags=list(tags),
+    )
+
+    assert remote.heads[git_repo.active_branch.name].commit == git_repo.head.commit
+    assert sorted(tag.name for tag in remote.tags) == sorted(tags)
+    for tag in remote.tags:
+        assert tag.commit == git_repo.head.commit
+
+
+def test_git_push_rejected_branch_pushes_no_tags(
+    project: GitProject, git_repo: Repo, tmp_path: Path
+):
+    remote = Repo.init(tmp_path / "remote.git", bare=True)
+    hook = Path(remote.git_dir, "hooks", "update")
+    hook.write_text('#!/bin/sh\ncase "$1" in refs/heads/*) exit 1 ;; esac\n')
+    hook.chmod(0o755)
+    project.git_add(["a.txt"])
+    project.git_commit("chore: release")
+    project.git_tag("v1.0.0", "v1.0.0")
+
+    with mock.patch.object(
+        Git, "execute", autospec=True, side_effect=Git.execute
+    ) as mocked_execute, pytest.raises(GitPushError):
+        project.git_push(
+            remote.working_dir,
+            branch=git_repo.active_branch.name,
+            tags=["v1.0.0"],
+        )
+
+    # The push isn't retried without --atomic, so the tag isn't pushed either
+    assert len(mocked_execute.call_args_list) == 1
+    assert not remote.heads
+    assert not remote.tags
+
+
+def test_git_tags_creates_all_tags_together(project: GitProject, git_repo: Repo):
+    project.git_add(["a.txt"])
+    project.git_commit("chore: release")
+    project.git_tag("pkg-b-v1.0.0", "pkg-b-v1.0.0")
+
+    tags = {f"pkg-{name}-v1.0.0": f"pkg-{name}-v1.0.0" for name in "abc"}
+
+    # One of the tags already exists, so none of them are created
+    with pytest.raises(GitTagError):
+        project.git_tags(tags)
+    assert [tag.name for tag in git_repo.tags] == ["pkg-b-v1.0.0"]
+
+    git_repo.delete_tag("pkg-b-v1.0.0")
+    project.git_tags(tags)
+
+    assert sorted(tag.name for tag in git_repo.tags) == sorted(tags)
+    for tag in git_repo.tags:
+        assert tag.commit == git_repo.head.commit
+        assert tag.tag is not None
+        assert tag.tag.message == tag.name
+        assert tag.tag.tagger.email == "tester@example.com"
+    # The tag objects are valid
+    git_repo.git.fsck("--strict")
+
+
+@pytest.mark.parametrize("name", ["v1.0.0..", "v1 .0.0", "v1.0.0.lock"])
+def test_git_tags_rejects_invalid_tag_names(
+    project: GitProject, git_repo: Repo, name: str
+):
+    project.git_add(["a.txt"])
+    project.git_commit("chore: release")
+
+    with pytest.raises(GitTagError):
+        project.git_tags({"v0.1.0": "v0.1.0", name: name})
+
+    assert not git_repo.tags
+
+
+@pytest.fixture
+def sign_tags(git_repo: Repo, tmp_path: Path) -> None:
+    # Stands in for gpg, which git only asks for a signature of the tag
+    gpg = tmp_path / "fake-gpg"
+    gpg.write_text(
+        "#!/bin/sh\n"
+        "cat > /dev/null\n"
+        "printf '\\n[GNUPG:] SIG_CREATED \\n' >&2\n"
+        "printf -- '-----BEGIN PGP SIGNATURE-----\\n\\n"
+        "-----END PGP SIGNATURE-----\\n'\n"
+    )
+    gpg.chmod(0o755)
+    with git_repo.config_writer() as config:
+        config.set_value("tag", "gpgSign", "true")
+        config.set_value("gpg", "program", str(gpg))
+
+
+@pytest.mark.usefixtures(sign_tags.__name__)
+def test_git_tags_removes_signed_tags_on_failure(project: GitProject, git_repo: Repo):
+    project.git_add(["a.txt"])
+    project.git_commit("chore: release")
+    project.git_tag("pkg-b-v1.0.0", "pkg-b-v1.0.0")
+
+    tags = {f"pkg-{name}-v1.0.0": f"pkg-{name}-v1.0.0" for name in "abc"}
+
+    # pkg-a-v1.0.0 is created before pkg-b-v1.0.0 fails, and is then removed
+    with pytest.raises(GitTagError):
+        project.git_tags(tags)
+    assert [tag.name for tag in git_repo.tags] == ["pkg-b-v1.0.0"]
+
+    git_repo.delete_tag("pkg-b-v1.0.0")
+    project.git_tags(tags)
+
+    assert sorted(tag.name for tag in git_repo.tags) == sorted(tags)
+    for tag in git_repo.tags:
+        assert tag.commit == git_repo.head.commit
+        assert tag.tag is not None
+        assert "BEGIN PGP SIGNATURE" in tag.tag.message
+
+
+@pytest.mark.usefixtures(sign_tags.__name__)
+def test_git_tags_raises_tag_error_when_removing_signed_tags_fails(
+    project: GitProject, caplog: pytest.LogCaptureFixture
+):
+    project.git_add(["a.txt"])
+    project.git_commit("chore: release")
+    project.git_tag("pkg-b-v1.0.0", "pkg-b-v1.0.0")
+    original_execute = Git.execute
+
+    def execute(self: Git, command, *args, **kwargs):
+        if command[1:3] == ["tag", "-d"]:
+            raise GitCommandError(command, 1, "can't delete the tags")
+        return original_execute(self, command, *args, **kwargs)
+
+    with mock.patch.object(
+        Git, "execute", autospec=True, side_effect=execute
+    ), pytest.raises(GitTagError) as excinfo:
+        project.git_tags({"pkg-a-v1.0.0": "a", "pkg-b-v1.0.0": "b"})
+
+    # The error is still the one from creating the tags
+    assert isinstance(excinfo.value.__cause__, GitCommandError)
+    assert "already exists" in str(excinfo.value.__cause__.stderr)
+    assert "Failed to delete tags (pkg-a-v1.0.0)" in caplog.text
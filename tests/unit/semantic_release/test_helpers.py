@@ -1,6 +1,16 @@
+import os
+import stat
+from pathlib import Path
+from unittest import mock
+
 import pytest
 
-from semantic_release.helpers import ParsedGitUrl, parse_git_url
+from semantic_release.helpers import (
+    JsonCacheFile,
+    ParsedGitUrl,
+    parse_git_url,
+    write_chunks_atomic,
+)
 
 
 @pytest.mark.parametrize(
@@ -131,3 +141,90 @@ def test_parse_invalid_git_urls(url: str):
     """Test that an invalid git remote url throws a ValueError."""
     with pytest.raises(ValueError):
         parse_git_url(url)
+
+
+def test_write_chunks_atomic_keeps_file_mode(tmp_path: Path):
+    existing_file = tmp_path / "CHANGELOG.md"
+    existing_file.write_text("old", encoding="utf-8")
+    existing_file.chmod(0o640)
+
+    write_chunks_atomic(existing_file, iter(["# CHANGELOG", "\n"]))
+
+    assert existing_file.read_text(encoding="utf-8") == "# CHANGELOG\n"
+    assert stat.S_IMODE(existing_file.stat().st_mode) == 0o640
+
+
+def test_write_chunks_atomic_new_file_mode_follows_umask(tmp_path: Path):
+    new_file = tmp_path / "CHANGELOG.md"
+    umask = os.umask(0o027)
+    try:
+        # The umask is process wide, so it mustn't be changed while writing
+        with mock.patch.object(os, "umask", side_effect=AssertionError):
+            write_chunks_atomic(new_file, iter(["# CHANGELOG\n"]))
+    finally:
+        os.umask(umask)
+
+    assert new_file.read_text(encoding="utf-8") == "# CHANGELOG\n"
+    if os.name != "nt":
+        assert stat.S_IMODE(new_file.stat().st_mode) == 0o640
+
+
+def test_write_chunks_atomic_skips_unchanged_file(tmp_path: Path):
+    existing_file = tmp_path / "CHANGELOG.md"
+    existing_file.write_bytes(b"# CHANGELOG\r\n")
+    os.utime(existing_file, ns=(0, 0))
+
+    assert not write_chunks_atomic(
+        existing_file, iter(["# CHANGELOG\r\n"]), newline="", skip_unchanged=True
+    )
+    assert existing_file.stat().st_mtime_ns == 0
+    assert os.listdir(tmp_path) == ["CHANGELOG.md"]
+
+    assert write_chunks_atomic(
+        existing_file, iter(["# CHANGELOG\n"]), newline="", skip_unchanged=True
+    )
+    assert existing_file.read_bytes() == b"# CHANGELOG\n"
+
+
+def test_write_chunks_atomic_keeps_file_on_error(tmp_path: Path):
+    existing_file = tmp_path / "CHANGELOG.md"
+    existing_file.write_text("old", encoding="utf-8")
+
+    def chunks():
+        yield "new"
+        raise RuntimeError("template error")
+
+    with pytest.raises(RuntimeError):
+        write_chunks_atomic(existing_file, chunks())
+
+    assert existing_file.read_text(encoding="utf-8") == "old"
+    assert os.listdir(tmp_path) == ["CHANGELOG.md"]
+
+
+def test_json_cache_file_merges_concurrent_writes(tmp_path: Path):
+    cache_dir = tmp_path / "cache"
+    path = cache_dir / "test" / "cache.json"
+    first = JsonCacheFile(cache_dir, path, 1, "test cache")
+    second = JsonCacheFile(cache_dir, path, 1, "test cache")
+    assert first.entries == second.entries == {}
+
+    first.add("a", 1)
+    first.save()
+    second.add("b", 2)
+    second.save()
+
+    assert (cache_dir / "CACHEDIR.TAG").exists()
+    assert JsonCacheFile(cache_dir, path, 1, "test cache").entries == {"a": 1, "b": 2}
+    # Files of another version are ignored
+    assert JsonCacheFile(cache_dir, path, 2, "test cache").entries == {}
+
+
+def test_json_cache_file_ignores_write_errors(tmp_path: Path):
+    not_a_dir = tmp_path / "file"
+    not_a_dir.write_text("")
+    cache = JsonCacheFile(not_a_dir, not_a_dir / "cache.json", 1, "test cache")
+    cache.add("a", 1)
+
+    cache.save()
+
+    assert cache.entries == {"a": 1}
@@ -1,8 +1,16 @@
+import gc
+import logging
+from unittest import mock
+
 import pytest
-from git import Commit, Repo, TagReference
+from git import Actor, Commit, Repo, TagReference
 
-from semantic_release.enums import LevelBump
+from semantic_release.commit_parser.angular import AngularCommitParser
+from semantic_release.enums import HistoryBackend, LevelBump
+from semantic_release.gitlog import CommitRecord, iter_tag_refs
+from semantic_release.version import algorithm
 from semantic_release.version.algorithm import (
+    HistorySnapshot,
     _bfs_for_latest_version_in_history,
     _increment_version,
     tags_and_versions,
@@ -73,6 +81,85 @@ def test_bfs_for_latest_version_in_history():
     assert expected_version == actual
 
 
+def _commit(repo: Repo, message: str, *parents: Commit) -> Commit:
+    author = Actor("Tester", "tester@example.com")
+    return repo.index.commit(
+        message,
+        parent_commits=list(parents),
+        head=False,
+        author=author,
+        committer=author,
+    )
+
+
+def _latest_version_in_history(repo: Repo, start_commit: Commit):
+    snapshot = HistorySnapshot(repo, VersionTranslator(), AngularCommitParser())
+    full_releases = snapshot.version_table.full_releases()
+    return (
+        algorithm._describe_latest_version_in_history(
+            snapshot, start_commit, full_releases
+        ),
+        algorithm._latest_version_in_history(snapshot, start_commit, full_releases),
+        _bfs_for_latest_version_in_history(start_commit, full_releases),
+    )
+
+
+def test_describe_latest_version_in_linear_history(tmp_path):
+    """
+    * commit 3 (start)
+    * v1.1.0-rc.1
+    * v1.0.0
+    * v0.1.0
+    """
+    repo = Repo.init(tmp_path)
+    v0_1_0 = _commit(repo, "initial commit")
+    v1_0_0 = _commit(repo, "commit 1", v0_1_0)
+    v1_1_0_rc_1 = _commit(repo, "commit 2", v1_0_0)
+    start_commit = _commit(repo, "commit 3", v1_1_0_rc_1)
+    repo.create_tag("v0.1.0", ref=v0_1_0)
+    repo.create_tag("v1.0.0", ref=v1_0_0)
+    repo.create_tag("v1.1.0-rc.1", ref=v1_1_0_rc_1)
+
+    described, latest, bfs = _latest_version_in_history(repo, start_commit)
+
+    assert described == latest == bfs == Version.parse("1.0.0")
+
+
+def test_describe_latest_version_defers_to_bfs_after_merges(tmp_path):
+    """
+    * merge commit (start)
+    |\
+    | * v2.0.0
+    | * commit 4
+    | * commit 3
+    | * commit 2
+    | * commit 1
+    * | v1.0.0
+    |/
+    * initial commit
+
+    git describe picks v2.0.0, as fewer commits aren't contained in it, but the
+    nearest release by the breadth-first search is v1.0.0
+    """
+    repo = Repo.init(tmp_path)
+    root = _commit(repo, "initial commit")
+    v1_0_0 = _commit(repo, "feat: v1", root)
+    branch = root
+    for i in range(1, 5):
+        branch = _commit(repo, f"commit {i}", branch)
+    v2_0_0 = _commit(repo, "feat!: v2", branch)
+    start_commit = _commit(repo, "merge commit", v1_0_0, v2_0_0)
+    repo.create_tag("v1.0.0", ref=v1_0_0)
+    repo.create_tag("v2.0.0", ref=v2_0_0)
+
+    assert repo.git.describe(start_commit.hexsha, "--tags", "--abbrev=0") == "v2.0.0"
+
+    described, latest, bfs = _latest_version_in_history(repo, start_commit)
+
+    assert described is None
+    assert latest == bfs == Version.parse("1.0.0")
+
+
 @pytest.mark.parametrize(
     "tags, sorted_tags",
     [
@@ -187,6 +274,84 @@ def test_tags_and_versions_ignores_invalid_tags_as_versions(
     assert set(actual) == set(valid_tags)
 
 
+def test_tags_and_versions_summarises_unparseable_tags(
+    caplog: pytest.LogCaptureFixture,
+):
+    repo = Repo()
+    translator = VersionTranslator()
+    tagrefs = [repo.tag(tag) for tag in ("v1.0.0", "v1.1", "v1.2", "vnext")]
+
+    with caplog.at_level(logging.WARNING):
+        actual = [t.name for t, _ in tags_and_versions(tagrefs, translator)]
+
+    assert actual == ["v1.0.0"]
+    warnings = [r for r in caplog.records if r.levelno == logging.WARNING]
+    assert len(warnings) == 1
+    assert "3 tags" in warnings[0].getMessage()
+
+
+def test_history_snapshot_reuses_tags_commits_and_parse_results(tmp_path):
+    repo = Repo.init(tmp_path)
+    first_commit = _commit(repo, "feat: first")
+    commits = [_commit(repo, "fix: second", first_commit), first_commit]
+    repo.head.reference = repo.create_head("main", commits[0])
+    tags = [repo.create_tag(tag, ref=first_commit) for tag in ("v1.0.0", "v1.1.0")]
+    parser = mock.Mock(spec=AngularCommitParser)
+    parser.parse.side_effect = lambda commit: f"parsed {commit.hexsha}"
+
+    with mock.patch.object(
+        algorithm, iter_tag_refs.__name__, return_value=iter(tags)
+    ) as mock_tags:
+        snapshot = HistorySnapshot(repo, VersionTranslator(), parser)
+
+        assert snapshot.tags_and_versions is snapshot.tags_and_versions
+        assert [t.name for t, _ in snapshot.tags_and_versions] == ["v1.1.0", "v1.0.0"]
+        mock_tags.assert_called_once_with(repo, "refs/tags/v*")
+
+    first_walk = list(snapshot.iter_commits("HEAD", topo_order=True))
+    # The data of the commits isn't read again
+    with mock.patch.object(
+        type(repo.odb), "stream", side_effect=AssertionError("read again")
+    ):
+        second_walk = list(snapshot.iter_commits("HEAD"))
+        assert [(c.hexsha, c.message, c.author, c.parents) for c in second_walk] == [
+            (c.hexsha, c.message, c.author, c.parents) for c in first_walk
+        ]
+    assert first_walk == commits
+
+    for commit in (*first_walk, *second_walk):
+        assert snapshot.parse(commit) == f"parsed {commit.hexsha}"
+
+    assert parser.parse.call_count == len(commits)
+    repo.close()
+
+
+@pytest.mark.parametrize("backend", list(HistoryBackend))
+def test_history_snapshot_does_not_keep_commits(tmp_path, backend: HistoryBackend):
+    repo = Repo.init(tmp_path)
+    commit = _commit(repo, "feat: first")
+    for i in range(5):
+        commit = _commit(repo, f"fix: change {i}", commit)
+    repo.head.reference = repo.create_head("main", commit)
+    snapshot = HistorySnapshot(
+        repo, VersionTranslator(), AngularCommitParser(), backend=backend
+    )
+
+    for _ in range(2):
+        for commit in snapshot.iter_commits("HEAD"):
+            snapshot.parse(commit)
+    del commit
+    gc.collect()
+
+    assert len(snapshot._commits) == 6
+    assert all(isinstance(c, CommitRecord) for c in snapshot._commits.values())
+    # No GitPython commit of the repository outlives the walks
+    assert not [
+        obj for obj in gc.get_objects() if isinstance(obj, Commit) and obj.repo is repo
+    ]
+    repo.close()
+
+
 @pytest.mark.parametrize(
     "latest_version, latest_full_version, latest_full_version_in_history, level_bump, "
     "prerelease, prerelease_token, expected_version",
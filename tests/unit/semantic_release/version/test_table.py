@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+import random
+
+import pytest
+
+from semantic_release.version.algorithm import tags_and_versions
+from semantic_release.version.table import VersionTable
+from semantic_release.version.translator import VersionTranslator
+
+VERSION_TAGS = [
+    "v0.1.0",
+    "v1.0.0-rc.1",
+    "v1.0.0",
+    "v1.1.0-alpha.1",
+    "v1.1.0-beta.1",
+    "v1.1.0-beta.2",
+    "v1.1.0-rc.1",
+    "v1.1.0",
+    "v1.1.1",
+    "v2.0.0-rc.1",
+    "v2.0.0-rc.2",
+    "v2.0.0-beta.3",
+    "v3.0.0-rc.1",
+]
+
+
+class _Tag:
+    def __init__(self, name: str) -> None:
+        self.name = name
+
+
+@pytest.fixture
+def version_table() -> VersionTable:
+    tags = [_Tag(name) for name in VERSION_TAGS]
+    random.Random(0).shuffle(tags)
+    return VersionTable(tags_and_versions(tags, VersionTranslator()))  # type: ignore[arg-type]
+
+
+def _tag_name(t_v):
+    return None if t_v is None else t_v[0].name
+
+
+def test_version_table_latest(version_table: VersionTable):
+    assert len(version_table) == len(VERSION_TAGS)
+    assert _tag_name(version_table.latest()) == "v3.0.0-rc.1"
+    assert _tag_name(version_table.latest_full_release()) == "v1.1.1"
+    assert [tag.name for tag, _ in version_table.full_releases()] == [
+        "v1.1.1",
+        "v1.1.0",
+        "v1.0.0",
+        "v0.1.0",
+    ]
+
+
+@pytest.mark.parametrize(
+    "release, prerelease_token, expected_tag",
+    [
+        ((1, 1, 0), "beta", "v1.1.0-beta.2"),
+        ((1, 1, 0), "alpha", "v1.1.0-alpha.1"),
+        ((1, 1, 0), "rc", "v1.1.0-rc.1"),
+        ((2, 0, 0), "rc", "v2.0.0-rc.2"),
+        ((2, 0, 0), "beta", "v2.0.0-beta.3"),
+        ((1, 1, 1), "rc", None),
+        ((4, 0, 0), "rc", None),
+        ((1, 1, 0), "dev", None),
+    ],
+)
+def test_version_table_latest_prerelease(
+    version_table: VersionTable, release, prerelease_token, expected_tag
+):
+    assert (
+        _tag_name(version_table.latest_prerelease(*release, prerelease_token))
+        == expected_tag
+    )
+
+
+@pytest.mark.parametrize(
+    "major, include_prereleases, expected_tag",
+    [
+        (0, False, "v0.1.0"),
+        (1, False, "v1.1.1"),
+        (1, True, "v1.1.1"),
+        (2, False, None),
+        (2, True, "v2.0.0-rc.2"),
+        (3, True, "v3.0.0-rc.1"),
+        (4, True, None),
+    ],
+)
+def test_version_table_latest_in_major_version(
+    version_table: VersionTable, major, include_prereleases, expected_tag
+):
+    assert (
+        _tag_name(version_table.latest_in_major_version(major, include_prereleases))
+        == expected_tag
+    )
+
+
+def test_version_table_empty():
+    version_table = VersionTable([])
+    assert len(version_table) == 0
+    assert version_table.latest() is None
+    assert version_table.latest_full_release() is None
+    assert version_table.full_releases() == []
+    assert version_table.latest_prerelease(1, 0, 0, "rc") is None
+    assert version_table.latest_in_major_version(1) is None
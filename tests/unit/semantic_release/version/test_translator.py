@@ -1,3 +1,5 @@
+from fnmatch import fnmatch
+
 import pytest
 
 from semantic_release.const import SEMVER_REGEX
@@ -95,3 +97,35 @@ def test_translator_converts_versions_with_default_formatting_rules(
         str(translator.from_tag(translator.str_to_tag(version_string)))
         == version_string
     )
+
+
+@pytest.mark.parametrize(
+    "tag_format, expected_glob",
+    [
+        ("v{version}", "v*"),
+        ("{version}", "*"),
+        ("release/v{version}", "release/v*"),
+        ("v{version}-final", "v*"),
+        (r"(\w+--)?v{version}", "*"),
+        ("v.{version}", "v*"),
+    ],
+)
+def test_translator_tag_glob(tag_format: str, expected_glob: str):
+    translator = VersionTranslator(tag_format=tag_format)
+    assert expected_glob == translator.tag_glob
+    assert fnmatch(translator.str_to_tag("1.2.3"), translator.tag_glob)
+
+
+@pytest.mark.parametrize(
+    "tag_format, expected_pattern",
+    [
+        ("v{version}", "refs/tags/v*"),
+        ("mypkg-v{version}-final", "refs/tags/mypkg-v*"),
+        ("release/v{version}", "refs/tags/release/v*"),
+        ("v{version}/final", "refs/tags/"),
+        (r"(\w+--)?v{version}", "refs/tags/"),
+        (r"mypkg/(?P<env>dev|prod)-v{version}", "refs/tags/mypkg/"),
+    ],
+)
+def test_translator_tag_ref_pattern(tag_format: str, expected_pattern: str):
+    assert expected_pattern == VersionTranslator(tag_format=tag_format).tag_ref_pattern
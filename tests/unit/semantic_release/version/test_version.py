@@ -329,3 +329,45 @@ def test_prerelease_always_less_than_full(major, minor, patch, prerelease_revisi
     full = Version(major, minor, patch)
     pre = Version(major, minor, patch, prerelease_revision=prerelease_revision)
     assert pre < full
+
+
+@pytest.mark.parametrize(
+    "lower_version, upper_version",
+    [
+        ("1.0.0", "1.0.1"),
+        ("1.0.0-rc.1", "1.0.0"),
+        ("1.0.0-alpha.2", "1.0.0-beta.1"),
+        ("1.0.0-rc.2", "1.0.0-rc.10"),
+        ("1.0.0-beta.1", "1.0.0-beta.x.1"),
+        ("1.9.0", "1.10.0"),
+    ],
+)
+def test_version_sort_key_orders_like_comparisons(lower_version, upper_version):
+    left = Version.parse(lower_version)
+    right = Version.parse(upper_version)
+    assert left < right
+    assert left.sort_key < right.sort_key
+    assert sorted([right, left], key=lambda v: v.sort_key) == [left, right]
+
+
+def test_version_keys_updated_after_mutation():
+    version = Version.parse("1.2.3-rc.1")
+    hash_before, key_before = hash(version), version.sort_key
+
+    version.prerelease_revision = 2
+    version.build_metadata = "build.1"
+
+    assert version == Version.parse("1.2.3-rc.2")
+    assert version.sort_key > key_before
+    assert hash(version) != hash_before
+    assert hash(version) == hash(Version.parse("1.2.3-rc.2+build.1"))
+
+
+def test_version_parse_returns_new_instances():
+    first = Version.parse("1.2.3-beta.4+build.5")
+    second = Version.parse("1.2.3-beta.4+build.5")
+
+    assert first == second
+    assert first is not second
+    first.major = 2
+    assert second.major == 1